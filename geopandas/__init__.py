@@ -1,10 +1,12 @@
+from geopandas._config import options
+
 from geopandas.geoseries import GeoSeries
 from geopandas.geodataframe import GeoDataFrame
-from geopandas.array import _points_from_xy as points_from_xy
+from geopandas.array import points_from_xy
 
 from geopandas.io.file import read_file
 from geopandas.io.sql import read_postgis
-from geopandas.tools import sjoin
+from geopandas.tools import sjoin, sjoin_nearest
 from geopandas.tools import overlay
 
 import geopandas.datasets
@@ -0,0 +1,151 @@
+"""
+Lightweight options machinery.
+
+The options are held in an attribute-style object, ``geopandas.options``,
+which validates the values that are set and gives an overview of the
+available options with their documentation in its repr.
+"""
+from collections import namedtuple
+import numbers
+import os
+import textwrap
+
+
+Option = namedtuple('Option', 'key default_value doc validator callback')
+
+
+class Options(object):
+    """Provide attribute-style access to configuration dict."""
+
+    def __init__(self, options):
+        object.__setattr__(self, '_options', options)
+        # populate with default values
+        config = dict((key, option.default_value)
+                      for key, option in options.items())
+        object.__setattr__(self, '_config', config)
+
+    def __setattr__(self, key, value):
+        # you can't set new keys
+        if key in self._config:
+            option = self._options[key]
+            if option.validator:
+                option.validator(value)
+            self._config[key] = value
+            if option.callback:
+                option.callback(key, value)
+        else:
+            msg = "You can only set the value of existing options"
+            raise AttributeError(msg)
+
+    def __getattr__(self, key):
+        try:
+            return self._config[key]
+        except KeyError:
+            raise AttributeError("No such option")
+
+    def __dir__(self):
+        return list(self._config.keys())
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        description = ""
+        for key, option in sorted(self._options.items()):
+            descr = u"{key}: {cur!r} [default: {default!r}]\n".format(
+                key=key, cur=self._config[key],
+                default=option.default_value)
+            description += descr
+
+            if option.doc:
+                doc_lines = textwrap.wrap(option.doc, width=70)
+            else:
+                doc_lines = [u"No description available."]
+            description += u"".join(
+                u"    {0}\n".format(line) for line in doc_lines)
+        space = "\n  "
+        description = description.replace("\n", space)
+        return "{}({}{})".format(cls, space, description)
+
+
+def _validate_n_jobs(value):
+    if (isinstance(value, bool) or not isinstance(value, numbers.Integral)
+            or value == 0):
+        raise ValueError(
+            "n_jobs should be a non-zero integer, got {0!r}".format(value))
+
+
+n_jobs = Option(
+    key='n_jobs',
+    default_value=1,
+    doc=(
+        "The number of threads used for element-wise geometry operations "
+        "(predicates, set operations, buffer, ...) on a GeometryArray. "
+        "The array is split in chunks of consecutive elements that are "
+        "processed in parallel (GEOS releases the GIL). -1 means using all "
+        "CPUs."),
+    validator=_validate_n_jobs,
+    callback=None)
+
+
+def _validate_engine(value):
+    if value not in ('geos', 'numpy'):
+        raise ValueError(
+            "engine should be one of 'geos', 'numpy', got {0!r}".format(
+                value))
+
+
+engine = Option(
+    key='engine',
+    default_value='geos',
+    doc=(
+        "The implementation of the planar metrics (area, length, centroid) "
+        "for arrays backed by coordinate buffers: 'geos' calls GEOS for "
+        "each geometry, 'numpy' computes them for all geometries at once "
+        "from the coordinates (GEOS is still used for the degenerate cases "
+        "and for arrays of Shapely objects)."),
+    validator=_validate_engine,
+    callback=None)
+
+
+def _validate_sindex_backend(value):
+    if value not in ('rtree', 'strtree'):
+        raise ValueError(
+            "sindex_backend should be one of 'rtree', 'strtree', got "
+            "{0!r}".format(value))
+
+
+sindex_backend = Option(
+    key='sindex_backend',
+    default_value='rtree',
+    doc=(
+        "The implementation of the spatial index (``sindex``) of a "
+        "GeoSeries or GeoDataFrame: 'rtree' builds an rtree (libspatialindex)"
+        " index, 'strtree' a packed, read-only Sort-Tile-Recursive tree "
+        "that is bulk loaded from the bounds with numpy (no optional "
+        "dependency). The option is read when the index is built."),
+    validator=_validate_sindex_backend,
+    callback=None)
+
+
+def _validate_sindex_cache_dir(value):
+    if value is not None and not os.path.isdir(value):
+        raise ValueError(
+            "sindex_cache_dir should be None or an existing directory, got "
+            "{0!r}".format(value))
+
+
+sindex_cache_dir = Option(
+    key='sindex_cache_dir',
+    default_value=None,
+    doc=(
+        "A directory in which the 'strtree' spatial indexes are saved when "
+        "they are built, in files named by a hash of the bounds of the "
+        "geometries. An index of geometries with the same bounds is then "
+        "memory-mapped from its file instead of being built again, e.g. in "
+        "another process. The files are not removed by geopandas."),
+    validator=_validate_sindex_cache_dir,
+    callback=None)
+
+
+options = Options({'n_jobs': n_jobs, 'engine': engine,
+                   'sindex_backend': sindex_backend,
+                   'sindex_cache_dir': sindex_cache_dir})
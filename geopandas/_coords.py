@@ -0,0 +1,1004 @@
+"""
+Columnar coordinate storage for geometries.
+
+Instead of holding one Shapely object per element, the geometries are
+stored as a single contiguous float64 coordinate buffer together with
+three levels of offsets, following the nesting of the simple feature
+types:
+
+- ``geom_offsets`` : for every geometry, the range of parts it consists of
+  (the sub-geometries of a Multi-geometry, or a single part otherwise);
+- ``part_offsets`` : for every part, the range of rings (a Polygon has an
+  exterior ring followed by its interior rings, other types a single one);
+- ``ring_offsets`` : for every ring, the range of rows in ``coords``.
+
+A Point is thus stored as one part with one ring of a single coordinate,
+a LineString as one part with one ring, and a MultiPolygon as a number of
+parts each with one or more rings. Missing values and empty geometries have
+no parts. GeometryCollections (other than empty ones) cannot be represented.
+
+The coordinates can also be held with a reduced precision (float32, or int32
+positions on a grid) by ``QuantizedBuffers``.
+"""
+import warnings
+
+import numpy as np
+
+import shapely.geometry
+
+
+GEOMETRY_TYPES = [
+    'Point',
+    'LineString',
+    'LinearRing',
+    'Polygon',
+    'MultiPoint',
+    'MultiLineString',
+    'MultiPolygon',
+    'GeometryCollection',
+]
+
+POINT = 0
+LINESTRING = 1
+LINEARRING = 2
+POLYGON = 3
+MULTIPOINT = 4
+MULTILINESTRING = 5
+MULTIPOLYGON = 6
+GEOMETRYCOLLECTION = 7
+
+# type code used for missing values (None)
+MISSING = 255
+
+# Estimated memory (in bytes) behind a Shapely geometry: the Python object
+# with its attribute dict, every GEOS geometry it consists of (including the
+# parts and rings, each with an envelope and a coordinate sequence), and every
+# coordinate (GEOS always stores 3 doubles).
+SHAPELY_OBJECT_NBYTES = 212
+GEOS_GEOMETRY_NBYTES = 120
+GEOS_COORDINATE_NBYTES = 24
+
+_TYPE_CODES = dict((name, code) for code, name in enumerate(GEOMETRY_TYPES))
+
+_GEOMETRY_CLASSES = [
+    shapely.geometry.Point,
+    shapely.geometry.LineString,
+    shapely.geometry.LinearRing,
+    shapely.geometry.Polygon,
+    shapely.geometry.MultiPoint,
+    shapely.geometry.MultiLineString,
+    shapely.geometry.MultiPolygon,
+    shapely.geometry.GeometryCollection,
+]
+
+
+def geometry_type_code(geom):
+    """
+    Return the integer type code of a single geometry (or None).
+
+    Empty geometries are reported by GEOS as 'GeometryCollection', so for
+    those the code is derived from the Python class instead.
+    """
+    if geom is None:
+        return MISSING
+    if geom.is_empty:
+        return _TYPE_CODES.get(type(geom).__name__, GEOMETRYCOLLECTION)
+    return _TYPE_CODES[geom.geom_type]
+
+
+def geometry_type_codes(geoms):
+    """
+    Return the type codes of a sequence of geometries (or None) as an
+    uint8 array.
+
+    The code is looked up from the class of the geometries where possible,
+    avoiding a call into GEOS for every geometry.
+    """
+    codes = np.empty(len(geoms), dtype=np.uint8)
+    for i, geom in enumerate(geoms):
+        if geom is None:
+            codes[i] = MISSING
+        else:
+            code = _TYPE_CODES.get(type(geom).__name__)
+            codes[i] = code if code is not None else geometry_type_code(geom)
+    return codes
+
+
+def _geos_counts(geom):
+    if geom.is_empty:
+        return 0, 1
+    geom_type = geom.geom_type
+    if geom_type in ('Point', 'LineString', 'LinearRing'):
+        return len(geom.coords), 1
+    elif geom_type == 'Polygon':
+        rings = [geom.exterior] + list(geom.interiors)
+        return sum(len(ring.coords) for ring in rings), 1 + len(rings)
+    counts = [_geos_counts(part) for part in geom.geoms]
+    return (sum(n_coords for n_coords, _ in counts),
+            1 + sum(n_geoms for _, n_geoms in counts))
+
+
+def geos_counts(geoms):
+    """
+    Return a (N, 2) int64 array with the number of coordinates and the
+    number of GEOS geometries (including the parts and rings) of each of a
+    sequence of geometries (or None).
+    """
+    counts = np.zeros((len(geoms), 2), dtype=np.int64)
+    for i, geom in enumerate(geoms):
+        if geom is not None:
+            counts[i] = _geos_counts(geom)
+    return counts
+
+
+def _ring_coords(geom):
+    coords = np.asarray(geom.coords, dtype='float64')
+    if coords.ndim != 2:
+        coords = coords.reshape(0, 2)
+    return coords
+
+
+def _polygon_rings(polygon):
+    return [_ring_coords(polygon.exterior)] + [
+        _ring_coords(interior) for interior in polygon.interiors]
+
+
+class CoordinateBuffers(object):
+    """
+    Geometries stored as flat coordinate and offset arrays.
+
+    Use :meth:`from_shapely` to construct the buffers from Shapely objects,
+    and :meth:`get` or :meth:`to_shapely` to materialize them again.
+
+    Attributes
+    ----------
+    coords : ndarray of shape (n_coords, 2) or (n_coords, 3)
+        All coordinates. When some of the geometries are 3D, the z values
+        of the 2D geometries are NaN.
+    ring_offsets, part_offsets, geom_offsets : ndarray of int64
+        Offsets into ``coords``, the rings and the parts (see module
+        docstring).
+    type_codes : ndarray of uint8
+        Geometry type code of each geometry (index into ``GEOMETRY_TYPES``,
+        or ``MISSING``).
+    has_z : ndarray of bool
+        Whether each geometry has a z-component.
+    """
+
+    def __init__(self, coords, ring_offsets, part_offsets, geom_offsets,
+                 type_codes, has_z):
+        self.coords = coords
+        self.ring_offsets = ring_offsets
+        self.part_offsets = part_offsets
+        self.geom_offsets = geom_offsets
+        self.type_codes = type_codes
+        self.has_z = has_z
+
+    @classmethod
+    def from_shapely(cls, geoms):
+        """
+        Encode a sequence of Shapely geometries (or None) into buffers.
+        """
+        n = len(geoms)
+        type_codes = np.empty(n, dtype=np.uint8)
+        has_z = np.zeros(n, dtype=bool)
+        parts_per_geom = np.zeros(n, dtype=np.int64)
+        rings_per_part = []
+        rings = []
+
+        for i in range(n):
+            geom = geoms[i]
+            code = geometry_type_code(geom)
+            type_codes[i] = code
+            if code == MISSING or geom.is_empty:
+                continue
+            has_z[i] = geom.has_z
+            if code in (POINT, LINESTRING, LINEARRING):
+                parts_per_geom[i] = 1
+                rings_per_part.append(1)
+                rings.append(_ring_coords(geom))
+            elif code == POLYGON:
+                parts_per_geom[i] = 1
+                polygon_rings = _polygon_rings(geom)
+                rings_per_part.append(len(polygon_rings))
+                rings.extend(polygon_rings)
+            elif code in (MULTIPOINT, MULTILINESTRING):
+                parts = geom.geoms
+                parts_per_geom[i] = len(parts)
+                rings_per_part.extend([1] * len(parts))
+                rings.extend(_ring_coords(part) for part in parts)
+            elif code == MULTIPOLYGON:
+                parts = geom.geoms
+                parts_per_geom[i] = len(parts)
+                for part in parts:
+                    polygon_rings = _polygon_rings(part)
+                    rings_per_part.append(len(polygon_rings))
+                    rings.extend(polygon_rings)
+            else:
+                raise ValueError(
+                    "GeometryCollections cannot be stored in coordinate "
+                    "buffers (element {0}).".format(i))
+
+        ndim = 3 if has_z.any() else 2
+        if ndim == 3:
+            rings = [_pad_z(ring) for ring in rings]
+        if rings:
+            coords = np.concatenate(rings)
+        else:
+            coords = np.empty((0, ndim), dtype='float64')
+
+        ring_offsets = _offsets([len(ring) for ring in rings])
+        part_offsets = _offsets(rings_per_part)
+        geom_offsets = _offsets(parts_per_geom)
+        return cls(coords, ring_offsets, part_offsets, geom_offsets,
+                   type_codes, has_z)
+
+    @classmethod
+    def from_xy(cls, xy, missing):
+        """
+        Encode points from a (N, 2) array of coordinates, with rows of NaN
+        for empty points and ``missing`` a boolean mask of missing values.
+        """
+        valid = ~np.isnan(xy[:, 0]) & ~missing
+        coords = xy[valid]
+        offsets = np.arange(len(coords) + 1, dtype=np.int64)
+        type_codes = np.where(missing, MISSING, POINT).astype(np.uint8)
+        return cls(coords, offsets, offsets.copy(), _offsets(valid),
+                   type_codes, np.zeros(len(xy), dtype=bool))
+
+    def __len__(self):
+        return len(self.type_codes)
+
+    @property
+    def ndim(self):
+        """Number of coordinate dimensions stored in the buffer (2 or 3)."""
+        return self.coords.shape[1]
+
+    @property
+    def nbytes(self):
+        """Total number of bytes of all buffers."""
+        return (self.coords.nbytes + self.ring_offsets.nbytes
+                + self.part_offsets.nbytes + self.geom_offsets.nbytes
+                + self.type_codes.nbytes + self.has_z.nbytes)
+
+    def _coord_nbytes(self):
+        """Number of bytes used by a single coordinate."""
+        return self.coords.itemsize * self.ndim
+
+    def coord_offsets(self):
+        """
+        Return the offsets into ``coords`` for every geometry, i.e. the
+        coordinates of the i-th geometry are ``coords[offsets[i]:offsets[i +
+        1]]``.
+        """
+        return self.ring_offsets[self.part_offsets[self.geom_offsets]]
+
+    def element_nbytes(self):
+        """
+        Return the number of bytes of the buffers used by each geometry.
+        """
+        rings = np.diff(self.part_offsets[self.geom_offsets])
+        parts = np.diff(self.geom_offsets)
+        n_coords = np.diff(self.coord_offsets())
+        itemsize = self._coord_nbytes()
+        offsets_itemsize = self.ring_offsets.itemsize
+        return (n_coords * itemsize + (rings + parts + 1) * offsets_itemsize
+                + self.type_codes.itemsize + self.has_z.itemsize)
+
+    def geos_counts(self):
+        """
+        Return a (N, 2) int64 array with the number of coordinates and the
+        number of GEOS geometries of each geometry (see ``geos_counts``).
+        """
+        counts = np.zeros((len(self), 2), dtype=np.int64)
+        counts[:, 0] = np.diff(self.coord_offsets())
+        polygonal = np.in1d(self.type_codes, (POLYGON, MULTIPOLYGON))
+        multi = np.in1d(self.type_codes, (MULTIPOINT, MULTILINESTRING,
+                                          MULTIPOLYGON))
+        rings = np.diff(self.part_offsets[self.geom_offsets])
+        parts = np.diff(self.geom_offsets)
+        counts[:, 1] = 1 + np.where(polygonal, rings, 0) + np.where(
+            multi, parts, 0)
+        counts[self.type_codes == MISSING] = 0
+        return counts
+
+    def with_coords(self, coords):
+        """
+        Return buffers with the same structure (types and offsets) but other
+        coordinates.
+
+        Parameters
+        ----------
+        coords : ndarray of shape (n_coords, 2) or (n_coords, 3)
+            The new coordinates. With 3 columns, the geometries of which the
+            first z value is NaN are 2D.
+        """
+        coords = np.asarray(coords, dtype='float64')
+        if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+            raise ValueError(
+                "Expected an array of shape (n_coords, 2) or (n_coords, 3)")
+        n_coords = self.ring_offsets[-1]
+        if len(coords) != n_coords:
+            raise ValueError(
+                "Expected {0} coordinates, got {1}".format(
+                    n_coords, len(coords)))
+        has_z = np.zeros(len(self), dtype=bool)
+        if coords.shape[1] == 3:
+            offsets = self.coord_offsets()
+            nonempty = np.flatnonzero(np.diff(offsets) > 0)
+            has_z[nonempty] = ~np.isnan(coords[offsets[nonempty], 2])
+        return CoordinateBuffers(
+            coords, self.ring_offsets, self.part_offsets, self.geom_offsets,
+            self.type_codes, has_z)
+
+    def bounds(self):
+        """
+        Return a (N, 4) float64 array with the minx, miny, maxx, maxy values
+        of each geometry (NaN for missing and empty geometries).
+        """
+        bounds = np.full((len(self), 4), np.nan)
+        offsets = self.coord_offsets()
+        nonempty = np.flatnonzero(np.diff(offsets) > 0)
+        if len(nonempty):
+            # empty geometries have no coordinates, so the start of the next
+            # non-empty geometry is the end of the previous one
+            starts = offsets[nonempty]
+            xy = self.coords[:, :2]
+            bounds[nonempty, :2] = np.minimum.reduceat(xy, starts, axis=0)
+            bounds[nonempty, 2:] = np.maximum.reduceat(xy, starts, axis=0)
+        return bounds
+
+    # -------------------------------------------------------------------------
+    # Planar metrics computed over the buffers as a whole
+    # -------------------------------------------------------------------------
+
+    def _segments(self):
+        """
+        Return the start and end points of the segment starting at every
+        coordinate, relative to the first coordinate of its ring (for
+        numerical accuracy), and those first coordinates.
+
+        The last coordinate of a ring starts a degenerate segment (end equal
+        to start), so that per-coordinate values can be summed per ring.
+        """
+        xy = self.coords[:, :2]
+        counts = np.diff(self.ring_offsets)
+        base = xy[np.repeat(self.ring_offsets[:-1], counts)]
+        start = xy - base
+        end = np.empty_like(start)
+        end[:-1] = xy[1:] - base[:-1]
+        last = self.ring_offsets[1:][counts > 0] - 1
+        end[last] = start[last]
+        return start, end, base
+
+    def _geometry_masks(self):
+        """Masks of the polygonal, lineal and puntal geometries."""
+        codes = self.type_codes
+        return (np.in1d(codes, (POLYGON, MULTIPOLYGON)),
+                np.in1d(codes, (LINESTRING, LINEARRING, MULTILINESTRING)),
+                np.in1d(codes, (POINT, MULTIPOINT)))
+
+    def area(self):
+        """
+        Return the planar area of each geometry (shoelace formula, holes
+        subtracted), 0 for non-polygonal or empty and NaN for missing ones.
+        """
+        start, end, _ = self._segments()
+        cross = start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]
+        ring_area = np.abs(_reduce_sum(cross, self.ring_offsets)) / 2.0
+        ring_area[~self._exterior_rings()] *= -1
+        area = _reduce_sum(ring_area, self.part_offsets[self.geom_offsets])
+        polygonal = self._geometry_masks()[0]
+        area[~polygonal] = 0.0
+        area[self.type_codes == MISSING] = np.nan
+        return area
+
+    def length(self):
+        """
+        Return the planar length (perimeter for polygons) of each geometry,
+        0 for points or empty and NaN for missing ones.
+        """
+        start, end, _ = self._segments()
+        segment_length = np.hypot(*(end - start).T)
+        ring_length = _reduce_sum(segment_length, self.ring_offsets)
+        length = _reduce_sum(
+            ring_length, self.part_offsets[self.geom_offsets])
+        length[self.type_codes == MISSING] = np.nan
+        return length
+
+    def centroid(self):
+        """
+        Return a (N, 2) array with the x, y coordinates of the centroid of
+        each geometry: area weighted for polygons, length weighted for lines
+        and the mean of the points otherwise.
+
+        Missing and empty geometries, and degenerate polygons or lines
+        (zero area or zero length) for which GEOS falls back to a lower
+        dimension, get NaN.
+        """
+        n = len(self)
+        xy = np.full((n, 2), np.nan)
+        polygonal, lineal, puntal = self._geometry_masks()
+        rings = self.part_offsets[self.geom_offsets]
+        start, end, base = self._segments()
+
+        if polygonal.any():
+            cross = start[:, 0] * end[:, 1] - end[:, 0] * start[:, 1]
+            signed_area = _reduce_sum(cross, self.ring_offsets) / 2.0
+            moments = _reduce_sum(
+                (start + end) * cross[:, None], self.ring_offsets) / 6.0
+            ring_base = np.zeros((len(signed_area), 2))
+            nonempty = np.diff(self.ring_offsets) > 0
+            ring_base[nonempty] = base[self.ring_offsets[:-1][nonempty]]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                ring_centroid = moments / signed_area[:, None] + ring_base
+            ring_centroid[signed_area == 0] = 0.0
+            # holes have a negative weight
+            weight = np.where(self._exterior_rings(), 1.0, -1.0) * np.abs(
+                signed_area)
+            total = _reduce_sum(weight, rings)
+            weighted = _reduce_sum(weight[:, None] * ring_centroid, rings)
+            ok = polygonal & (total > 0)
+            xy[ok] = weighted[ok] / total[ok, None]
+
+        if lineal.any():
+            segment_length = np.hypot(*(end - start).T)
+            middle = (start + end) / 2.0 + base
+            total = _reduce_sum(
+                _reduce_sum(segment_length, self.ring_offsets), rings)
+            weighted = _reduce_sum(
+                _reduce_sum(segment_length[:, None] * middle,
+                            self.ring_offsets), rings)
+            ok = lineal & (total > 0)
+            xy[ok] = weighted[ok] / total[ok, None]
+
+        if puntal.any():
+            offsets = self.coord_offsets()
+            counts = np.diff(offsets)
+            total = _reduce_sum(start + base, offsets)
+            ok = puntal & (counts > 0)
+            xy[ok] = total[ok] / counts[ok, None]
+
+        return xy
+
+    def _exterior_rings(self):
+        """Mask of the rings that are the first ring of their part."""
+        exterior = np.zeros(len(self.ring_offsets) - 1, dtype=bool)
+        starts = self.part_offsets[:-1][np.diff(self.part_offsets) > 0]
+        exterior[starts] = True
+        return exterior
+
+    def _ring(self, r, ndim):
+        start, stop = self.ring_offsets[r], self.ring_offsets[r + 1]
+        return self.coords[start:stop, :ndim]
+
+    def _polygon(self, p, ndim):
+        start, stop = self.part_offsets[p], self.part_offsets[p + 1]
+        shell = self._ring(start, ndim)
+        holes = [self._ring(r, ndim) for r in range(start + 1, stop)]
+        return shell, holes
+
+    def get(self, i):
+        """Materialize the i-th geometry as a Shapely object."""
+        code = self.type_codes[i]
+        if code == MISSING:
+            return None
+        cls = _GEOMETRY_CLASSES[code]
+        start, stop = self.geom_offsets[i], self.geom_offsets[i + 1]
+        if start == stop:
+            return cls()
+        ndim = 3 if self.has_z[i] else 2
+
+        if code in (POINT, LINESTRING, LINEARRING):
+            ring = self._ring(self.part_offsets[start], ndim)
+            if code == POINT:
+                return cls(*ring[0])
+            return cls(ring)
+        elif code == POLYGON:
+            return cls(*self._polygon(start, ndim))
+        elif code in (MULTIPOINT, MULTILINESTRING):
+            parts = [self._ring(self.part_offsets[p], ndim)
+                     for p in range(start, stop)]
+            if code == MULTIPOINT:
+                return cls(np.concatenate(parts))
+            return cls(parts)
+        else:
+            return cls([self._polygon(p, ndim) for p in range(start, stop)])
+
+    def to_shapely(self):
+        """Materialize all geometries as a 1D object array."""
+        out = np.empty(len(self), dtype=object)
+        out[:] = [self.get(i) for i in range(len(self))]
+        return out
+
+    def _take_structure(self, indices):
+        """
+        Return the positions of the coordinates and the offsets of the
+        geometries at ``indices`` (see :meth:`take`).
+        """
+        geom_offsets, parts = _take_ranges(self.geom_offsets, indices)
+        part_offsets, rings = _take_ranges(self.part_offsets, parts)
+        ring_offsets, positions = _take_ranges(self.ring_offsets, rings)
+        type_codes = np.append(self.type_codes, np.uint8(MISSING))[indices]
+        has_z = np.append(self.has_z, False)[indices]
+        return (positions, ring_offsets, part_offsets, geom_offsets,
+                type_codes, has_z)
+
+    def take(self, indices):
+        """
+        Return the buffers of the geometries at ``indices`` (an array of
+        positions, with -1 for missing values), without materializing them.
+        """
+        structure = self._take_structure(indices)
+        return CoordinateBuffers(self.coords[structure[0]], *structure[1:])
+
+    @classmethod
+    def concat(cls, to_concat):
+        """
+        Concatenate a sequence of buffers, without materializing the
+        geometries.
+        """
+        ndim = max(buffers.ndim for buffers in to_concat)
+        coords = np.concatenate([
+            buffers.coords if buffers.ndim == ndim else _pad_z(buffers.coords)
+            for buffers in to_concat])
+        return CoordinateBuffers(coords, *_concat_structure(to_concat))
+
+
+class QuantizedBuffers(CoordinateBuffers):
+    """
+    Coordinate buffers holding the coordinates with a reduced precision,
+    either as float32 or as int32 positions on a regular grid, relative to
+    an origin.
+
+    The ``coords`` are decoded (as float64) when accessed, the rings of a
+    single geometry when it is materialized. Use :meth:`encode` to
+    construct the buffers.
+
+    Attributes
+    ----------
+    encoded : ndarray of float32 or int32
+        The encoded coordinates: ``coords = encoded * scale + origin``.
+        NaN z values are encoded as the minimum int32 value.
+    origin, scale : ndarray of float64
+        The origin and the scale (grid size) of every dimension.
+    fixed_scale : bool
+        Whether the scale was given explicitly, rather than derived from the
+        extent of the coordinates.
+    """
+
+    _NAN = np.iinfo(np.int32).min
+
+    def __init__(self, encoded, origin, scale, ring_offsets, part_offsets,
+                 geom_offsets, type_codes, has_z, fixed_scale=False):
+        self.encoded = encoded
+        self.origin = origin
+        self.scale = scale
+        self.fixed_scale = fixed_scale
+        self.ring_offsets = ring_offsets
+        self.part_offsets = part_offsets
+        self.geom_offsets = geom_offsets
+        self.type_codes = type_codes
+        self.has_z = has_z
+
+    @classmethod
+    def encode(cls, buffers, dtype='int32', scale=None):
+        """
+        Encode (float64) coordinate buffers.
+
+        Parameters
+        ----------
+        buffers : CoordinateBuffers
+        dtype : {'int32', 'float32'}, default 'int32'
+        scale : float or sequence of float, optional
+            The grid size for every dimension (int32 only). By default the
+            extent of the coordinates is divided in 2**30 steps, leaving
+            room for values outside of the current extent. The origin
+            is aligned to the grid, so that a coordinate which is a multiple
+            of the scale is encoded exactly.
+        """
+        coords = buffers.coords
+        ndim = coords.shape[1]
+        finite = np.isfinite(coords).any(axis=0)
+        origin = np.zeros(ndim)
+        extent = np.zeros(ndim)
+        if len(coords) and finite.any():
+            with warnings.catch_warnings():
+                # all-NaN z
+                warnings.simplefilter('ignore', RuntimeWarning)
+                origin = np.where(finite, np.nanmin(coords, axis=0), 0.0)
+                extent = np.where(
+                    finite, np.nanmax(coords, axis=0) - origin, 0.0)
+
+        fixed_scale = scale is not None
+        if dtype == 'float32':
+            scale = np.ones(ndim)
+            fixed_scale = False
+        elif dtype == 'int32':
+            if scale is None:
+                scale = np.where(extent > 0, extent / 2 ** 30, 1.0)
+            scale = np.broadcast_to(
+                np.asarray(scale, dtype='float64'), (ndim,)).copy()
+            if not (scale > 0).all():
+                raise ValueError("'scale' should be positive")
+            origin = np.floor(origin / scale) * scale
+        else:
+            raise ValueError(
+                "dtype should be 'int32' or 'float32', got '{0}'".format(
+                    dtype))
+
+        encoded = cls._encode_coords(coords, origin, scale, dtype)
+        return cls(encoded, origin, scale, buffers.ring_offsets,
+                   buffers.part_offsets, buffers.geom_offsets,
+                   buffers.type_codes, buffers.has_z, fixed_scale)
+
+    @classmethod
+    def _encode_coords(cls, coords, origin, scale, dtype):
+        encoded = (coords - origin) / scale
+        if dtype == 'int32':
+            nan = np.isnan(encoded)
+            encoded = np.round(encoded)
+            if (np.abs(encoded[~nan]) >= 2 ** 31 - 1).any():
+                raise ValueError(
+                    "The coordinates can't be stored as int32 with a scale "
+                    "of {0}".format(scale.tolist()))
+            encoded[nan] = cls._NAN
+        return encoded.astype(dtype)
+
+    @property
+    def dtype(self):
+        """The dtype of the encoded coordinates."""
+        return self.encoded.dtype
+
+    def _decode(self, encoded):
+        coords = encoded * self.scale + self.origin
+        if self.dtype == np.int32:
+            coords[encoded == self._NAN] = np.nan
+        return coords
+
+    @property
+    def coords(self):
+        """The decoded (float64) coordinates."""
+        return self._decode(self.encoded)
+
+    @property
+    def ndim(self):
+        return self.encoded.shape[1]
+
+    @property
+    def nbytes(self):
+        """Total number of bytes of all buffers."""
+        return (self.encoded.nbytes + self.origin.nbytes + self.scale.nbytes
+                + self.ring_offsets.nbytes + self.part_offsets.nbytes
+                + self.geom_offsets.nbytes + self.type_codes.nbytes
+                + self.has_z.nbytes)
+
+    def _coord_nbytes(self):
+        return self.encoded.itemsize * self.ndim
+
+    def _ring(self, r, ndim):
+        start, stop = self.ring_offsets[r], self.ring_offsets[r + 1]
+        return self._decode(self.encoded[start:stop])[:, :ndim]
+
+    def with_coords(self, coords):
+        """
+        Return buffers with the same structure but other coordinates,
+        encoded with the same dtype and, for int32, the same scale if it was
+        given explicitly (a new one otherwise).
+        """
+        buffers = CoordinateBuffers.with_coords(self, coords)
+        scale = self.scale if self.fixed_scale else None
+        return QuantizedBuffers.encode(buffers, dtype=self.dtype.name,
+                                       scale=scale)
+
+    def replace(self, positions, buffers):
+        """
+        Return the buffers with the geometries at ``positions`` replaced by
+        those of ``buffers``, encoded with the same origin and scale (the
+        other geometries are not encoded again).
+
+        Raises a ValueError if the new coordinates have more dimensions, or
+        can't be stored as int32 with the scale.
+        """
+        if buffers.ndim > self.ndim:
+            raise ValueError(
+                "The coordinates have more dimensions than the buffers")
+        coords = buffers.coords
+        if coords.shape[1] < self.ndim:
+            coords = np.column_stack(
+                [coords, np.full(len(coords), np.nan)])
+        encoded = self._encode_coords(coords, self.origin, self.scale,
+                                      self.dtype.name)
+        n = len(self)
+        combined = QuantizedBuffers(
+            np.concatenate([self.encoded, encoded]), self.origin, self.scale,
+            np.concatenate([self.ring_offsets, buffers.ring_offsets[1:]
+                            + self.ring_offsets[-1]]),
+            np.concatenate([self.part_offsets, buffers.part_offsets[1:]
+                            + len(self.ring_offsets) - 1]),
+            np.concatenate([self.geom_offsets, buffers.geom_offsets[1:]
+                            + len(self.part_offsets) - 1]),
+            np.concatenate([self.type_codes, buffers.type_codes]),
+            np.concatenate([self.has_z, buffers.has_z]),
+            fixed_scale=self.fixed_scale)
+        indices = np.arange(n)
+        indices[positions] = n + np.arange(len(buffers))
+        return combined.take(indices)
+
+    def take(self, indices):
+        """
+        Return the buffers of the geometries at ``indices`` (with -1 for
+        missing values), keeping the encoding.
+        """
+        structure = self._take_structure(indices)
+        return QuantizedBuffers(
+            self.encoded[structure[0]], self.origin, self.scale,
+            *structure[1:], fixed_scale=self.fixed_scale)
+
+    @classmethod
+    def concat(cls, to_concat):
+        """
+        Concatenate a sequence of buffers with the same dtype. Buffers
+        sharing the origin and scale are concatenated as they are, others
+        are encoded again (with their explicit scale, if they all share
+        one).
+        """
+        first = to_concat[0]
+        same = all(
+            buffers.ndim == first.ndim and buffers.dtype == first.dtype
+            and buffers.fixed_scale == first.fixed_scale
+            and np.array_equal(buffers.origin, first.origin)
+            and np.array_equal(buffers.scale, first.scale)
+            for buffers in to_concat)
+        if same:
+            encoded = np.concatenate([b.encoded for b in to_concat])
+            return QuantizedBuffers(
+                encoded, first.origin, first.scale,
+                *_concat_structure(to_concat), fixed_scale=first.fixed_scale)
+        scale = None
+        if all(buffers.fixed_scale
+               and np.array_equal(buffers.scale, first.scale)
+               for buffers in to_concat):
+            scale = first.scale
+        return QuantizedBuffers.encode(
+            CoordinateBuffers.concat(to_concat), first.dtype.name,
+            scale=scale)
+
+
+def _reduce_sum(values, offsets):
+    """
+    Sum ``values`` over the consecutive ranges given by ``offsets``, with 0
+    for empty ranges.
+    """
+    result = np.zeros((len(offsets) - 1,) + values.shape[1:])
+    nonempty = np.flatnonzero(np.diff(offsets) > 0)
+    if len(nonempty):
+        # as for the bounds, the empty ranges don't split the reduction
+        result[nonempty] = np.add.reduceat(
+            values, offsets[nonempty], axis=0)
+    return result
+
+
+def _concat_structure(to_concat):
+    """
+    Concatenate the offsets (shifted to the concatenated coordinates, rings
+    and parts), type codes and has_z of a sequence of buffers.
+    """
+    offsets = []
+    for attr in ['ring_offsets', 'part_offsets', 'geom_offsets']:
+        arrays = [getattr(buffers, attr) for buffers in to_concat]
+        shifts = np.cumsum([0] + [values[-1] for values in arrays[:-1]])
+        offsets.append(np.concatenate(
+            [arrays[0][:1]]
+            + [values[1:] + shift for values, shift in zip(arrays, shifts)]))
+    type_codes = np.concatenate([b.type_codes for b in to_concat])
+    has_z = np.concatenate([b.has_z for b in to_concat])
+    return offsets + [type_codes, has_z]
+
+
+def take_filled(values, indices, fill):
+    """
+    Take ``values`` along the first axis, with ``fill`` for the -1 indices.
+    """
+    fill = np.full((1,) + values.shape[1:], fill, dtype=values.dtype)
+    return np.concatenate([values, fill])[indices]
+
+
+def _take_ranges(offsets, indices):
+    """
+    Concatenate the ranges ``offsets[i]:offsets[i + 1]`` for ``i`` in
+    ``indices`` (empty for the negative indices of missing values).
+
+    Returns the offsets of the taken ranges and the positions of their
+    elements.
+    """
+    valid = indices >= 0
+    starts = offsets[np.where(valid, indices, 0)]
+    counts = offsets[np.where(valid, indices + 1, 0)] - starts
+    new_offsets = _offsets(counts)
+    positions = np.arange(new_offsets[-1], dtype=np.int64) + np.repeat(
+        starts - new_offsets[:-1], counts)
+    return new_offsets, positions
+
+
+def _pad_z(ring):
+    if ring.shape[1] == 3:
+        return ring
+    return np.column_stack([ring, np.full(len(ring), np.nan)])
+
+
+def _offsets(counts):
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+class PointBuffers(object):
+    """
+    Point geometries stored as separate float64 x, y (and z) arrays.
+
+    Constructing the buffers from existing float64 arrays does not copy the
+    data, and the x, y and z coordinates are directly available as arrays.
+
+    Attributes
+    ----------
+    x, y : ndarray of float64
+    z : ndarray of float64 or None
+        The z values, or None for 2D points. Points with a NaN z value
+        are materialized as 2D points.
+    """
+
+    def __init__(self, x, y, z=None):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def from_shapely(cls, geoms):
+        """
+        Encode a sequence of (non-empty) Shapely Points into buffers.
+        """
+        n = len(geoms)
+        coords = np.full((n, 3), np.nan)
+        for i in range(n):
+            geom = geoms[i]
+            if geometry_type_code(geom) != POINT or geom.is_empty:
+                raise ValueError(
+                    "Only non-empty Point geometries can be stored in point "
+                    "buffers (element {0}).".format(i))
+            point = geom.coords[0]
+            coords[i, :len(point)] = point
+        z = coords[:, 2]
+        if np.isnan(z).all():
+            z = None
+        return cls(coords[:, 0], coords[:, 1], z)
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def ndim(self):
+        """Number of coordinate dimensions (2 or 3)."""
+        return 2 if self.z is None else 3
+
+    @property
+    def coords(self):
+        """The coordinates as a (N, 2) or (N, 3) array."""
+        if self.z is None:
+            return np.column_stack([self.x, self.y])
+        return np.column_stack([self.x, self.y, self.z])
+
+    def coord_offsets(self):
+        """Offsets into ``coords`` for every point."""
+        return np.arange(len(self) + 1, dtype=np.int64)
+
+    def element_nbytes(self):
+        """Return the number of bytes of the buffers used by each point."""
+        return np.full(len(self), self.x.itemsize * self.ndim, dtype=np.int64)
+
+    def geos_counts(self):
+        """
+        Return a (N, 2) int64 array with the number of coordinates and the
+        number of GEOS geometries of each point (1 and 1).
+        """
+        return np.ones((len(self), 2), dtype=np.int64)
+
+    def with_coords(self, coords):
+        """
+        Return buffers with other coordinates, given as an array of shape
+        (N, 2) or (N, 3).
+        """
+        coords = np.asarray(coords, dtype='float64')
+        if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+            raise ValueError(
+                "Expected an array of shape (n_coords, 2) or (n_coords, 3)")
+        if len(coords) != len(self):
+            raise ValueError(
+                "Expected {0} coordinates, got {1}".format(
+                    len(self), len(coords)))
+        z = coords[:, 2] if coords.shape[1] == 3 else None
+        if z is not None and np.isnan(z).all():
+            z = None
+        return type(self)(coords[:, 0], coords[:, 1], z)
+
+    def take(self, indices):
+        """
+        Return the buffers of the points at ``indices``. With -1 for missing
+        values, which points can't represent, coordinate buffers are
+        returned.
+        """
+        if (indices < 0).any():
+            offsets = self.coord_offsets()
+            buffers = CoordinateBuffers(
+                self.coords, offsets, offsets, offsets, self.type_codes,
+                self.has_z)
+            return buffers.take(indices)
+        z = self.z[indices] if self.z is not None else None
+        return type(self)(self.x[indices], self.y[indices], z)
+
+    @classmethod
+    def concat(cls, to_concat):
+        """Concatenate a sequence of point buffers."""
+        z = None
+        if any(buffers.z is not None for buffers in to_concat):
+            # NaN z values for the 2D points
+            z = np.concatenate([
+                buffers.z if buffers.z is not None
+                else np.full(len(buffers), np.nan) for buffers in to_concat])
+        return cls(np.concatenate([b.x for b in to_concat]),
+                   np.concatenate([b.y for b in to_concat]), z)
+
+    @property
+    def type_codes(self):
+        return np.full(len(self), POINT, dtype=np.uint8)
+
+    @property
+    def has_z(self):
+        if self.z is None:
+            return np.zeros(len(self), dtype=bool)
+        return ~np.isnan(self.z)
+
+    @property
+    def nbytes(self):
+        """Total number of bytes of all buffers."""
+        nbytes = self.x.nbytes + self.y.nbytes
+        if self.z is not None:
+            nbytes += self.z.nbytes
+        return nbytes
+
+    def bounds(self):
+        """
+        Return a (N, 4) float64 array with the minx, miny, maxx, maxy values
+        of each point.
+        """
+        return np.column_stack([self.x, self.y, self.x, self.y]).astype(
+            'float64', copy=False)
+
+    def area(self):
+        """Return the area of each point (0)."""
+        return np.zeros(len(self))
+
+    def length(self):
+        """Return the length of each point (0)."""
+        return np.zeros(len(self))
+
+    def centroid(self):
+        """Return a (N, 2) array with the x, y coordinates of the points."""
+        return np.column_stack([self.x, self.y]).astype('float64')
+
+    def get(self, i):
+        """Materialize the i-th point as a Shapely object."""
+        if self.z is None or np.isnan(self.z[i]):
+            return shapely.geometry.Point(self.x[i], self.y[i])
+        return shapely.geometry.Point(self.x[i], self.y[i], self.z[i])
+
+    def to_shapely(self):
+        """Materialize all points as a 1D object array."""
+        Point = shapely.geometry.Point
+        out = np.empty(len(self), dtype=object)
+        if self.z is None:
+            out[:] = [Point(x, y)
+                      for x, y in zip(self.x.tolist(), self.y.tolist())]
+        else:
+            out[:] = [self.get(i) for i in range(len(self))]
+        return out
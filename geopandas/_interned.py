@@ -0,0 +1,112 @@
+"""
+Interned storage of geometries.
+
+Repeated geometries (e.g. the left geometries of a spatial join with many
+matches per row) are stored once, as an array of unique geometries together
+with an integer code per element, like a categorical. The elements share the
+unique Shapely objects when materialized, and only the unique geometries are
+copied or pickled.
+"""
+import numpy as np
+
+from ._coords import MISSING, take_filled
+
+
+class InternedBuffers(object):
+    """
+    Geometries stored as codes into an array of unique geometries.
+
+    Attributes
+    ----------
+    categories : GeometryArray
+        The unique geometries (in any storage).
+    codes : ndarray of int32
+        The position of each element in ``categories``, or -1 for missing
+        values.
+    """
+
+    def __init__(self, categories, codes):
+        self.categories = categories
+        self.codes = codes
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _take_categories(self, values, fill):
+        """Per-element values from the values of the categories."""
+        return take_filled(values, self.codes, fill)
+
+    @property
+    def type_codes(self):
+        return self._take_categories(self.categories.type_codes, MISSING)
+
+    @property
+    def has_z(self):
+        return self._take_categories(self.categories.has_z, False)
+
+    def empty(self):
+        """Return a boolean mask of the empty geometries."""
+        return self._take_categories(self.categories.is_empty, False)
+
+    def bounds(self):
+        """
+        Return a (N, 4) float64 array with the minx, miny, maxx, maxy values
+        of each geometry (NaN for missing and empty geometries).
+        """
+        return self._take_categories(self.categories.bounds, np.nan)
+
+    def geos_counts(self):
+        """
+        Return a (N, 2) int64 array with the number of coordinates and the
+        number of GEOS geometries of each geometry.
+        """
+        return self._take_categories(self.categories._counts(), 0)
+
+    @property
+    def nbytes(self):
+        """Number of bytes of the codes and of the unique geometries."""
+        return self.codes.nbytes + self.categories.memory_usage()
+
+    def element_nbytes(self):
+        """
+        Return the number of bytes used by each element: its code, and the
+        memory of the unique geometries for their first occurrence.
+        """
+        nbytes = np.full(len(self), self.codes.itemsize, dtype=np.int64)
+        codes, first = np.unique(self.codes, return_index=True)
+        valid = codes >= 0
+        nbytes[first[valid]] += self.categories._element_nbytes()[
+            codes[valid]]
+        return nbytes
+
+    def take(self, indices):
+        """
+        Return the elements at ``indices`` (with -1 for missing values),
+        sharing the unique geometries.
+        """
+        return InternedBuffers(
+            self.categories, take_filled(self.codes, indices, -1))
+
+    @classmethod
+    def concat(cls, to_concat):
+        """
+        Concatenate a sequence of interned buffers, concatenating their
+        unique geometries (which are not deduplicated across the buffers).
+        """
+        categories = [buffers.categories for buffers in to_concat]
+        shifts = np.cumsum([0] + [len(c) for c in categories[:-1]])
+        codes = np.concatenate([
+            np.where(buffers.codes < 0, -1, buffers.codes + shift)
+            for buffers, shift in zip(to_concat, shifts)]).astype(np.int32)
+        return cls(type(categories[0])._concat_same_type(categories), codes)
+
+    def get(self, i):
+        """Return the i-th geometry (shared with the other occurrences)."""
+        code = self.codes[i]
+        if code < 0:
+            return None
+        return self.categories[code]
+
+    def to_shapely(self):
+        """Return all geometries as a 1D object array (sharing objects)."""
+        return take_filled(self.categories.data, self.codes, None)
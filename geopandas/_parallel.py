@@ -0,0 +1,86 @@
+"""
+Chunked, optionally multi-threaded, execution of element-wise operations.
+
+The GEOS functions called through the ctypes bindings of Shapely release the
+GIL, so a loop over many geometries can be split in chunks of consecutive
+elements that are processed on a pool of threads.
+"""
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+
+def _get_n_jobs(n_jobs):
+    """
+    Normalize the ``n_jobs`` keyword: None means 1, and negative values
+    count back from the number of CPUs (-1 meaning all of them).
+    """
+    if n_jobs is None:
+        return 1
+    n_jobs = int(n_jobs)
+    if n_jobs == 0:
+        raise ValueError("'n_jobs' cannot be 0")
+    if n_jobs < 0:
+        n_jobs = max(multiprocessing.cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def chunk_ranges(n, n_chunks=1, chunksize=None):
+    """
+    Split ``range(n)`` in consecutive ``(start, stop)`` ranges.
+
+    Parameters
+    ----------
+    n : int
+        Number of elements.
+    n_chunks : int, default 1
+        Number of (equally sized) chunks, ignored if ``chunksize`` is given.
+    chunksize : int, optional
+        Number of elements per chunk.
+
+    Returns
+    -------
+    list of (start, stop) tuples
+    """
+    if chunksize is None:
+        chunksize = -(-n // max(n_chunks, 1))
+    chunksize = max(int(chunksize), 1)
+    return [(start, min(start + chunksize, n))
+            for start in range(0, n, chunksize)]
+
+
+def run_chunked(func, n, n_jobs=1, chunksize=None):
+    """
+    Call ``func(start, stop)`` for consecutive chunks covering ``range(n)``.
+
+    With ``n_jobs`` larger than 1 the chunks are processed on a pool of
+    threads. ``func`` should therefore only write to the ``start:stop``
+    part of any (preallocated) output.
+
+    Parameters
+    ----------
+    func : callable
+        Called as ``func(start, stop)``.
+    n : int
+        Number of elements.
+    n_jobs : int, default 1
+        Number of threads (-1 to use all CPUs).
+    chunksize : int, optional
+        Number of elements per chunk. By default the elements are divided
+        evenly over ``n_jobs`` chunks.
+
+    Returns
+    -------
+    list
+        The return values of ``func`` for every chunk, in order.
+    """
+    n_jobs = _get_n_jobs(n_jobs)
+    ranges = chunk_ranges(n, n_jobs, chunksize)
+    if n_jobs == 1 or len(ranges) <= 1:
+        return [func(start, stop) for start, stop in ranges]
+
+    pool = ThreadPool(min(n_jobs, len(ranges)))
+    try:
+        return pool.map(lambda r: func(*r), ranges)
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,225 @@
+"""
+Lazy storage of geometries as WKB.
+
+The WKB values are kept as they are (e.g. as read from a database) and only
+parsed into Shapely objects when needed. The type, dimension, number of
+coordinates and envelope of every geometry are read directly from the WKB
+(in a single pass, without creating GEOS objects), and the values can be
+written back out without a round-trip through GEOS.
+"""
+import struct
+import sys
+
+import numpy as np
+
+from ._coords import (
+    POINT, LINESTRING, POLYGON, MULTIPOINT, MULTILINESTRING, MULTIPOLYGON,
+    GEOMETRYCOLLECTION, MISSING, take_filled)
+from ._parallel import run_chunked
+
+
+# WKB geometry type -> type code
+_WKB_TYPES = {
+    1: POINT,
+    2: LINESTRING,
+    3: POLYGON,
+    4: MULTIPOINT,
+    5: MULTILINESTRING,
+    6: MULTIPOLYGON,
+    7: GEOMETRYCOLLECTION,
+}
+
+# EWKB flags
+_EWKB_Z = 0x80000000
+_EWKB_M = 0x40000000
+_EWKB_SRID = 0x20000000
+
+
+def _read_geometry(buf, pos, rings):
+    """
+    Parse the geometry starting at ``pos``, appending the coordinate arrays
+    of its rings (x and y columns only) to ``rings``.
+
+    Returns the type code, whether it has z, the number of GEOS geometries
+    and the position after the geometry.
+    """
+    endian = '<' if buf[pos:pos + 1] == b'\x01' else '>'
+    wkb_type, = struct.unpack_from(endian + 'I', buf, pos + 1)
+    pos += 5
+    has_z = bool(wkb_type & _EWKB_Z)
+    has_m = bool(wkb_type & _EWKB_M)
+    if wkb_type & _EWKB_SRID:
+        pos += 4
+    wkb_type &= 0x0FFFFFFF
+    # ISO WKB: 1000 for Z, 2000 for M, 3000 for ZM
+    dims, wkb_type = divmod(wkb_type, 1000)
+    has_z = has_z or dims in (1, 3)
+    has_m = has_m or dims in (2, 3)
+    code = _WKB_TYPES[wkb_type]
+    ndim = 2 + has_z + has_m
+    dtype = np.dtype(endian + 'f8')
+    uint32 = endian + 'I'
+
+    def read_coords(pos, n):
+        coords = np.frombuffer(buf, dtype=dtype, count=n * ndim, offset=pos)
+        return coords.reshape(n, ndim)[:, :2], pos + n * ndim * 8
+
+    if code == POINT:
+        coords, pos = read_coords(pos, 1)
+        if not np.isnan(coords).all():
+            # (an empty point is written with NaN coordinates)
+            rings.append(coords)
+        return code, has_z, 1, pos
+    elif code == LINESTRING:
+        n, = struct.unpack_from(uint32, buf, pos)
+        coords, pos = read_coords(pos + 4, n)
+        rings.append(coords)
+        return code, has_z, 1, pos
+    elif code == POLYGON:
+        n_rings, = struct.unpack_from(uint32, buf, pos)
+        pos += 4
+        for _ in range(n_rings):
+            n, = struct.unpack_from(uint32, buf, pos)
+            coords, pos = read_coords(pos + 4, n)
+            rings.append(coords)
+        return code, has_z, 1 + n_rings, pos
+    n_parts, = struct.unpack_from(uint32, buf, pos)
+    pos += 4
+    n_geoms = 1
+    for _ in range(n_parts):
+        _, part_z, part_geoms, pos = _read_geometry(buf, pos, rings)
+        has_z = has_z or part_z
+        n_geoms += part_geoms
+    return code, has_z, n_geoms, pos
+
+
+class WKBBuffers(object):
+    """
+    Geometries stored as an array of WKB values.
+
+    Attributes
+    ----------
+    values : ndarray of object
+        The WKB values as bytes, or None for missing values.
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self._info = None
+
+    def __len__(self):
+        return len(self.values)
+
+    def _scan(self):
+        """
+        Read the type code, dimension, number of coordinates and of GEOS
+        geometries and the bounds of every geometry from the WKB (once).
+        """
+        if self._info is None:
+            n = len(self)
+            type_codes = np.full(n, MISSING, dtype=np.uint8)
+            has_z = np.zeros(n, dtype=bool)
+            counts = np.zeros((n, 2), dtype=np.int64)
+            bounds = np.full((n, 4), np.nan)
+            for i, value in enumerate(self.values):
+                if value is None:
+                    continue
+                rings = []
+                type_codes[i], has_z[i], counts[i, 1], _ = _read_geometry(
+                    value, 0, rings)
+                if rings:
+                    coords = np.concatenate(rings)
+                    counts[i, 0] = len(coords)
+                if counts[i, 0]:
+                    bounds[i, :2] = np.nanmin(coords, axis=0)
+                    bounds[i, 2:] = np.nanmax(coords, axis=0)
+            self._info = type_codes, has_z, counts, bounds
+        return self._info
+
+    @property
+    def type_codes(self):
+        return self._scan()[0]
+
+    @property
+    def has_z(self):
+        return self._scan()[1]
+
+    def geos_counts(self):
+        """
+        Return a (N, 2) int64 array with the number of coordinates and the
+        number of GEOS geometries of each geometry.
+        """
+        return self._scan()[2]
+
+    def empty(self):
+        """Return a boolean mask of the empty geometries."""
+        return (self.geos_counts()[:, 0] == 0) & (self.type_codes != MISSING)
+
+    def bounds(self):
+        """
+        Return a (N, 4) float64 array with the minx, miny, maxx, maxy values
+        of each geometry (NaN for missing and empty geometries).
+        """
+        return self._scan()[3].copy()
+
+    @property
+    def nbytes(self):
+        """Total number of bytes of the array and the WKB values."""
+        return self.values.nbytes + int(self.element_nbytes().sum())
+
+    def element_nbytes(self):
+        """Return the number of bytes used by each WKB value."""
+        return np.array([sys.getsizeof(value) if value is not None else 0
+                         for value in self.values], dtype=np.int64)
+
+    def take(self, indices):
+        """
+        Return the values at ``indices`` (with -1 for missing values),
+        keeping the information already read from them.
+        """
+        result = WKBBuffers(np.append(self.values, [None])[indices])
+        if self._info is not None:
+            fills = (MISSING, False, 0, np.nan)
+            result._info = tuple(
+                take_filled(info, indices, fill)
+                for info, fill in zip(self._info, fills))
+        return result
+
+    @classmethod
+    def concat(cls, to_concat):
+        """
+        Concatenate a sequence of WKB buffers, keeping the information
+        already read from all of them.
+        """
+        result = cls(np.concatenate([b.values for b in to_concat]))
+        if all(buffers._info is not None for buffers in to_concat):
+            result._info = tuple(
+                np.concatenate(info)
+                for info in zip(*[buffers._info for buffers in to_concat]))
+        return result
+
+    def get(self, i):
+        """Parse the i-th geometry as a Shapely object."""
+        from shapely.geos import WKBReader, lgeos
+
+        value = self.values[i]
+        if value is None:
+            return None
+        return WKBReader(lgeos).read(value)
+
+    def to_shapely(self, n_jobs=1, chunksize=None):
+        """Parse all geometries as a 1D object array."""
+        from shapely.geos import WKBReader, lgeos
+
+        values = self.values
+        out = np.empty(len(self), dtype=object)
+
+        def parse(start, stop):
+            reader = WKBReader(lgeos)
+            for idx in range(start, stop):
+                value = values[idx]
+                if value is not None:
+                    out[idx] = reader.read(value)
+
+        run_chunked(parse, len(self), n_jobs=n_jobs, chunksize=chunksize)
+        return out
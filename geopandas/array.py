@@ -1,11 +1,68 @@
+from collections import OrderedDict
+import binascii
+import itertools
+import numbers
+import re
+import threading
 import warnings
 
 import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray, ExtensionDtype, register_extension_dtype)
 
 from shapely.geometry.base import BaseGeometry
 import shapely.geometry
 import shapely.ops
 import shapely.affinity
+import shapely.prepared
+
+import six
+
+from ._coords import (
+    CoordinateBuffers, PointBuffers, QuantizedBuffers, GEOMETRY_TYPES, POINT,
+    GEOMETRYCOLLECTION, MISSING, SHAPELY_OBJECT_NBYTES, GEOS_GEOMETRY_NBYTES,
+    GEOS_COORDINATE_NBYTES, geometry_type_codes, geos_counts)
+from ._config import options
+from ._interned import InternedBuffers
+from ._parallel import _get_n_jobs, run_chunked
+from ._wkb import WKBBuffers
+
+
+class GeometryDtype(ExtensionDtype):
+    type = BaseGeometry
+    name = 'geometry'
+    na_value = None
+
+    @classmethod
+    def construct_from_string(cls, string):
+        if string == cls.name:
+            return cls()
+        else:
+            raise TypeError("Cannot construct a '{}' from '{}'".format(
+                cls, string))
+
+    @classmethod
+    def construct_array_type(cls):
+        return GeometryArray
+
+
+register_extension_dtype(GeometryDtype)
+
+
+def _isna(value):
+    """
+    Check if scalar value is NA-like (None or np.nan).
+
+    Custom version that only works for scalars (returning True or False),
+    as `pd.isna` also works for array-like input returning a boolean array.
+    """
+    if value is None:
+        return True
+    elif isinstance(value, float) and np.isnan(value):
+        return True
+    else:
+        return False
 
 
 # -----------------------------------------------------------------------------
@@ -13,11 +70,40 @@ import shapely.affinity
 # -----------------------------------------------------------------------------
 
 
-def from_shapely(data):
+_STORAGES = ['object', 'coords', 'points', 'float32', 'quantized', 'wkb',
+             'interned']
+
+
+def from_shapely(data, storage='object', scale=None):
     """
     Convert a list or array of shapely objects to a GeometryArray.
 
     Validates the elements.
+
+    Parameters
+    ----------
+    data : list or array of shapely objects
+    storage : {'object', 'coords', 'points'}, default 'object'
+        How the geometries are held in memory. With 'object', as an array
+        of Shapely objects. With 'coords', as contiguous coordinate and
+        offset buffers, from which the Shapely objects are only
+        materialized when needed. 'points' is a specialization of the
+        latter for arrays consisting only of Points, storing the x, y (and
+        z) coordinates as separate arrays.
+        'float32' and 'quantized' are variants of 'coords' with a reduced
+        precision, storing the coordinates relative to the minimum as
+        float32, or as int32 positions on a grid of size ``scale``. Values
+        that are set are encoded with the same precision, on the grid of
+        the other coordinates (which are only encoded again if the new
+        values fall outside of its int32 range or add a z dimension).
+        Setting values still copies the buffers, so set many values at
+        once rather than in a loop.
+        With 'wkb', as WKB values that are only parsed when needed (see
+        :func:`from_wkb`). With 'interned', repeated geometries are stored
+        once, as unique geometries and an integer code per element.
+    scale : float or sequence of float, optional
+        The grid size for every dimension of the 'quantized' storage. By
+        default, the extent of the coordinates is divided in 2**30 steps.
     """
     n = len(data)
 
@@ -30,11 +116,32 @@ def from_shapely(data):
         elif hasattr(geom, '__geo_interface__'):
             geom = shapely.geometry.asShape(geom)
             out.append(geom)
-        elif geom is None or (isinstance(geom, float) and np.isnan(geom)):
+        elif _isna(geom):
             out.append(None)
+        else:
+            raise TypeError(
+                "Input must be valid geometry objects: {0}".format(geom))
 
-    out = np.array(out, dtype=object)
-    return GeometryArray(out)
+    aout = np.empty(n, dtype=object)
+    aout[:] = out
+    out = aout
+    return GeometryArray(out).to_storage(storage, scale=scale)
+
+
+def _intern(geoms):
+    """
+    Return the interned storage of a GeometryArray, identifying the equal
+    geometries by hashing their WKB.
+    """
+    keys = to_wkb(geoms)
+    # all empty geometries have the same WKB, keep them apart per type
+    empty = geoms._masks()[1]
+    keys[empty] = geoms.type_codes[empty]
+    # (the codes are in order of first occurrence, and -1 for None)
+    codes = pd.factorize(keys)[0].astype(np.int32)
+    unique_codes, first = np.unique(codes, return_index=True)
+    categories = geoms[first[unique_codes >= 0]]
+    return InternedBuffers(categories, codes)
 
 
 def to_shapely(geoms):
@@ -46,75 +153,239 @@ def to_shapely(geoms):
     return geoms.data
 
 
-def from_wkb(data):
+def _serialized_values(data):
     """
-    Convert a list or array of WKB objects to a GeometryArray.
+    Return WKB or WKT input as a 1D array, keeping fixed-width byte and
+    string arrays as is (a list of bytes would otherwise be converted to
+    such an array by numpy, which strips trailing null bytes).
     """
-    import shapely.wkb
-
-    n = len(data)
+    if isinstance(data, np.ndarray):
+        return data
+    if isinstance(data, (pd.Series, pd.Index)):
+        return data.values
+    out = np.empty(len(data), dtype=object)
+    out[:] = list(data)
+    return out
 
-    out = []
 
-    for idx in range(n):
-        geom = data[idx]
-        if geom is not None and len(geom):
-            geom = shapely.wkb.loads(geom)
+def _wkb_values(data):
+    """
+    Normalize WKB input to an object array of bytes, with None for missing
+    values (hex encoded values are decoded).
+    """
+    data = _serialized_values(data)
+    # numpy strips trailing null bytes from the elements of fixed-width
+    # byte arrays, which can be part of the WKB
+    itemsize = data.dtype.itemsize if data.dtype.kind == 'S' else None
+    out = np.empty(len(data), dtype=object)
+    for idx, value in enumerate(data):
+        if _isna(value) or not len(value):
+            continue
+        if isinstance(value, six.text_type):
+            value = binascii.unhexlify(value.encode('ascii'))
         else:
-            geom = None
-        out.append(geom)
+            if not isinstance(value, bytes):
+                value = bytes(value)
+            if value[:1] == b'0':
+                # hex encoded (binary WKB starts with a 0 or 1 byte)
+                value = binascii.unhexlify(value)
+            elif itemsize is not None:
+                value = value.ljust(itemsize, b'\x00')
+        out[idx] = value
+    return out
+
+
+def from_wkb(data, n_jobs=1, chunksize=None, storage='object'):
+    """
+    Convert a list or array of WKB objects to a GeometryArray.
 
-    out = np.array(out, dtype=object)
-    return GeometryArray(out)
+    Parameters
+    ----------
+    data : array-like
+        WKB values as bytes (or buffer / memoryview objects) or as hex
+        encoded strings, either in an object array or a fixed-width bytes
+        or string array. None, NaN and empty values result in missing
+        geometries.
+    n_jobs : int, default 1
+        Number of threads used to decode the values (-1 to use all CPUs).
+    chunksize : int, optional
+        Number of values decoded per batch. By default, the values are
+        divided evenly over the threads.
+    storage : str, default 'object'
+        How the geometries are held in memory, see :func:`from_shapely`.
+        With 'wkb', the values are not parsed: the Shapely objects are only
+        created when they are accessed, and the bounds, types and masks are
+        read from the WKB directly. Writing the array back to WKB then
+        returns the original values.
+    """
+    buffers = WKBBuffers(_wkb_values(data))
+    if storage == 'wkb':
+        return GeometryArray(buffers)
+    data = buffers.to_shapely(n_jobs=n_jobs, chunksize=chunksize)
+    return GeometryArray(data).to_storage(storage)
 
 
-def to_wkb(geoms):
+def to_wkb(geoms, hex=False, n_jobs=1, chunksize=None):
     """
     Convert GeometryArray to a numpy object array of WKB objects.
+
+    Parameters
+    ----------
+    geoms : GeometryArray
+    hex : bool, default False
+        If True, return hex encoded strings instead of bytes.
+    n_jobs : int, default 1
+        Number of threads used to encode the geometries (-1 to use all
+        CPUs).
+    chunksize : int, optional
+        Number of geometries encoded per batch. By default, the geometries
+        are divided evenly over the threads.
     """
+    from shapely.geos import WKBWriter, lgeos
+
     if not isinstance(geoms, GeometryArray):
         raise ValueError("'geoms' must be a GeometryArray")
-    out = [geom.wkb if geom is not None else None for geom in geoms]
-    return np.array(out, dtype=object)
+    if geoms.storage == 'wkb':
+        # return the stored values without a round-trip through GEOS
+        values = geoms._coords.values
+        if not hex:
+            return values.copy()
+        return np.array(
+            [binascii.hexlify(value).decode('ascii').upper()
+             if value is not None else None for value in values],
+            dtype=object)
+    data = geoms.data
+    out = np.empty(len(data), dtype=object)
 
+    def encode(start, stop):
+        writer = WKBWriter(lgeos)
+        write = writer.write_hex if hex else writer.write
+        for idx in range(start, stop):
+            geom = data[idx]
+            out[idx] = write(geom) if geom is not None else None
 
-def from_wkt(data):
+    run_chunked(encode, len(data), n_jobs=n_jobs, chunksize=chunksize)
+    return out
+
+
+# number of values read at once from an iterator in from_wkt
+_WKT_ITER_CHUNKSIZE = 100000
+
+
+def from_wkt(data, n_jobs=1, chunksize=None):
     """
     Convert a list or array of WKT objects to a GeometryArray.
-    """
-    import shapely.wkt
 
+    Parameters
+    ----------
+    data : array-like or iterable
+        WKT values as str or (utf-8 encoded) bytes. None, NaN and empty
+        values result in missing geometries. When an iterator is passed
+        (e.g. a column streamed from a CSV file), the values are consumed
+        and parsed in batches of ``chunksize`` values.
+    n_jobs : int, default 1
+        Number of threads used to parse the values (-1 to use all CPUs).
+    chunksize : int, optional
+        Number of values parsed per batch. By default, the values are
+        divided evenly over the threads (or read in batches of 100,000
+        values from an iterator).
+    """
+    from shapely.geos import WKTReader, lgeos
+
+    if not hasattr(data, '__len__'):
+        data = iter(data)
+        batchsize = chunksize or _WKT_ITER_CHUNKSIZE
+        arrays = []
+        while True:
+            batch = list(itertools.islice(data, batchsize))
+            if not batch:
+                break
+            arrays.append(from_wkt(batch, n_jobs=n_jobs).data)
+        if not arrays:
+            return GeometryArray(np.array([], dtype=object))
+        return GeometryArray(np.concatenate(arrays))
+
+    data = _serialized_values(data)
     n = len(data)
+    out = np.empty(n, dtype=object)
+
+    def parse(start, stop):
+        reader = WKTReader(lgeos)
+        for idx in range(start, stop):
+            geom = data[idx]
+            if _isna(geom) or not len(geom):
+                geom = None
+            else:
+                if isinstance(geom, bytes):
+                    geom = geom.decode('utf-8')
+                geom = reader.read(geom)
+            out[idx] = geom
 
-    out = []
+    run_chunked(parse, n, n_jobs=n_jobs, chunksize=chunksize)
+    return GeometryArray(out)
 
-    for idx in range(n):
-        geom = data[idx]
-        if geom is not None and len(geom):
-            if isinstance(geom, bytes):
-                geom = geom.decode('utf-8')
-            geom = shapely.wkt.loads(geom)
-        else:
-            geom = None
-        out.append(geom)
 
-    out = np.array(out, dtype=object)
-    return GeometryArray(out)
+_WKT_TRAILING_ZEROS = re.compile(r'(\.\d*?)0+(?=[ ,)])')
+
 
+def _trim_wkt(wkt):
+    """Remove trailing zeros (and dangling decimal points) from numbers."""
+    return _WKT_TRAILING_ZEROS.sub(r'\1', wkt).replace('. ', ' ').replace(
+        '.,', ',').replace('.)', ')')
 
-def to_wkt(geoms):
+
+def to_wkt(geoms, rounding_precision=None, n_jobs=1, chunksize=None):
     """
     Convert GeometryArray to a numpy object array of WKT objects.
+
+    Parameters
+    ----------
+    geoms : GeometryArray
+    rounding_precision : int, optional
+        If given, round the coordinates to this number of decimals (with
+        trailing zeros removed), to reduce the size of the output.
+    n_jobs : int, default 1
+        Number of threads used to serialize the geometries (-1 to use all
+        CPUs).
+    chunksize : int, optional
+        Number of geometries serialized per batch. By default, the
+        geometries are divided evenly over the threads.
     """
+    from shapely.geos import WKTWriter, lgeos
+
     if not isinstance(geoms, GeometryArray):
         raise ValueError("'geoms' must be a GeometryArray")
-    out = [geom.wkt if geom is not None else None for geom in geoms]
-    return np.array(out, dtype=object)
+    data = geoms.data
+    out = np.empty(len(data), dtype=object)
+
+    def serialize(start, stop):
+        if rounding_precision is None:
+            writer = WKTWriter(lgeos)
+            write = writer.write
+        else:
+            # GEOS (< 3.7) interprets the precision as significant digits
+            # when trimming, so write fixed decimals and trim afterwards
+            writer = WKTWriter(lgeos, trim=False,
+                               rounding_precision=rounding_precision)
+
+            def write(geom):
+                return _trim_wkt(writer.write(geom))
+
+        for idx in range(start, stop):
+            geom = data[idx]
+            out[idx] = write(geom) if geom is not None else None
+
+    run_chunked(serialize, len(data), n_jobs=n_jobs, chunksize=chunksize)
+    return out
 
 
-def _points_from_xy(x, y, z=None):
+def points_from_xy(x, y, z=None):
     """
-    Generate list of shapely Point geometries from x, y(, z) coordinates.
+    Convert arrays of x and y values to a GeometryArray of points.
+
+    The coordinates are stored as float64 arrays (without copying them if
+    they are already float64 arrays); the Point objects are only created
+    when needed.
 
     Parameters
     ----------
@@ -129,28 +400,17 @@ def _points_from_xy(x, y, z=None):
 
     Returns
     -------
-    list : list
+    output : GeometryArray
     """
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
     if not len(x) == len(y):
         raise ValueError("x and y arrays must be equal length.")
     if z is not None:
+        z = np.asarray(z, dtype='float64')
         if not len(z) == len(x):
             raise ValueError("z array must be same length as x and y.")
-        geom = [shapely.geometry.Point(i, j, k) for i, j, k in zip(x, y, z)]
-    else:
-        geom = [shapely.geometry.Point(i, j) for i, j in zip(x, y)]
-    return geom
-
-
-def points_from_xy(x, y, z=None):
-    """Convert arrays of x and y values to a GeometryArray of points."""
-    x = np.asarray(x, dtype='float64')
-    y = np.asarray(y, dtype='float64')
-    if z is not None:
-        z = np.asarray(z, dtype='float64')
-    out = _points_from_xy(x, y, z)
-    out = np.array(out, dtype=object)
-    return GeometryArray(out)
+    return GeometryArray(PointBuffers(x, y, z))
 
 
 # -----------------------------------------------------------------------------
@@ -158,7 +418,49 @@ def points_from_xy(x, y, z=None):
 # -----------------------------------------------------------------------------
 
 
-def _binary_geo(op, left, right):
+# minimum number of elements per chunk when an element-wise operation is
+# run on multiple threads (smaller arrays are not worth the overhead)
+_MIN_CHUNKSIZE = 100
+
+
+def _map_elements(func, n, dtype=object, n_jobs=None):
+    """
+    Return an array with ``func(i)`` for every ``i`` in ``range(n)``.
+
+    The elements are computed in chunks on ``n_jobs`` threads, defaulting to
+    ``geopandas.options.n_jobs``. Each result is assigned individually,
+    so geometries are never coerced to coordinate arrays by numpy.
+    """
+    if n_jobs is None:
+        n_jobs = options.n_jobs
+    out = np.empty(n, dtype=dtype)
+
+    def compute(start, stop):
+        for i in range(start, stop):
+            out[i] = func(i)
+
+    n_jobs = _get_n_jobs(n_jobs)
+    chunksize = max(-(-n // n_jobs), _MIN_CHUNKSIZE)
+    run_chunked(compute, n, n_jobs=n_jobs, chunksize=chunksize)
+    return out
+
+
+def _map_valid(func, valid, dtype=object, null_value=None, n_jobs=None):
+    """
+    Like ``_map_elements``, but only calling ``func(i)`` where the boolean
+    array ``valid`` is True and filling ``null_value`` elsewhere.
+    """
+    if valid.all():
+        return _map_elements(func, len(valid), dtype=dtype, n_jobs=n_jobs)
+    out = np.empty(len(valid), dtype=dtype)
+    out[~valid] = null_value
+    idx = np.flatnonzero(valid)
+    out[idx] = _map_elements(lambda j: func(idx[j]), len(idx), dtype=dtype,
+                             n_jobs=n_jobs)
+    return out
+
+
+def _binary_geo(op, left, right, n_jobs=None):
     # type: (str, GeometryArray, [GeometryArray/BaseGeometry]) -> GeometryArray
     """ Apply geometry-valued operation
 
@@ -173,12 +475,14 @@ def _binary_geo(op, left, right):
     ----------
     op: string
     right: GeometryArray or single shapely BaseGeoemtry
+    n_jobs: int, optional
+        Number of threads, defaults to ``geopandas.options.n_jobs``.
     """
     if isinstance(right, BaseGeometry):
-        # intersection can return empty GeometryCollections, and if the
-        # result are only those, numpy will coerce it to empty 2D array
-        data = np.empty(len(left), dtype=object)
-        data[:] = [getattr(s, op)(right) for s in left.data]
+        left_data = left.data
+        data = _map_valid(
+            lambda i: getattr(left_data[i], op)(right), ~left._masks()[0],
+            n_jobs=n_jobs)
         return GeometryArray(data)
     elif isinstance(right, GeometryArray):
         if len(left) != len(right):
@@ -186,19 +490,88 @@ def _binary_geo(op, left, right):
                 "Lengths of inputs to not match. "
                 "Left: {0}, Right: {1}".format(len(left), len(right)))
             raise ValueError(msg)
-        data = np.empty(len(left), dtype=object)
-        data[:] = [getattr(this_elem, op)(other_elem)
-                   for this_elem, other_elem in zip(left.data, right.data)]
+        left_data, right_data = left.data, right.data
+        valid = ~(left._masks()[0] | right._masks()[0])
+        data = _map_valid(
+            lambda i: getattr(left_data[i], op)(right_data[i]), valid,
+            n_jobs=n_jobs)
         return GeometryArray(data)
     else:
         raise TypeError(
             "Type not known: {0} vs {1}".format(type(left), type(right)))
 
 
+# prepared versions of the scalar geometries recently used in predicates,
+# keyed by object identity (least recently used first)
+_PREPARED_CACHE = OrderedDict()
+_PREPARED_CACHE_SIZE = 8
+
+# predicates ``geom.<op>(other)`` that can be evaluated with the prepared
+# ``other`` as ``prepared.<method>(geom)`` (covers has no prepared converse)
+_PREPARED_PREDICATES = {
+    'intersects': 'intersects',
+    'disjoint': 'disjoint',
+    'touches': 'touches',
+    'crosses': 'crosses',
+    'overlaps': 'overlaps',
+    'contains': 'within',
+    'within': 'contains',
+}
+
+
+def _prepared(geom):
+    """
+    Return the prepared version of a geometry, reusing it when the same
+    geometry object was recently prepared.
+    """
+    key = id(geom)
+    cached = _PREPARED_CACHE.pop(key, None)
+    # the cache keeps a reference to the geometry, so its id cannot be
+    # reused by another object while cached, but check anyway
+    if cached is not None and cached[0] is geom:
+        prepared = cached[1]
+    else:
+        prepared = shapely.prepared.prep(geom)
+    _PREPARED_CACHE[key] = (geom, prepared)
+    while len(_PREPARED_CACHE) > _PREPARED_CACHE_SIZE:
+        _PREPARED_CACHE.popitem(last=False)
+    return prepared
+
+
+def _prepared_predicate(op, geom, n_jobs=None):
+    """
+    Return a function evaluating ``other.<op>(geom)`` using the prepared
+    version of ``geom``.
+    """
+    method = _PREPARED_PREDICATES[op]
+    if n_jobs is None:
+        n_jobs = options.n_jobs
+    if _get_n_jobs(n_jobs) == 1:
+        prepared = _prepared(geom)
+        return getattr(prepared, method)
+
+    # GEOS builds the indices of a prepared geometry lazily, which is not
+    # thread-safe, so every thread uses its own prepared geometry
+    local = threading.local()
+
+    def predicate(other):
+        prepared = getattr(local, 'prepared', None)
+        if prepared is None:
+            prepared = local.prepared = shapely.prepared.prep(geom)
+        return getattr(prepared, method)(other)
+
+    return predicate
+
+
 def _binary_op(op, left, right, *args, **kwargs):
     # type: (str, GeometryArray, GeometryArray/BaseGeometry, args/kwargs)
     #        -> array
     """Binary operation on GeometryArray that returns a ndarray"""
+    n_jobs = kwargs.pop('n_jobs', None)
+    if op == 'distance':
+        distance = _point_distance(left, right)
+        if distance is not None:
+            return distance
     if op in ['distance', 'project']:
         null_value = np.nan
     elif op == 'relate':
@@ -213,58 +586,331 @@ def _binary_op(op, left, right, *args, **kwargs):
         dtype = bool
 
     if isinstance(right, BaseGeometry):
-        data = [
-            getattr(s, op)(right, *args, **kwargs) if s else null_value
-            for s in left.data]
-        return np.array(data, dtype=dtype)
+        left_data = left.data
+        if op in _PREPARED_PREDICATES:
+            predicate = _prepared_predicate(op, right, n_jobs)
+        else:
+            def predicate(s):
+                return getattr(s, op)(right, *args, **kwargs)
+
+        def func(i):
+            return predicate(left_data[i])
+
+        # missing and empty geometries get the null value
+        left_missing, left_empty = left._masks()
+        valid = ~(left_missing | left_empty)
+        # empty geometries have no bounds to filter on
+        right_bounds = np.array(right.bounds) if not right.is_empty else None
     elif isinstance(right, GeometryArray):
         if len(left) != len(right):
             msg = (
                 "Lengths of inputs to not match. "
                 "Left: {0}, Right: {1}".format(len(left), len(right)))
             raise ValueError(msg)
-        data = [
-            getattr(this_elem, op)(other_elem, *args, **kwargs)
-            if not this_elem.is_empty | other_elem.is_empty else null_value
-            for this_elem, other_elem in zip(left.data, right.data)]
-        return np.array(data, dtype=dtype)
+        left_data, right_data = left.data, right.data
+
+        def func(i):
+            return getattr(left_data[i], op)(right_data[i], *args, **kwargs)
+
+        # pairs with a missing or empty geometry get the null value
+        left_missing, left_empty = left._masks()
+        right_missing, right_empty = right._masks()
+        valid = ~(left_missing | left_empty | right_missing | right_empty)
+        right_bounds = right.bounds
     else:
         raise TypeError(
             "Type not known: {0} vs {1}".format(type(left), type(right)))
 
+    if op not in _BBOX_PREDICATES or right_bounds is None:
+        return _map_valid(func, valid, dtype=dtype, null_value=null_value,
+                          n_jobs=n_jobs)
+
+    # only call GEOS for the pairs of which the bounding boxes do not already
+    # determine the result
+    candidates = valid & _bbox_candidates(op, left.bounds, right_bounds)
+    if op == 'disjoint':
+        # geometries with disjoint bounding boxes are disjoint
+        out = valid & ~candidates
+    else:
+        out = np.zeros(len(left), dtype=bool)
+    idx = np.flatnonzero(candidates)
+    out[idx] = _map_elements(lambda j: func(idx[j]), len(idx), dtype=dtype,
+                             n_jobs=n_jobs)
+    return out
+
+
+# predicates that are always False (True for disjoint) for geometries of
+# which the bounding boxes do not intersect
+_BBOX_PREDICATES = ['intersects', 'disjoint', 'touches', 'crosses',
+                    'overlaps', 'contains', 'within', 'covers', 'equals']
+
+
+def _bbox_candidates(op, left_bounds, right_bounds):
+    """
+    Return a boolean mask of the elements of which the bounding boxes
+    allow ``op`` to be True (or False for disjoint).
+
+    ``left_bounds`` is a (N, 4) array of bounds, ``right_bounds`` either also
+    a (N, 4) array or the (4, ) bounds of a single geometry. NaN bounds
+    (missing or empty geometries) never are a candidate.
+    """
+    lminx, lminy, lmaxx, lmaxy = (left_bounds[:, i] for i in range(4))
+    rminx, rminy, rmaxx, rmaxy = (right_bounds[..., i] for i in range(4))
+    with np.errstate(invalid='ignore'):
+        if op in ('contains', 'covers'):
+            # the right bounding box has to lie within the left one
+            return ((lminx <= rminx) & (lminy <= rminy)
+                    & (lmaxx >= rmaxx) & (lmaxy >= rmaxy))
+        elif op == 'within':
+            return ((lminx >= rminx) & (lminy >= rminy)
+                    & (lmaxx <= rmaxx) & (lmaxy <= rmaxy))
+        elif op == 'equals':
+            return ((lminx == rminx) & (lminy == rminy)
+                    & (lmaxx == rmaxx) & (lmaxy == rmaxy))
+        else:
+            return ((lminx <= rmaxx) & (lmaxx >= rminx)
+                    & (lminy <= rmaxy) & (lmaxy >= rminy))
 
-def _unary_geo(op, left, *args, **kwargs):
+
+def _point_distance(left, right):
+    """
+    Distance between Points computed from the coordinates, or None if the
+    operands are not (both) non-empty Points with coordinate storage.
+    """
+    lx, ly = left._point_coordinate(0), left._point_coordinate(1)
+    if lx is None:
+        return None
+    if isinstance(right, GeometryArray):
+        if len(left) != len(right):
+            return None
+        rx, ry = right._point_coordinate(0), right._point_coordinate(1)
+        if rx is None:
+            return None
+    elif (isinstance(right, BaseGeometry) and right.geom_type == 'Point'
+            and not right.is_empty):
+        rx, ry = right.x, right.y
+    else:
+        return None
+    return np.hypot(lx - rx, ly - ry)
+
+
+def _unary_geo(op, left, n_jobs=None):
     # type: (str, GeometryArray) -> GeometryArray
     """Unary operation that returns new geometries"""
-    # ensure 1D output, see note above
-    data = np.empty(len(left), dtype=object)
-    data[:] = [getattr(geom, op) for geom in left.data]
-    return GeometryArray(data)
+    data = left.data
+    return GeometryArray(_map_valid(
+        lambda i: getattr(data[i], op), ~left._masks()[0], n_jobs=n_jobs))
 
 
-def _unary_op(op, left, null_value=False):
+def _unary_op(op, left, null_value=False, n_jobs=None):
     # type: (str, GeometryArray, Any) -> array
     """Unary operation that returns a Series"""
-    data = [getattr(geom, op, null_value) for geom in left.data]
-    return np.array(data, dtype=np.dtype(type(null_value)))
+    data = left.data
+    return _map_valid(
+        lambda i: getattr(data[i], op, null_value), ~left._masks()[0],
+        dtype=np.dtype(type(null_value)), null_value=null_value,
+        n_jobs=n_jobs)
 
 
-def _affinity_method(op, left, *args, **kwargs):
-    # type: (str, GeometryArray, ...) -> GeometryArray
-    data = [getattr(shapely.affinity, op)(s, *args, **kwargs)
-            for s in left.data]
-    return GeometryArray(np.array(data, dtype=object))
+def _affine_matrix(matrix, n):
+    """
+    Normalize an affine transformation matrix to the 12 coefficients of the
+    3D form ``[a, b, c, d, e, f, g, h, i, xoff, yoff, zoff]``.
+
+    ``matrix`` holds 6 (2D) or 12 (3D) coefficients, or is an array of
+    shape (n, 6) or (n, 12) with a matrix for each geometry. Returns an
+    array of shape (12,) or (n, 12).
+    """
+    matrix = np.asarray(matrix, dtype='float64')
+    if matrix.ndim not in (1, 2) or matrix.shape[-1] not in (6, 12):
+        raise ValueError("'matrix' expects either 6 or 12 coefficients")
+    if matrix.ndim == 2 and matrix.shape[0] != n:
+        raise ValueError(
+            "Length of 'matrix' ({0}) does not match the length of the "
+            "array ({1})".format(matrix.shape[0], n))
+    if matrix.shape[-1] == 6:
+        a, b, d, e, xoff, yoff = np.moveaxis(matrix, -1, 0)
+        zero, one = np.zeros_like(a), np.ones_like(a)
+        matrix = np.stack([a, b, zero, d, e, zero, zero, zero, one,
+                           xoff, yoff, zero], axis=-1)
+    return matrix
+
+
+def _stack_matrix(*coefficients):
+    """
+    Stack scalar or per-geometry coefficients into a (12,) or (n, 12)
+    matrix.
+    """
+    coefficients = np.broadcast_arrays(
+        *[np.asarray(c, dtype='float64') for c in coefficients])
+    return np.stack(coefficients, axis=-1)
 
 
-class GeometryArray:
+def _affine_coords(coords, matrix, counts=None):
+    """
+    Apply the (12,) or (n, 12) ``matrix`` to a (N, 2) or (N, 3) coordinate
+    array. For per-geometry matrices, ``counts`` gives the number of
+    coordinates of each geometry.
+
+    NaN z values (2D geometries mixed with 3D ones) are treated as 0 for
+    the x and y coordinates and remain NaN.
+    """
+    if matrix.ndim == 2 and counts is not None:
+        matrix = np.repeat(matrix, counts, axis=0)
+    ndim = coords.shape[1]
+    # linear part as (..., 3, 3) with rows the new x, y, z
+    linear = matrix[..., :9].reshape(matrix.shape[:-1] + (3, 3))
+    offset = matrix[..., 9:9 + ndim]
+    xyz = coords
+    if ndim == 3:
+        xyz = coords.copy()
+        np.copyto(xyz[:, 2], 0.0, where=np.isnan(xyz[:, 2]))
+    linear = linear[..., :ndim, :ndim]
+    if linear.ndim == 2:
+        result = np.dot(xyz, linear.T) + offset
+    else:
+        result = np.einsum('nij,nj->ni', linear, xyz) + offset
+    if ndim == 3:
+        result[np.isnan(coords[:, 2]), 2] = np.nan
+    return result
+
+
+def _affine_transform(left, matrix):
+    """
+    Apply an affine transformation (normalized by ``_affine_matrix``) to all
+    coordinates of the geometries at once.
+    """
+    try:
+        buffers = left._buffers()
+    except ValueError:
+        # GeometryCollections can't be stored in coordinate buffers
+        data = left.data
+
+        def transform(i):
+            m = matrix if matrix.ndim == 1 else matrix[i]
+            return shapely.ops.transform(
+                lambda *xyz: tuple(_affine_coords(np.column_stack(xyz), m).T),
+                data[i])
+
+        return GeometryArray(_map_valid(transform, ~left._masks()[0]))
+
+    counts = None
+    if matrix.ndim == 2:
+        counts = np.diff(buffers.coord_offsets())
+    coords = _affine_coords(buffers.coords, matrix, counts)
+    result = GeometryArray(buffers.with_coords(coords))
+    # the type and the missing and empty masks don't change
+    result._missing, result._empty = left._masks()
+    result._type_codes = left.type_codes
+    return result
+
+
+def _origin(left, origin):
+    """
+    Interpret the 'origin' keyword of rotate/scale/skew as x0, y0 and z0
+    coordinates, which are arrays for 'center' and 'centroid'.
+    """
+    if isinstance(origin, six.string_types):
+        if origin == 'center':
+            # bounding box center
+            b = left.bounds
+            return (b[:, 0] + b[:, 2]) / 2.0, (b[:, 1] + b[:, 3]) / 2.0, 0.0
+        elif origin == 'centroid':
+            xy = _centroid_coords(left)
+            return xy[:, 0], xy[:, 1], 0.0
+        raise ValueError("'origin' keyword %r is not recognized" % origin)
+    if isinstance(origin, BaseGeometry) and origin.type == 'Point':
+        origin = origin.coords[0]
+    if len(origin) not in (2, 3):
+        raise ValueError("Expected number of items in 'origin' to be "
+                         "either 2 or 3")
+    if len(origin) == 2:
+        return origin[0], origin[1], 0.0
+    return tuple(origin)
+
+
+def _trig(angle, func, use_radians):
+    """``func`` of an angle, with values close to 0 snapped to 0."""
+    angle = np.asarray(angle, dtype='float64')
+    if not use_radians:
+        angle = np.deg2rad(angle)
+    value = func(angle)
+    return np.where(np.abs(value) < 2.5e-16, 0.0, value)
+
+
+def _use_kernels(left):
+    """
+    Whether to compute the planar metrics with the numpy kernels on the
+    coordinate buffers (see the ``engine`` option).
+    """
+    return options.engine == 'numpy' and isinstance(
+        left._coords, (CoordinateBuffers, PointBuffers))
+
+
+def _centroid_coords(left):
+    """
+    Centroids of the geometries as (N, 2) array, with NaN rows for missing
+    and empty geometries.
+
+    The numpy kernels are used when enabled, and GEOS for the other
+    geometries (or the degenerate cases the kernels don't handle).
+    """
+    if _use_kernels(left):
+        xy = left._coords.centroid()
+    else:
+        xy = np.full((len(left), 2), np.nan)
+    missing, empty = left._masks()
+    for i in np.flatnonzero(np.isnan(xy[:, 0]) & ~(missing | empty)):
+        centroid = left[i].centroid
+        if not centroid.is_empty:
+            xy[i] = centroid.coords[0][:2]
+    return xy
+
+
+def _shapely_bounds(data):
+    """
+    Bounds of an object array of Shapely geometries as a (N, 4) float array,
+    with NaN rows for missing and empty geometries.
+    """
+    bounds = np.full((len(data), 4), np.nan)
+    for i, geom in enumerate(data):
+        if geom is not None and not geom.is_empty:
+            bounds[i] = geom.bounds
+    return bounds
+
+
+class GeometryArray(ExtensionArray):
     """
     Class wrapping a numpy array of Shapely objects and
     holding the array-based implementations.
+
+    It is registered as pandas extension array with the ``geometry`` dtype,
+    so GeoSeries and the geometry column of a GeoDataFrame hold it directly.
+
+    The geometries can alternatively be backed by flat coordinate buffers
+    (see ``geopandas._coords``) or by WKB values (see ``geopandas._wkb``),
+    in which case the array of Shapely objects is only created when it is
+    first accessed.
     """
 
+    _dtype = GeometryDtype()
+
+    # read-only per-element arrays that are computed on first use, and are
+    # carried along when indexing, taking or concatenating
+    _cached = ('_bounds', '_missing', '_empty', '_type_codes', '_has_z',
+               '_geos_counts')
+
     def __init__(self, data):
+        self._coords = None
+        self._clear_cache()
         if isinstance(data, self.__class__):
-            data = data.data
+            self._coords = data._coords
+            self._set_cache(data)
+            data = data._data
+        elif isinstance(data, (CoordinateBuffers, PointBuffers, WKBBuffers,
+                               InternedBuffers)):
+            self._coords = data
+            data = None
         elif not isinstance(data, np.ndarray):
             raise ValueError(
                 "'data' should be array of geometry objects. Use from_shapely,"
@@ -272,14 +918,252 @@ class GeometryArray:
         elif not data.ndim == 1:
             raise ValueError(
                 "'data' should be a 1-dimensional array of geometry objects.")
-        self.data = data
+        self._data = data
 
-    def __len__(self):
-        return len(self.data)
+    @property
+    def data(self):
+        """1-dimensional numpy object array of the Shapely geometries"""
+        if self._data is None:
+            self._data = self._coords.to_shapely()
+        return self._data
+
+    @property
+    def storage(self):
+        """
+        How the geometries are stored: 'object', 'coords', 'points',
+        'float32', 'quantized', 'wkb' or 'interned'
+        """
+        if isinstance(self._coords, PointBuffers):
+            return 'points'
+        elif isinstance(self._coords, WKBBuffers):
+            return 'wkb'
+        elif isinstance(self._coords, InternedBuffers):
+            return 'interned'
+        elif isinstance(self._coords, QuantizedBuffers):
+            if self._coords.dtype == np.float32:
+                return 'float32'
+            return 'quantized'
+        elif self._coords is not None:
+            return 'coords'
+        return 'object'
+
+    def to_storage(self, storage, scale=None):
+        """
+        Return a GeometryArray with the geometries held in a given storage.
+
+        Parameters
+        ----------
+        storage : {'object', 'coords', 'points', 'float32', 'quantized', \
+'wkb', 'interned'}
+            See :func:`from_shapely`.
+        scale : float or sequence of float, optional
+            The grid size of the 'quantized' storage.
+        """
+        if storage not in _STORAGES:
+            raise ValueError(
+                "storage should be one of {0}, got '{1}'".format(
+                    _STORAGES, storage))
+        if storage == self.storage and (
+                scale is None or storage != 'quantized'):
+            return self
+        if storage == 'points':
+            return GeometryArray(PointBuffers.from_shapely(self.data))
+        elif storage == 'object':
+            return GeometryArray(self.data)
+        elif storage == 'wkb':
+            return GeometryArray(WKBBuffers(to_wkb(self)))
+        elif storage == 'interned':
+            return GeometryArray(_intern(self))
+
+        buffers = self._coords
+        if isinstance(buffers, CoordinateBuffers):
+            # convert between the coordinate buffers without materializing
+            buffers = CoordinateBuffers(
+                buffers.coords, buffers.ring_offsets, buffers.part_offsets,
+                buffers.geom_offsets, buffers.type_codes, buffers.has_z)
+        else:
+            buffers = CoordinateBuffers.from_shapely(self.data)
+        if storage == 'float32':
+            buffers = QuantizedBuffers.encode(buffers, 'float32')
+        elif storage == 'quantized':
+            buffers = QuantizedBuffers.encode(buffers, 'int32', scale=scale)
+        return GeometryArray(buffers)
+
+    @property
+    def dtype(self):
+        return self._dtype
 
-    def __getitem__(self, i):
-        assert isinstance(i, int)
-        return self.data[i]
+    def __len__(self):
+        if self._data is None:
+            return len(self._coords)
+        return len(self._data)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, numbers.Integral):
+            if self._data is None:
+                n = len(self)
+                if not -n <= idx < n:
+                    raise IndexError(
+                        "index {0} is out of bounds for axis 0 with size "
+                        "{1}".format(idx, n))
+                return self._coords.get(idx % n)
+            return self._data[idx]
+        # array-like, slice
+        if isinstance(idx, list):
+            idx = np.asarray(idx)
+            if not len(idx):
+                # empty list
+                idx = idx.astype(np.intp)
+        if self._subset_buffers():
+            # subset the buffers instead of materializing the geometries
+            positions = np.arange(len(self))[idx]
+            result = GeometryArray(self._coords.take(positions))
+        else:
+            # copy the (view of a) slice, the cached arrays carried over
+            # would otherwise get stale when values are set on the parent
+            result = GeometryArray(self._data[idx].copy())
+        result._set_cache(self, lambda attr, values: values[idx])
+        return result
+
+    def __setitem__(self, key, value):
+        if isinstance(value, pd.Series):
+            value = value.values
+        if isinstance(value, (list, np.ndarray)):
+            value = from_shapely(value)
+        if isinstance(value, GeometryArray):
+            if isinstance(key, numbers.Integral):
+                raise ValueError("cannot set a single element with an array")
+            value = value.data
+        elif isinstance(value, BaseGeometry) or _isna(value):
+            if _isna(value):
+                # internally only use None as missing value indicator
+                # but accept others
+                value = None
+            if not isinstance(key, numbers.Integral):
+                # wrap the scalar, numpy would otherwise try to convert
+                # geometries exposing the array interface
+                scalar, value = value, np.empty(1, dtype=object)
+                value[0] = scalar
+        else:
+            raise TypeError(
+                "Value should be either a BaseGeometry or None, got %s"
+                % str(value))
+        if isinstance(self._coords, QuantizedBuffers):
+            self._set_encoded(key, value)
+        else:
+            self.data[key] = value
+            # the geometries no longer correspond to the coordinate buffers
+            self._coords = None
+        self._clear_cache()
+
+    def _set_encoded(self, key, value):
+        """
+        Set values of an array with a reduced precision, encoding only the
+        new geometries on the grid of the others when they fit (and all
+        geometries again otherwise).
+        """
+        buffers = self._coords
+        positions = np.atleast_1d(np.arange(len(self))[key])
+        values = np.empty(len(positions), dtype=object)
+        if isinstance(key, numbers.Integral):
+            values[0] = value
+        else:
+            values[:] = value
+        try:
+            new = CoordinateBuffers.from_shapely(values)
+        except ValueError:
+            # GeometryCollections, keep the Shapely objects
+            self.data[positions] = values
+            self._coords = None
+            return
+        try:
+            self._coords = buffers.replace(positions, new)
+        except ValueError:
+            if buffers.fixed_scale:
+                raise
+            # a new dimension, or values outside of the int32 range of the
+            # derived scale
+            data = self.data.copy()
+            data[positions] = values
+            self._coords = QuantizedBuffers.encode(
+                CoordinateBuffers.from_shapely(data), buffers.dtype.name)
+        # the Shapely objects are materialized again from the buffers
+        self._data = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self._coords is not None:
+            # only pickle the buffers, the Shapely objects are materialized
+            # again from them when needed
+            state['_data'] = None
+        return state
+
+    def _buffers(self):
+        """
+        Return the coordinate buffers backing the array, or encode them
+        (raises a ValueError if there are GeometryCollections).
+        """
+        if isinstance(self._coords, (CoordinateBuffers, PointBuffers)):
+            return self._coords
+        return CoordinateBuffers.from_shapely(self.data)
+
+    def _subset_buffers(self):
+        """
+        Whether indexing, take and copy operate on the buffers rather than
+        on the Shapely objects: if these are not materialized, and for
+        interned arrays (of which only the codes are taken).
+        """
+        return self._data is None or isinstance(
+            self._coords, InternedBuffers)
+
+    def _clear_cache(self):
+        for attr in self._cached:
+            setattr(self, attr, None)
+
+    def _set_cache(self, other, func=None):
+        """
+        Set the cached arrays of ``other``, transformed with
+        ``func(attr, values)`` if given.
+        """
+        for attr in self._cached:
+            values = getattr(other, attr)
+            if values is not None and func is not None:
+                values = func(attr, values)
+                values.flags.writeable = False
+            setattr(self, attr, values)
+
+    def _compute_cache(self):
+        """Compute all cached arrays."""
+        # the properties compute and cache their array on first access
+        _ = self.bounds, self.type_codes, self.has_z
+        self._masks()
+        self._counts()
+
+    def _masks(self):
+        """
+        Return the (cached) boolean masks of the missing and the empty
+        geometries.
+        """
+        if self._missing is None or self._empty is None:
+            coords = self._coords
+            if isinstance(coords, PointBuffers):
+                missing = np.zeros(len(self), dtype=bool)
+                empty = np.zeros(len(self), dtype=bool)
+            elif isinstance(coords, (WKBBuffers, InternedBuffers)):
+                missing = coords.type_codes == MISSING
+                empty = coords.empty()
+            elif coords is not None:
+                missing = coords.type_codes == MISSING
+                empty = (np.diff(coords.geom_offsets) == 0) & ~missing
+            else:
+                missing = pd.isna(self._data)
+                empty = np.zeros(len(self), dtype=bool)
+                empty[~missing] = [geom.is_empty
+                                   for geom in self._data[~missing]]
+            missing.flags.writeable = False
+            empty.flags.writeable = False
+            self._missing, self._empty = missing, empty
+        return self._missing, self._empty
 
     # -------------------------------------------------------------------------
     # Geometry related methods
@@ -291,7 +1175,7 @@ class GeometryArray:
 
     @property
     def is_empty(self):
-        return _unary_op('is_empty', self, null_value=False)
+        return self._masks()[1].copy()
 
     @property
     def is_simple(self):
@@ -309,18 +1193,64 @@ class GeometryArray:
 
     @property
     def has_z(self):
-        return _unary_op('has_z', self, null_value=False)
+        if self._has_z is None:
+            if self._coords is not None:
+                has_z = self._coords.has_z
+            else:
+                has_z = _unary_op('has_z', self, null_value=False)
+            has_z.flags.writeable = False
+            self._has_z = has_z
+        return self._has_z.copy()
+
+    @property
+    def type_codes(self):
+        """
+        Return the (cached) geometry type codes as uint8 array.
+
+        The codes are the index into ``geopandas._coords.GEOMETRY_TYPES``,
+        or 255 for missing values. Unlike ``geom_type``, empty geometries
+        get the code of their own type.
+        """
+        if self._type_codes is None:
+            if self._coords is not None:
+                codes = self._coords.type_codes
+            else:
+                codes = geometry_type_codes(self._data)
+            codes.flags.writeable = False
+            self._type_codes = codes
+        return self._type_codes
+
+    def _geom_type_codes(self):
+        """
+        Type codes matching ``geom_type``, i.e. with the code of
+        'GeometryCollection' for all empty geometries (as reported by GEOS).
+        """
+        return np.where(self._masks()[1], np.uint8(GEOMETRYCOLLECTION),
+                        self.type_codes)
+
+    def _is_type(self, *codes):
+        """
+        Boolean array indicating the non-empty geometries of the given
+        type codes.
+        """
+        return np.in1d(self._geom_type_codes(), codes)
 
     @property
     def geom_type(self):
-        return _unary_op('geom_type', self, null_value=None)
+        names = np.array(GEOMETRY_TYPES + [None], dtype=object)
+        codes = self._geom_type_codes()
+        return names[np.minimum(codes, len(GEOMETRY_TYPES))]
 
     @property
     def area(self):
+        if _use_kernels(self):
+            return self._coords.area()
         return _unary_op('area', self, null_value=np.nan)
 
     @property
     def length(self):
+        if _use_kernels(self):
+            return self._coords.length()
         return _unary_op('length', self, null_value=np.nan)
 
     #
@@ -333,7 +1263,13 @@ class GeometryArray:
 
     @property
     def centroid(self):
-        return _unary_geo('centroid', self)
+        if not _use_kernels(self):
+            return _unary_geo('centroid', self)
+        xy = _centroid_coords(self)
+        missing = self._masks()[0]
+        if np.isnan(xy[:, 0]).any() or missing.any():
+            return GeometryArray(CoordinateBuffers.from_xy(xy, missing))
+        return GeometryArray(PointBuffers(xy[:, 0], xy[:, 1]))
 
     @property
     def convex_hull(self):
@@ -369,9 +1305,9 @@ class GeometryArray:
 
     def representative_point(self):
         # method and not a property -> can't use _unary_geo
-        data = np.empty(len(self), dtype=object)
-        data[:] = [geom.representative_point() for geom in self.data]
-        return GeometryArray(data)
+        data = self.data
+        return GeometryArray(_map_valid(
+            lambda i: data[i].representative_point(), ~self._masks()[0]))
 
     #
     # Binary predicates
@@ -433,39 +1369,42 @@ class GeometryArray:
     def distance(self, other):
         return _binary_op('distance', self, other)
 
-    def buffer(self, distance, resolution=16, **kwargs):
+    def buffer(self, distance, resolution=16, n_jobs=None, **kwargs):
+        data = self.data
         if isinstance(distance, np.ndarray):
             if len(distance) != len(self):
                 raise ValueError("Length of distance sequence does not match "
                                  "length of the GeoSeries")
-            data = [
-                geom.buffer(dist, resolution, **kwargs)
-                for geom, dist in zip(self.data, distance)]
-            return GeometryArray(np.array(data, dtype=object))
+            return GeometryArray(_map_valid(
+                lambda i: data[i].buffer(distance[i], resolution, **kwargs),
+                ~self._masks()[0], n_jobs=n_jobs))
 
-        data = [geom.buffer(distance, resolution, **kwargs)
-                for geom in self.data]
-        return GeometryArray(np.array(data, dtype=object))
+        return GeometryArray(_map_valid(
+            lambda i: data[i].buffer(distance, resolution, **kwargs),
+            ~self._masks()[0], n_jobs=n_jobs))
 
-    def interpolate(self, distance, normalized=False):
+    def interpolate(self, distance, normalized=False, n_jobs=None):
+        data = self.data
         if isinstance(distance, np.ndarray):
             if len(distance) != len(self):
                 raise ValueError("Length of distance sequence does not match "
                                  "length of the GeoSeries")
-            data = [
-                geom.interpolate(dist, normalized=normalized)
-                for geom, dist in zip(self.data, distance)]
-            return GeometryArray(np.array(data, dtype=object))
+            return GeometryArray(_map_valid(
+                lambda i: data[i].interpolate(
+                    distance[i], normalized=normalized),
+                ~self._masks()[0], n_jobs=n_jobs))
 
-        data = [geom.interpolate(distance, normalized=normalized)
-                for geom in self.data]
-        return GeometryArray(np.array(data, dtype=object))
+        return GeometryArray(_map_valid(
+            lambda i: data[i].interpolate(distance, normalized=normalized),
+            ~self._masks()[0], n_jobs=n_jobs))
 
     def simplify(self, *args, **kwargs):
         # method and not a property -> can't use _unary_geo
-        data = np.empty(len(self), dtype=object)
-        data[:] = [geom.simplify(*args, **kwargs) for geom in self.data]
-        return GeometryArray(data)
+        n_jobs = kwargs.pop('n_jobs', None)
+        data = self.data
+        return GeometryArray(_map_valid(
+            lambda i: data[i].simplify(*args, **kwargs), ~self._masks()[0],
+            n_jobs=n_jobs))
 
     def project(self, other, normalized=False):
         return _binary_op('project', self, other, normalized=normalized)
@@ -484,29 +1423,117 @@ class GeometryArray:
     # Affinity operations
     #
 
+    def affine_transform(self, matrix):
+        return _affine_transform(self, _affine_matrix(matrix, len(self)))
+
     def translate(self, xoff=0.0, yoff=0.0, zoff=0.0):
-        return _affinity_method('translate', self, xoff, yoff, zoff)
+        return _affine_transform(self, _stack_matrix(
+            1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, xoff, yoff, zoff))
 
     def rotate(self, angle, origin='center', use_radians=False):
-        return _affinity_method('rotate', self, angle, origin=origin,
-                                use_radians=use_radians)
+        cosp = _trig(angle, np.cos, use_radians)
+        sinp = _trig(angle, np.sin, use_radians)
+        x0, y0, _ = _origin(self, origin)
+        return _affine_transform(self, _stack_matrix(
+            cosp, -sinp, 0.0,
+            sinp, cosp, 0.0,
+            0.0, 0.0, 1.0,
+            x0 - x0 * cosp + y0 * sinp, y0 - x0 * sinp - y0 * cosp, 0.0))
 
     def scale(self, xfact=1.0, yfact=1.0, zfact=1.0, origin='center'):
-        return _affinity_method(
-            'scale', self, xfact, yfact, zfact, origin=origin)
+        x0, y0, z0 = _origin(self, origin)
+        return _affine_transform(self, _stack_matrix(
+            xfact, 0.0, 0.0,
+            0.0, yfact, 0.0,
+            0.0, 0.0, zfact,
+            x0 - x0 * xfact, y0 - y0 * yfact, z0 - z0 * zfact))
 
     def skew(self, xs=0.0, ys=0.0, origin='center', use_radians=False):
-        return _affinity_method('skew', self, xs, ys, origin=origin,
-                                use_radians=use_radians)
+        tanx = _trig(xs, np.tan, use_radians)
+        tany = _trig(ys, np.tan, use_radians)
+        x0, y0, _ = _origin(self, origin)
+        return _affine_transform(self, _stack_matrix(
+            1.0, tanx, 0.0,
+            tany, 1.0, 0.0,
+            0.0, 0.0, 1.0,
+            -y0 * tanx, -x0 * tany, 0.0))
 
     #
     # Coordinate related properties
     #
 
+    def get_coordinates(self, include_z=None):
+        """
+        Return the coordinates of all geometries as a single array.
+
+        Parameters
+        ----------
+        include_z : bool, optional
+            Whether to include the z coordinates (NaN for 2D geometries). By
+            default they are included if any of the geometries has z.
+
+        Returns
+        -------
+        coords : ndarray of shape (M, 2) or (M, 3)
+            The coordinates of all (parts and rings of the) geometries, in
+            order.
+        index : ndarray of int
+            For every coordinate, the position of its geometry.
+        """
+        buffers = self._buffers()
+        coords = buffers.coords
+        if include_z is None:
+            include_z = coords.shape[1] == 3
+        if include_z and coords.shape[1] == 2:
+            coords = np.column_stack([coords, np.full(len(coords), np.nan)])
+        elif not include_z:
+            coords = coords[:, :2]
+        counts = np.diff(buffers.coord_offsets())
+        index = np.repeat(np.arange(len(self)), counts)
+        return coords.copy(), index
+
+    def set_coordinates(self, coords):
+        """
+        Return a GeometryArray with the same geometries, but with their
+        coordinates replaced.
+
+        Parameters
+        ----------
+        coords : array of shape (M, 2) or (M, 3)
+            The new coordinates, in the order of ``get_coordinates()``. With
+            3 columns, the geometries of which the z value is NaN are 2D.
+
+        Returns
+        -------
+        GeometryArray
+        """
+        result = GeometryArray(self._buffers().with_coords(coords))
+        result._missing, result._empty = self._masks()
+        result._type_codes = self.type_codes
+        return result
+
+    def _point_coordinate(self, dim):
+        """
+        Return the coordinates of dimension `dim` from the coordinate
+        buffers if the array consists of non-empty Points only, else None.
+        """
+        if isinstance(self._coords, PointBuffers):
+            return getattr(self._coords, 'xyz'[dim])
+        coords = self._coords
+        if (isinstance(coords, CoordinateBuffers)
+                and len(coords.coords) == len(coords)
+                and (coords.type_codes == POINT).all()):
+            # one coordinate per point -> the buffer rows are the points
+            return coords.coords[:, dim]
+        return None
+
     @property
     def x(self):
         """Return the x location of point geometries in a GeoSeries"""
-        if (self.geom_type == "Point").all():
+        x = self._point_coordinate(0)
+        if x is not None:
+            return x
+        if self._is_type(POINT).all():
             return _unary_op('x', self, null_value=np.nan)
         else:
             message = "x attribute access only provided for Point geometries"
@@ -515,7 +1542,10 @@ class GeometryArray:
     @property
     def y(self):
         """Return the y location of point geometries in a GeoSeries"""
-        if (self.geom_type == "Point").all():
+        y = self._point_coordinate(1)
+        if y is not None:
+            return y
+        if self._is_type(POINT).all():
             return _unary_op('y', self, null_value=np.nan)
         else:
             message = "y attribute access only provided for Point geometries"
@@ -523,14 +1553,414 @@ class GeometryArray:
 
     @property
     def bounds(self):
-        # TODO fix for empty / missing geometries
-        bounds = np.array([geom.bounds for geom in self.data])
-        return bounds
+        """
+        Return a (N, 4) float array with the minx, miny, maxx, maxy values
+        of each geometry (NaN for missing and empty geometries).
+
+        The bounds are computed once and cached on the array, also for the
+        arrays resulting from indexing, take or concat. The returned array is
+        read-only.
+        """
+        if self._bounds is None:
+            if self._coords is not None:
+                bounds = self._coords.bounds()
+            else:
+                bounds = _shapely_bounds(self._data)
+            bounds.flags.writeable = False
+            self._bounds = bounds
+        return self._bounds
 
     @property
     def total_bounds(self):
+        """
+        Return the minx, miny, maxx, maxy values of the array as a whole,
+        ignoring missing and empty geometries (all NaN if there are none).
+        """
         b = self.bounds
-        return np.array((b[:, 0].min(),  # minx
-                         b[:, 1].min(),  # miny
-                         b[:, 2].max(),  # maxx
-                         b[:, 3].max()))  # maxy
+        if np.isnan(b[:, 0]).all():
+            return np.array([np.nan] * 4)
+        return np.array((np.nanmin(b[:, 0]),  # minx
+                         np.nanmin(b[:, 1]),  # miny
+                         np.nanmax(b[:, 2]),  # maxx
+                         np.nanmax(b[:, 3])))  # maxy
+
+    # -------------------------------------------------------------------------
+    # general array like compat
+    # -------------------------------------------------------------------------
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes of the coordinate buffers and of the array of
+        pointers to the Shapely objects (see :meth:`memory_usage` for an
+        estimate including the objects themselves).
+        """
+        return self.memory_usage()
+
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of the array.
+
+        Parameters
+        ----------
+        deep : bool, default False
+            If False, only the coordinate buffers and the array of pointers
+            to the Shapely objects are counted. If True, the (estimated)
+            memory held by the Shapely and GEOS objects is added.
+
+        Returns
+        -------
+        int
+        """
+        if not deep:
+            nbytes = 0
+            if self._coords is not None:
+                nbytes += self._coords.nbytes
+            if self._data is not None:
+                nbytes += self._data.nbytes
+            return nbytes
+        return int(self._element_nbytes().sum())
+
+    def _counts(self):
+        """
+        Return the (cached) number of coordinates and of GEOS geometries of
+        each element as (N, 2) array.
+        """
+        if self._geos_counts is None:
+            if self._coords is not None:
+                counts = self._coords.geos_counts()
+            else:
+                counts = geos_counts(self._data)
+            counts.flags.writeable = False
+            self._geos_counts = counts
+        return self._geos_counts
+
+    def _element_nbytes(self):
+        """
+        Return the estimated number of bytes used by each element: its part
+        of the coordinate buffers, and the pointer to and the memory of the
+        Shapely object, if materialized.
+
+        Shapely objects present more than once in the array (e.g. after
+        ``take`` with repeated indices) are only counted once.
+        """
+        nbytes = np.zeros(len(self), dtype=np.int64)
+        if self._coords is not None:
+            nbytes += self._coords.element_nbytes()
+        if isinstance(self._coords, InternedBuffers):
+            # the Shapely objects are those of the unique geometries
+            if self._data is not None:
+                nbytes += self._data.itemsize
+        elif self._data is not None:
+            n_coords, n_geoms = self._counts().T
+            objects = (SHAPELY_OBJECT_NBYTES
+                       + n_geoms * GEOS_GEOMETRY_NBYTES
+                       + n_coords * GEOS_COORDINATE_NBYTES)
+            objects[self._masks()[0]] = 0
+            ids = np.array([id(geom) for geom in self._data], dtype=np.int64)
+            first = np.unique(ids, return_index=True)[1]
+            shared = np.ones(len(self), dtype=bool)
+            shared[first] = False
+            objects[shared] = 0
+            nbytes += self._data.itemsize + objects
+        return nbytes
+
+    def copy(self, *args, **kwargs):
+        # still taking args/kwargs for compat with pandas 0.24
+        if self._subset_buffers():
+            # the buffers are never modified in place
+            result = GeometryArray(self._coords)
+        else:
+            result = GeometryArray(self._data.copy())
+        # the cached arrays are read-only and can be shared
+        result._set_cache(self)
+        return result
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        from pandas.api.extensions import take
+
+        if allow_fill:
+            if fill_value is None or pd.isna(fill_value):
+                fill_value = None
+            elif not isinstance(fill_value, BaseGeometry):
+                raise TypeError("provide geometry or None as fill value")
+
+        if self._subset_buffers() and fill_value is None:
+            # take from the buffers, with -1 for the missing values
+            positions = take(np.arange(len(self)), indices,
+                             allow_fill=allow_fill, fill_value=-1)
+            result = GeometryArray(self._coords.take(positions))
+        else:
+            result = take(self.data, indices, allow_fill=allow_fill,
+                          fill_value=fill_value)
+            if allow_fill and fill_value is None:
+                result[pd.isna(result)] = None
+            result = GeometryArray(result)
+
+        indices = np.asarray(indices, dtype=np.intp)
+        if allow_fill:
+            fill = GeometryArray._from_sequence([fill_value])
+            fill._compute_cache()
+            # the fill value is appended to the cached arrays
+            indices = np.where(indices == -1, len(self), indices)
+
+        def take_cached(attr, values):
+            if allow_fill:
+                values = np.concatenate([values, getattr(fill, attr)])
+            return values[indices]
+
+        result._set_cache(self, take_cached)
+        return result
+
+    def _fill(self, idx, value):
+        """ Fill index locations with value
+
+        Value should be a BaseGeometry
+        """
+        if not (isinstance(value, BaseGeometry) or value is None):
+            raise TypeError(
+                "Value should be either a BaseGeometry or None, got %s"
+                % str(value))
+        self[idx] = value
+        return self
+
+    def fillna(self, value=None, method=None, limit=None):
+        """ Fill NA/NaN values using the specified method.
+
+        Parameters
+        ----------
+        value : scalar, array-like
+            If a scalar value is passed it is used to fill all missing values.
+            Alternatively, an array-like 'value' can be given. It's expected
+            that the array-like have the same length as 'self'.
+        method : {'backfill', 'bfill', 'pad', 'ffill', None}, default None
+            Method to use for filling holes in reindexed Series
+            pad / ffill: propagate last valid observation forward to next valid
+            backfill / bfill: use NEXT valid observation to fill gap
+        limit : int, default None
+            If method is specified, this is the maximum number of consecutive
+            NaN values to forward/backward fill. In other words, if there is
+            a gap with more than this number of consecutive NaNs, it will only
+            be partially filled. If method is not specified, this is the
+            maximum number of entries along the entire axis where NaNs will be
+            filled.
+
+        Returns
+        -------
+        filled : ExtensionArray with NA/NaN filled
+        """
+        if method is not None:
+            raise NotImplementedError(
+                "fillna with a method is not yet supported")
+
+        mask = self.isna()
+        new_values = self.copy()
+
+        if mask.any():
+            # fill with value
+            if _isna(value):
+                value = None
+            elif not isinstance(value, BaseGeometry):
+                raise NotImplementedError(
+                    "fillna currently only supports filling with a scalar "
+                    "geometry")
+            new_values = new_values._fill(mask, value)
+
+        return new_values
+
+    def astype(self, dtype, copy=True):
+        """
+        Cast to a NumPy array with 'dtype'.
+
+        Parameters
+        ----------
+        dtype : str or dtype
+            Typecode or data-type to which the array is cast.
+        copy : bool, default True
+            Whether to copy the data, even if not necessary. If False,
+            a copy is made only if the old dtype does not match the
+            new dtype.
+
+        Returns
+        -------
+        array : ndarray
+            NumPy ndarray with 'dtype' for its dtype.
+        """
+        if isinstance(dtype, GeometryDtype):
+            if copy:
+                return self.copy()
+            else:
+                return self
+        return np.array(self, dtype=dtype, copy=copy)
+
+    def isna(self):
+        """
+        Boolean NumPy array indicating if each value is missing
+        """
+        return self._masks()[0].copy()
+
+    def unique(self):
+        """Compute the ExtensionArray of unique values.
+
+        Returns
+        -------
+        uniques : ExtensionArray
+        """
+        from pandas import factorize
+        _, uniques = factorize(self)
+        return uniques
+
+    def value_counts(self, dropna=True):
+        """
+        Compute a histogram of the counts of the geometries (considering
+        geometries with identical WKB representation as equal).
+
+        Parameters
+        ----------
+        dropna : bool, default True
+            Don't include counts of missing values.
+
+        Returns
+        -------
+        pd.Series
+        """
+        result = pd.Series(to_wkb(self)).value_counts(dropna=dropna)
+        # value_counts converts None to nan, convert back for from_wkb
+        index = np.asarray(result.index, dtype=object)
+        index[pd.isna(index)] = None
+        return pd.Series(result.values,
+                         index=pd.Index(from_wkb(index).data, dtype=object),
+                         name=result.name)
+
+    def _values_for_factorize(self):
+        """Return an array and missing value suitable for factorization.
+
+        Returns
+        -------
+        values : ndarray
+            An array suitable for factoraization. This should maintain order
+            and be a supported dtype (Float64, Int64, UInt64, String, Object).
+            By default, the extension array is cast to object dtype.
+        na_value : object
+            The value in `values` to consider missing. This will be treated
+            as NA in the factorization routines, so it will be coded as
+            `na_sentinal` and not included in `uniques`. By default,
+            ``np.nan`` is used.
+        """
+        vals = to_wkb(self)
+        return vals, None
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        """
+        Construct a new ExtensionArray from a sequence of scalars.
+
+        Parameters
+        ----------
+        scalars : Sequence
+            Each element will be an instance of the scalar type for this
+            array, ``cls.dtype.type``.
+        dtype : dtype, optional
+            Construct for this particular dtype. This should be a Dtype
+            compatible with the ExtensionArray.
+        copy : boolean, default False
+            If True, copy the underlying data.
+
+        Returns
+        -------
+        ExtensionArray
+        """
+        return from_shapely(scalars)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        """
+        Reconstruct an ExtensionArray after factorization.
+
+        Parameters
+        ----------
+        values : ndarray
+            An integer ndarray with the factorized values.
+        original : ExtensionArray
+            The original ExtensionArray that factorize was called on.
+
+        See Also
+        --------
+        pandas.factorize
+        ExtensionArray.factorize
+        """
+        return from_wkb(values)
+
+    def _values_for_argsort(self):
+        # type: () -> np.ndarray
+        """Return values for sorting.
+
+        Returns
+        -------
+        ndarray
+            The transformed values should maintain the ordering between values
+            within the array.
+
+        See Also
+        --------
+        ExtensionArray.argsort
+        """
+        # Note: this is used in `ExtensionArray.argsort`.
+        raise TypeError("geometries are not orderable")
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        """
+        Concatenate multiple array
+
+        Parameters
+        ----------
+        to_concat : sequence of this type
+
+        Returns
+        -------
+        ExtensionArray
+        """
+        buffers = [ga._coords for ga in to_concat]
+        if (len(set(ga.storage for ga in to_concat)) == 1
+                and buffers[0] is not None):
+            # concatenate the buffers of the same storage without
+            # materializing the geometries
+            result = GeometryArray(type(buffers[0]).concat(buffers))
+        else:
+            data = np.concatenate([ga.data for ga in to_concat])
+            result = GeometryArray(data)
+        for attr in cls._cached:
+            cached = [getattr(ga, attr) for ga in to_concat]
+            if all(values is not None for values in cached):
+                values = np.concatenate(cached)
+                values.flags.writeable = False
+                setattr(result, attr, values)
+        return result
+
+    def __array__(self, dtype=None):
+        """
+        The numpy array interface.
+
+        Returns
+        -------
+        values : numpy array
+        """
+        return self.data
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index)):
+            # rely on pandas to unbox and dispatch to us
+            return NotImplemented
+
+        if isinstance(other, BaseGeometry):
+            # avoid numpy converting the geometry to a coordinate array
+            return np.array([geom == other for geom in self.data],
+                            dtype=bool)
+        if isinstance(other, GeometryArray):
+            other = other.data
+        return self.data == other
@@ -7,7 +7,7 @@ from pandas.core.indexing import _NDFrameIndexer
 
 from shapely.geometry.base import BaseGeometry
 from shapely.geometry import box
-from shapely.ops import cascaded_union, unary_union
+from shapely.ops import cascaded_union
 import shapely.affinity as affinity
 
 import geopandas as gpd
@@ -34,10 +34,10 @@ def _delegate_binary_method(op, this, other, *args, **kwargs):
         # if this.crs != other.crs:
         #     warn('GeoSeries crs mismatch: {0} and {1}'.format(this.crs,
         #                                                       other.crs))
-        a_this = GeometryArray(this.values)
-        other = GeometryArray(other.values)
+        a_this = this.values
+        other = other.values
     elif isinstance(other, BaseGeometry):
-        a_this = GeometryArray(this.values)
+        a_this = this.values
     else:
         raise TypeError(type(this), type(other))
 
@@ -50,7 +50,7 @@ def _binary_geo(op, this, other):
     """Binary operation on GeoSeries objects that returns a GeoSeries"""
     from .geoseries import GeoSeries
     geoms, index = _delegate_binary_method(op, this, other)
-    return GeoSeries(geoms.data, index=index, crs=this.crs)
+    return GeoSeries(geoms, index=index, crs=this.crs)
 
 
 def _binary_op(op, this, other, *args, **kwargs):
@@ -62,11 +62,11 @@ def _binary_op(op, this, other, *args, **kwargs):
 
 def _delegate_property(op, this):
     # type: (str, GeoSeries) -> GeoSeries/Series
-    a_this = GeometryArray(this.geometry.values)
+    a_this = this.geometry.values
     data = getattr(a_this, op)
     if isinstance(data, GeometryArray):
         from .geoseries import GeoSeries
-        return GeoSeries(data.data, index=this.index, crs=this.crs)
+        return GeoSeries(data, index=this.index, crs=this.crs)
     else:
         return Series(data, index=this.index)
 
@@ -75,8 +75,8 @@ def _delegate_geo_method(op, this, *args, **kwargs):
     # type: (str, GeoSeries) -> GeoSeries
     """Unary operation that returns a GeoSeries"""
     from .geoseries import GeoSeries
-    a_this = GeometryArray(this.geometry.values)
-    data = getattr(a_this, op)(*args, **kwargs).data
+    a_this = this.geometry.values
+    data = getattr(a_this, op)(*args, **kwargs)
     return GeoSeries(data, index=this.index, crs=this.crs)
 
 
@@ -85,15 +85,28 @@ class GeoPandasBase(object):
     _sindex_generated = False
 
     def _generate_sindex(self):
-        if not HAS_SINDEX:
+        if gpd.options.sindex_backend == 'strtree':
+            from geopandas.sindex import STRTreeIndex, _cached_strtree
+            bounds = self.geometry.values.bounds
+            if gpd.options.sindex_cache_dir is not None:
+                sindex = _cached_strtree(bounds, gpd.options.sindex_cache_dir)
+            else:
+                sindex = STRTreeIndex(bounds)
+            sindex.objects = self.index
+            if not sindex.is_empty:
+                self._sindex = sindex
+                sindex.geometries = self.geometry.values
+        elif not HAS_SINDEX:
             warn("Cannot generate spatial index: Missing package `rtree`.")
         else:
             from geopandas.sindex import SpatialIndex
-            stream = ((i, item.bounds, idx) for i, (idx, item) in
-                      enumerate(self.geometry.iteritems())
-                      if pd.notnull(item) and not item.is_empty)
+            bounds = self.geometry.values.bounds
+            index = self.index
+            valid = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+            stream = ((i, tuple(bounds[i]), index[i]) for i in valid)
             try:
                 self._sindex = SpatialIndex(stream)
+                self._sindex.geometries = self.geometry.values
             # What we really want here is an empty generator error, or
             # for the bulk loader to log that the generator was empty
             # and move on. See https://github.com/Toblerity/rtree/issues/20.
@@ -101,6 +114,39 @@ class GeoPandasBase(object):
                 pass
         self._sindex_generated = True
 
+    def sindex_from_file(self, path, mmap=True):
+        """
+        Use the spatial index saved to a file with ``sindex.save(path)``,
+        instead of building it.
+
+        The index should have been built for geometries with the same
+        bounds (in the same order). It is a 'strtree' index whatever the
+        ``sindex_backend`` option.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        mmap : bool, default True
+            Whether to memory-map the index from the file (read-only)
+            instead of reading it in memory.
+
+        Returns
+        -------
+        STRTreeIndex
+            The index, which is also used as the ``sindex`` attribute.
+        """
+        from geopandas.sindex import STRTreeIndex, _bounds_digest
+        sindex = STRTreeIndex.load(path, objects=self.index, mmap=mmap)
+        if sindex._digest != _bounds_digest(self.geometry.values.bounds):
+            raise ValueError(
+                "The spatial index in '{0}' was built for geometries with "
+                "other bounds".format(path))
+        sindex.geometries = self.geometry.values
+        self._sindex = None if sindex.is_empty else sindex
+        self._sindex_generated = True
+        return sindex
+
     def _invalidate_sindex(self):
         """
         Indicates that the spatial index should be re-built next
@@ -239,13 +285,13 @@ class GeoPandasBase(object):
     @property
     def cascaded_union(self):
         """Deprecated: Return the unary_union of all geometries"""
-        return cascaded_union(self.geometry.values)
+        return cascaded_union(self.geometry.values.data)
 
     @property
     def unary_union(self):
         """Returns a geometry containing the union of all geometries in the
         ``GeoSeries``."""
-        return unary_union(self.geometry.values)
+        return self.geometry.values.unary_union()
 
     #
     # Binary operations that return a pandas Series
@@ -471,7 +517,7 @@ class GeoPandasBase(object):
 
         See ``GeoSeries.total_bounds`` for the limits of the entire series.
         """
-        bounds = GeometryArray(self.geometry.values).bounds
+        bounds = self.geometry.values.bounds.copy()
         return DataFrame(bounds,
                          columns=['minx', 'miny', 'maxx', 'maxy'],
                          index=self.index)
@@ -484,7 +530,7 @@ class GeoPandasBase(object):
         See ``GeoSeries.bounds`` for the bounds of the geometries contained in
         the series.
         """
-        return GeometryArray(self.geometry.values).total_bounds
+        return self.geometry.values.total_bounds
 
     @property
     def sindex(self):
@@ -590,6 +636,62 @@ class GeoPandasBase(object):
         return _delegate_geo_method('interpolate', self, distance,
                                     normalized=normalized)
 
+    def get_coordinates(self, include_z=None):
+        """Returns the coordinates of all geometries as a single array.
+
+        Together with :meth:`set_coordinates`, this allows to apply any
+        vectorized operation to the coordinates.
+
+        Parameters
+        ----------
+        include_z : bool, optional
+            Whether to include the z coordinates (NaN for 2D geometries). By
+            default they are included if any of the geometries has z.
+
+        Returns
+        -------
+        coords : ndarray of shape (M, 2) or (M, 3)
+            The coordinates of all (parts and rings of the) geometries, in
+            order.
+        index : ndarray of int
+            For every coordinate, the position (not the index label) of the
+            row it belongs to.
+        """
+        return self.geometry.values.get_coordinates(include_z=include_z)
+
+    def set_coordinates(self, coords):
+        """Returns a ``GeoSeries`` with the coordinates of the geometries
+        replaced.
+
+        The geometries keep their type and structure (parts and rings).
+
+        Parameters
+        ----------
+        coords : array of shape (M, 2) or (M, 3)
+            The new coordinates, in the order returned by
+            :meth:`get_coordinates`. With 3 columns, the geometries of which
+            the z value is NaN are 2D.
+        """
+        return _delegate_geo_method('set_coordinates', self, coords)
+
+    def affine_transform(self, matrix):
+        """Returns a ``GeoSeries`` with transformed geometries.
+
+        The transformation is applied to the coordinates of all geometries
+        at once. See
+        http://shapely.readthedocs.io/en/latest/manual.html#shapely.affinity.affine_transform
+        for details.
+
+        Parameters
+        ----------
+        matrix : list, tuple or array
+            The 6 coefficients ``[a, b, d, e, xoff, yoff]`` of a 2D, or the
+            12 coefficients ``[a, b, c, d, e, f, g, h, i, xoff, yoff, zoff]``
+            of a 3D affine transformation. An array of shape (n, 6) or
+            (n, 12) gives a different matrix for each geometry.
+        """
+        return _delegate_geo_method('affine_transform', self, matrix)
+
     def translate(self, xoff=0.0, yoff=0.0, zoff=0.0):
         """Returns a ``GeoSeries`` with translated geometries.
 
@@ -737,10 +839,20 @@ class _CoordinateIndexer(_NDFrameIndexer):
         # don't know how to handle step; should this raise?
         if xs.step is not None or ys.step is not None:
             warn("Ignoring step - full interval is used.")
+        bounds = obj.geometry.values.bounds
         xmin, ymin, xmax, ymax = obj.total_bounds
-        bbox = box(xs.start if xs.start is not None else xmin,
-                   ys.start if ys.start is not None else ymin,
-                   xs.stop if xs.stop is not None else xmax,
-                   ys.stop if ys.stop is not None else ymax)
-        idx = obj.intersects(bbox)
+        xmin = xs.start if xs.start is not None else xmin
+        ymin = ys.start if ys.start is not None else ymin
+        xmax = xs.stop if xs.stop is not None else xmax
+        ymax = ys.stop if ys.stop is not None else ymax
+        # only geometries whose bounding box intersects the query box need
+        # the exact intersection test
+        with np.errstate(invalid='ignore'):
+            candidates = np.flatnonzero(
+                (bounds[:, 0] <= xmax) & (bounds[:, 2] >= xmin)
+                & (bounds[:, 1] <= ymax) & (bounds[:, 3] >= ymin))
+        bbox = box(xmin, ymin, xmax, ymax)
+        idx = np.zeros(len(obj), dtype=bool)
+        geoms = obj.geometry.values
+        idx[candidates] = [geoms[i].intersects(bbox) for i in candidates]
         return obj[idx]
@@ -4,11 +4,12 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 from shapely.geometry import mapping, shape, Point
-from shapely.geometry.base import BaseGeometry
-from six import string_types, PY3
+from six import PY3
 
+from geopandas._coords import GEOMETRY_TYPES, MISSING
+from geopandas.array import GeometryArray, GeometryDtype, from_shapely
 from geopandas.base import GeoPandasBase, _CoordinateIndexer
-from geopandas.geoseries import GeoSeries
+from geopandas.geoseries import GeoSeries, is_geometry_type
 from geopandas.plotting import plot_dataframe
 import geopandas.io
 
@@ -16,6 +17,26 @@ import geopandas.io
 DEFAULT_GEO_COLUMN_NAME = 'geometry'
 
 
+def _ensure_geometry(data):
+    """
+    Ensure the data is of geometry dtype or converted to it.
+
+    If input is a (Geo)Series, output is a GeoSeries, otherwise output
+    is GeometryArray.
+    """
+    if is_geometry_type(data):
+        if isinstance(data, Series):
+            return GeoSeries(data)
+        return data
+    else:
+        if isinstance(data, Series):
+            out = from_shapely(np.asarray(data))
+            return GeoSeries(out, index=data.index, name=data.name)
+        else:
+            out = from_shapely(data)
+            return out
+
+
 class GeoDataFrame(GeoPandasBase, DataFrame):
     """
     A GeoDataFrame object is a pandas.DataFrame that has a column
@@ -45,7 +66,24 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         crs = kwargs.pop('crs', None)
         geometry = kwargs.pop('geometry', None)
         super(GeoDataFrame, self).__init__(*args, **kwargs)
+
+        # need to set this before calling self['geometry'], because
+        # getitem accesses crs
         self.crs = crs
+
+        # set_geometry ensures the geometry data have the proper dtype,
+        # but is not called if `geometry=None` ('geometry' column present
+        # in the data), so therefore need to ensure it here manually
+        # but within a try/except because currently non-geometries are
+        # allowed in that case
+        if (geometry is None and self._geometry_column_name in self.columns
+                and not is_geometry_type(self[self._geometry_column_name])):
+            try:
+                self[self._geometry_column_name] = _ensure_geometry(
+                    self[self._geometry_column_name].values)
+            except TypeError:
+                pass
+
         if geometry is not None:
             self.set_geometry(geometry, inplace=True)
         self._invalidate_sindex()
@@ -72,7 +110,7 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
 
     def _set_geometry(self, col):
         # TODO: Use pandas' core.common.is_list_like() here.
-        if not isinstance(col, (list, np.ndarray, Series)):
+        if not isinstance(col, (list, np.ndarray, Series, GeometryArray)):
             raise ValueError("Must use a list-like to set the geometry"
                              " property")
         self.set_geometry(col, inplace=True)
@@ -119,7 +157,7 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
 
         to_remove = None
         geo_column_name = self._geometry_column_name
-        if isinstance(col, (Series, list, np.ndarray)):
+        if isinstance(col, (Series, list, np.ndarray, GeometryArray)):
             level = col
         elif hasattr(col, 'ndim') and col.ndim != 1:
             raise ValueError("Must pass array with one dimension only.")
@@ -145,8 +183,7 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
             level.crs = crs
 
         # Check that we are using a listlike of geometries
-        if not all(isinstance(item, BaseGeometry) or pd.isnull(item) for item in level):
-            raise TypeError("Input geometry column must contain valid geometry objects.")
+        level = _ensure_geometry(level)
         frame[geo_column_name] = level
         frame._geometry_column_name = geo_column_name
         frame.crs = crs
@@ -238,7 +275,7 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
     @classmethod
     def from_postgis(cls, sql, con, geom_col='geom', crs=None,
                      index_col=None, coerce_float=True,
-                     parse_dates=None, params=None):
+                     parse_dates=None, params=None, storage='object'):
         """
         Alternate constructor to create a ``GeoDataFrame`` from a sql query
         containing a geometry column in WKB representation.
@@ -267,6 +304,9 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
               without native Datetime support, such as SQLite.
         params : list, tuple or dict, optional, default None
             List of parameters to pass to execute method.
+        storage : str, default 'object'
+            How the geometries are held in memory. With 'wkb', the WKB values
+            are only parsed when needed, see :func:`geopandas.read_postgis`.
 
         Examples
         --------
@@ -279,7 +319,7 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         df = geopandas.io.sql.read_postgis(
                 sql, con, geom_col=geom_col, crs=crs,
                 index_col=index_col, coerce_float=coerce_float,
-                parse_dates=parse_dates, params=params)
+                parse_dates=parse_dates, params=params, storage=storage)
 
         return df
 
@@ -468,7 +508,8 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         """
         result = super(GeoDataFrame, self).__getitem__(key)
         geo_col = self._geometry_column_name
-        if isinstance(key, string_types) and key == geo_col:
+        if (isinstance(result, Series)
+                and isinstance(result.dtype, GeometryDtype)):
             result.__class__ = GeoSeries
             result.crs = self.crs
             result._invalidate_sindex()
@@ -489,6 +530,9 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
         result = DataFrame.merge(self, *args, **kwargs)
         geo_col = self._geometry_column_name
         if isinstance(result, DataFrame) and geo_col in result:
+            if not is_geometry_type(result[geo_col]):
+                # pandas' merge does not always preserve the geometry dtype
+                result[geo_col] = from_shapely(result[geo_col].values)
             result.__class__ = GeoDataFrame
             result.crs = self.crs
             result._geometry_column_name = geo_col
@@ -535,6 +579,52 @@ class GeoDataFrame(GeoPandasBase, DataFrame):
             data = data.copy()
         return GeoDataFrame(data).__finalize__(self)
 
+    def memory_report(self, index=True):
+        """
+        Return the memory usage of the columns, broken down by geometry
+        type for the geometry columns.
+
+        Unlike ``memory_usage(deep=True)``, which only reports the total of
+        each column, this shows how the memory of the geometries is
+        distributed over the geometry types.
+
+        Parameters
+        ----------
+        index : bool, default True
+            Whether to include the memory usage of the index.
+
+        Returns
+        -------
+        DataFrame
+            Indexed by the column name and the geometry type (an empty
+            string for the non-geometry columns, 'None' for missing
+            geometries), with the number of rows ('count'), the number of
+            coordinates ('coordinates') and the (estimated) number of bytes
+            ('bytes').
+        """
+        rows = []
+        if index:
+            rows.append(('Index', '', len(self), 0,
+                         self.index.memory_usage(deep=True)))
+        for col, values in self.iteritems():
+            if not isinstance(values.dtype, GeometryDtype):
+                rows.append((col, '', len(values), 0,
+                             values.memory_usage(index=False, deep=True)))
+                continue
+            geoms = values.values
+            codes = geoms.type_codes
+            n_coords = geoms._counts()[:, 0]
+            nbytes = geoms._element_nbytes()
+            for code in np.unique(codes):
+                mask = codes == code
+                geom_type = 'None' if code == MISSING else GEOMETRY_TYPES[code]
+                rows.append((col, geom_type, mask.sum(), n_coords[mask].sum(),
+                             nbytes[mask].sum()))
+        report = DataFrame(
+            rows, columns=['column', 'geom_type', 'count', 'coordinates',
+                           'bytes'])
+        return report.set_index(['column', 'geom_type'])
+
     def plot(self, *args, **kwargs):
         """Generate a plot of the geometries in the ``GeoDataFrame``.
 
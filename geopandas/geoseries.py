@@ -1,9 +1,12 @@
 from distutils.version import LooseVersion
 from functools import partial
 import json
+import warnings
 
 import numpy as np
+import pandas as pd
 from pandas import Series
+from pandas.core.internals import SingleBlockManager
 import pyproj
 from shapely.geometry import shape, Point
 from shapely.geometry.base import BaseGeometry
@@ -12,42 +15,115 @@ from shapely.ops import transform
 from geopandas.plotting import plot_series
 from geopandas.base import (
     GeoPandasBase, _delegate_property, _CoordinateIndexer)
+from geopandas.array import GeometryDtype, from_shapely
 
 
 _PYPROJ2 = LooseVersion(pyproj.__version__) >= LooseVersion('2.1.0')
 
+_SERIES_WARNING_MSG = (
+    "You are passing non-geometry data to the GeoSeries constructor. "
+    "Currently, it falls back to returning a pandas Series. But in the "
+    "future, we will start to raise a TypeError instead.")
 
-def _is_empty(x):
-    try:
-        return x.is_empty
-    except:
-        return False
 
+def is_geometry_type(data):
+    """
+    Check if the data is of geometry dtype.
 
-class GeoSeries(GeoPandasBase, Series):
-    """A Series object designed to store shapely geometry objects."""
-    _metadata = ['name', 'crs']
+    Does not include object array of shapely scalars.
+    """
+    return isinstance(getattr(data, 'dtype', None), GeometryDtype)
 
-    def __new__(cls, *args, **kwargs):
-        kwargs.pop('crs', None)
-        arr = Series.__new__(cls)
-        if type(arr) is GeoSeries:
-            return arr
-        else:
-            return arr.view(GeoSeries)
 
-    def __init__(self, *args, **kwargs):
-        # fix problem for scalar geometries passed, ensure the list of
-        # scalars is of correct length if index is specified
-        if len(args) == 1 and isinstance(args[0], BaseGeometry):
-            n = len(kwargs.get('index', [1]))
-            args = ([args[0]] * n,)
+def _geoseries_constructor_with_fallback(data=None, index=None, crs=None,
+                                         **kwargs):
+    """
+    A flexible constructor for GeoSeries._constructor, which needs to be able
+    to fall back to a Series (if a certain operation does not produce
+    geometries)
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            'ignore', message='You are passing non-geometry data',
+            category=FutureWarning)
+        return GeoSeries(data=data, index=index, crs=crs, **kwargs)
+
+
+class GeoSeries(GeoPandasBase, Series):
+    """
+    A Series object designed to store shapely geometry objects.
 
-        crs = kwargs.pop('crs', None)
+    The geometries are held in a ``GeometryArray`` (with the ``geometry``
+    dtype). When the data can not be converted to geometries, a normal
+    pandas Series is returned instead.
+    """
+    _metadata = ['name', 'crs']
 
-        super(GeoSeries, self).__init__(*args, **kwargs)
+    def __new__(cls, data=None, index=None, crs=None, **kwargs):
+        # we need to use __new__ because we want to return Series instance
+        # instead of GeoSeries instance in case of non-geometry data
+        if isinstance(data, SingleBlockManager):
+            if isinstance(data.blocks[0].dtype, GeometryDtype):
+                if data.blocks[0].ndim == 2:
+                    # in certain indexing operations (such as .loc) a 2D
+                    # ExtensionBlock (still with 1D values) can be created
+                    from pandas.core.internals import ExtensionBlock
+                    values = data.blocks[0].values
+                    block = ExtensionBlock(
+                        values, slice(0, len(values), 1), ndim=1)
+                    data = SingleBlockManager(
+                        [block], data.axes[0], fastpath=True)
+                self = super(GeoSeries, cls).__new__(cls)
+                super(GeoSeries, self).__init__(data, index=index, **kwargs)
+                self.crs = crs
+                self._invalidate_sindex()
+                return self
+            warnings.warn(_SERIES_WARNING_MSG, FutureWarning, stacklevel=2)
+            return Series(data, index=index, **kwargs)
+
+        if isinstance(data, BaseGeometry):
+            # fix problem for scalar geometries passed, ensure the list of
+            # scalars is of correct length if index is specified
+            n = len(index) if index is not None else 1
+            data = [data] * n
+
+        name = kwargs.pop('name', None)
+
+        if not is_geometry_type(data):
+            # if data is None and dtype is specified (eg from empty overlay
+            # test), specifying dtype raises an error
+            kwargs.pop('dtype', None)
+            # Use Series constructor to handle input data
+            s = pd.Series(data, index=index, name=name, **kwargs)
+            # prevent trying to convert non-geometry objects
+            if s.dtype != object:
+                if s.empty:
+                    s = s.astype(object)
+                else:
+                    warnings.warn(_SERIES_WARNING_MSG, FutureWarning,
+                                  stacklevel=2)
+                    return s
+            # try to convert to GeometryArray, if fails return plain Series
+            try:
+                data = from_shapely(s.values)
+            except TypeError:
+                warnings.warn(_SERIES_WARNING_MSG, FutureWarning,
+                              stacklevel=2)
+                return s
+            index = s.index
+            name = s.name
+
+        self = super(GeoSeries, cls).__new__(cls)
+        super(GeoSeries, self).__init__(data, index=index, name=name,
+                                        **kwargs)
         self.crs = crs
         self._invalidate_sindex()
+        return self
+
+    def __init__(self, *args, **kwargs):
+        # need to overwrite Series init to prevent calling it for GeoSeries
+        # (doesn't know crs, all work is already done above)
+        pass
 
     def append(self, *args, **kwargs):
         return self._wrapped_pandas_method('append', *args, **kwargs)
@@ -116,7 +192,7 @@ class GeoSeries(GeoPandasBase, Series):
 
     @property
     def _constructor(self):
-        return GeoSeries
+        return _geoseries_constructor_with_fallback
 
     def _wrapped_pandas_method(self, mtd, *args, **kwargs):
         """Wrap a generic pandas method to ensure it returns a GeoSeries"""
@@ -139,10 +215,6 @@ class GeoSeries(GeoPandasBase, Series):
     def select(self, *args, **kwargs):
         return self._wrapped_pandas_method('select', *args, **kwargs)
 
-    @property
-    def _can_hold_na(self):
-        return False
-
     def __finalize__(self, other, method=None, **kwargs):
         """ propagate metadata from other to self """
         # NOTE: backported from pandas master (upcoming v0.13)
@@ -182,9 +254,8 @@ class GeoSeries(GeoPandasBase, Series):
         --------
         GeoSereies.notna : inverse of isna
         """
-        non_geo_null = super(GeoSeries, self).isnull()
-        val = self.apply(_is_empty)
-        return Series(np.logical_or(non_geo_null, val))
+        missing, empty = self.values._masks()
+        return Series(missing | empty, index=self.index, name=self.name)
 
     def isnull(self):
         """Alias for `isna` method. See `isna` for more detail."""
@@ -296,12 +367,39 @@ class GeoSeries(GeoPandasBase, Series):
             project = transformer.transform
         else:
             project = partial(pyproj.transform, proj_in, proj_out)
-        result = self.apply(lambda geom: transform(project, geom))
-        result.__class__ = GeoSeries
+        try:
+            coords, _ = self.get_coordinates()
+        except ValueError:
+            # GeometryCollections are transformed one by one
+            result = self.apply(lambda geom: transform(project, geom))
+            result.__class__ = GeoSeries
+        else:
+            coords = np.column_stack(project(*coords.T))
+            result = self.set_coordinates(coords)
+            result.name = self.name
         result.crs = crs
         result._invalidate_sindex()
         return result
 
+    def intern(self):
+        """
+        Returns a ``GeoSeries`` in which repeated geometries are stored once.
+
+        Equal geometries (identified by hashing their WKB) are replaced by
+        an integer code into an array of the unique geometries, like a
+        categorical. This reduces the memory of series with many repeated
+        geometries (e.g. the result of a spatial join with many matches per
+        row), also after copying or pickling the series. Indexing keeps the
+        interned storage.
+
+        Returns
+        -------
+        GeoSeries
+        """
+        result = GeoSeries(self.values.to_storage('interned'),
+                           index=self.index, name=self.name)
+        return result.__finalize__(self)
+
     def to_json(self, **kwargs):
         """
         Returns a GeoJSON string representation of the GeoSeries.
@@ -3,6 +3,7 @@ from distutils.version import LooseVersion
 
 import fiona
 import numpy as np
+import pandas as pd
 
 import six
 
@@ -12,6 +13,7 @@ except ImportError:
     from fiona import drivers as fiona_env
 
 from geopandas import GeoDataFrame, GeoSeries
+from geopandas._coords import GEOMETRY_TYPES, MISSING
 
 
 _FIONA18 = LooseVersion(fiona.__version__) >= LooseVersion('1.8')
@@ -179,11 +181,12 @@ def _geometry_types(df):
         # - 3D and 2D shapes can coexist in inferred schema
         # - Shape and MultiShape types can (and must) coexist in inferred
         #   schema
-        geom_types_2D = df[~df.geometry.has_z].geometry.geom_type.unique()
-        geom_types_2D = [gtype for gtype in geom_types_2D if gtype is not None]
-        geom_types_3D = df[df.geometry.has_z].geometry.geom_type.unique()
-        geom_types_3D = ["3D " + gtype for gtype in geom_types_3D
-                         if gtype is not None]
+        geoms = df.geometry.values
+        codes = geoms._geom_type_codes()
+        has_z = geoms.has_z
+        geom_types_2D = _unique_geom_types(codes[~has_z])
+        geom_types_3D = ["3D " + gtype
+                         for gtype in _unique_geom_types(codes[has_z])]
         geom_types = geom_types_3D + geom_types_2D
 
     else:
@@ -208,18 +211,26 @@ def _geometry_types_back_compat(df):
     """
     for backward compatibility with Fiona<1.8 only
     """
-    unique_geom_types = df.geometry.geom_type.unique()
-    unique_geom_types = [
-        gtype for gtype in unique_geom_types if gtype is not None]
+    geoms = df.geometry.values
+    unique_geom_types = _unique_geom_types(geoms._geom_type_codes())
 
     # merge single and Multi types (eg Polygon and MultiPolygon)
     unique_geom_types = [
         gtype for gtype in unique_geom_types
         if not gtype.startswith('Multi') or gtype[5:] not in unique_geom_types]
 
-    if df.geometry.has_z.any():
+    if geoms.has_z.any():
         # declare all geometries as 3D geometries
         unique_geom_types = ["3D " + type for type in unique_geom_types]
     # by default, all geometries are 2D geometries
 
     return unique_geom_types
+
+
+def _unique_geom_types(codes):
+    """
+    Return the names of the geometry types of an array of type codes, in
+    order of appearance (ignoring missing values).
+    """
+    return [GEOMETRY_TYPES[code] for code in pd.unique(codes)
+            if code != MISSING]
@@ -1,12 +1,14 @@
-import sys
+import numpy as np
 import pandas as pd
-import shapely.wkb
+import shapely.geos
 
-from geopandas import GeoDataFrame
+from geopandas import GeoDataFrame, GeoSeries
+from geopandas.array import from_wkb
 
 
 def read_postgis(sql, con, geom_col='geom', crs=None, index_col=None,
-                 coerce_float=True, parse_dates=None, params=None):
+                 coerce_float=True, parse_dates=None, params=None,
+                 storage='object'):
     """
     Returns a GeoDataFrame corresponding to the result of the query
     string, which must contain a geometry column in WKB representation.
@@ -24,6 +26,11 @@ def read_postgis(sql, con, geom_col='geom', crs=None, index_col=None,
         CRS to use for the returned GeoDataFrame; if not set, tries to
         determine CRS from the SRID associated with the first geometry in
         the database, and assigns that to all geometries.
+    storage : str, default 'object'
+        How the geometries are held in memory, see
+        :func:`geopandas.array.from_shapely`. With 'wkb', the WKB values
+        returned by the database are kept as is and only parsed into Shapely
+        geometries when they are needed.
 
     See the documentation for pandas.read_sql for further explanation
     of the following parameters:
@@ -48,33 +55,15 @@ def read_postgis(sql, con, geom_col='geom', crs=None, index_col=None,
     if geom_col not in df:
         raise ValueError("Query missing geometry column '{}'".format(geom_col))
 
-    geoms = df[geom_col].dropna()
+    # bytes (Python 3), buffer (Python 2) or hex encoded text
+    geoms = from_wkb(df[geom_col].values, storage=storage)
+    df[geom_col] = GeoSeries(geoms, index=df.index)
+    valid = np.flatnonzero(~geoms.isna())
 
-    if not geoms.empty:
-        load_geom_bytes = shapely.wkb.loads
-        """Load from Python 3 binary."""
-
-        def load_geom_buffer(x):
-            """Load from Python 2 binary."""
-            return shapely.wkb.loads(str(x))
-
-        def load_geom_text(x):
-            """Load from binary encoded as text."""
-            return shapely.wkb.loads(str(x), hex=True)
-
-        if sys.version_info.major < 3:
-            if isinstance(geoms.iat[0], buffer):
-                load_geom = load_geom_buffer
-            else:
-                load_geom = load_geom_text
-        elif isinstance(geoms.iat[0], bytes):
-            load_geom = load_geom_bytes
-        else:
-            load_geom = load_geom_text
-
-        df[geom_col] = geoms = geoms.apply(load_geom)
+    if len(valid):
         if crs is None:
-            srid = shapely.geos.lgeos.GEOSGetSRID(geoms.iat[0]._geom)
+            # (only parses the first geometry with the 'wkb' storage)
+            srid = shapely.geos.lgeos.GEOSGetSRID(geoms[valid[0]]._geom)
             # if no defined SRID in geodatabase, returns SRID of 0
             if srid != 0:
                 crs = {"init": "epsg:{}".format(srid)}
@@ -139,3 +139,22 @@ class TestIO:
         finally:
             if 'con' in locals():
                 con.close()
+
+    def test_read_postgis_wkb_storage(self, df_nybb):
+        """Tests that the WKB values can be kept unparsed."""
+        try:
+            con = connect_spatialite()
+        except Exception:
+            raise pytest.skip()
+        else:
+            geom_col = df_nybb.geometry.name
+            create_spatialite(con, df_nybb)
+            sql = ('SELECT ogc_fid, borocode, boroname, shape_leng, '
+                   'shape_area, ST_AsBinary("{0}") AS "{0}" FROM nybb'
+                   .format(geom_col))
+            df = read_postgis(sql, con, geom_col=geom_col, storage='wkb')
+            assert df.geometry.values.storage == 'wkb'
+            validate_boro_df(df)
+        finally:
+            if 'con' in locals():
+                con.close()
@@ -4,6 +4,10 @@ import warnings
 import numpy as np
 import pandas as pd
 
+from geopandas._coords import (
+    POINT, LINESTRING, POLYGON, MULTIPOINT, MULTILINESTRING, MULTIPOLYGON)
+
+
 def _flatten_multi_geoms(geoms, colors=None):
     """
     Returns Series like geoms and colors, except that any Multi geometries
@@ -26,13 +30,15 @@ def _flatten_multi_geoms(geoms, colors=None):
 
     components, component_colors = [], []
 
-    if not geoms.geom_type.str.startswith('Multi').any():
+    is_multi = geoms.values._is_type(
+        MULTIPOINT, MULTILINESTRING, MULTIPOLYGON)
+    if not is_multi.any():
         return geoms, colors
 
     # precondition, so zip can't short-circuit
     assert len(geoms) == len(colors)
-    for geom, color in zip(geoms, colors):
-        if geom.type.startswith('Multi'):
+    for geom, color, multi in zip(geoms, colors, is_multi):
+        if multi:
             for poly in geom:
                 components.append(poly)
                 # repeat same color for all components
@@ -44,6 +50,17 @@ def _flatten_multi_geoms(geoms, colors=None):
     return components, component_colors
 
 
+def _geometry_array(geoms):
+    """Return the GeometryArray of a GeoSeries or a sequence of geometries"""
+    from geopandas.array import GeometryArray, from_shapely
+
+    if isinstance(geoms, pd.Series):
+        geoms = geoms.values
+    if not isinstance(geoms, GeometryArray):
+        geoms = from_shapely(geoms)
+    return geoms
+
+
 def plot_polygon_collection(ax, geoms, values=None, color=None,
                             cmap=None, vmin=None, vmax=None, **kwargs):
     """
@@ -141,9 +158,13 @@ def plot_linestring_collection(ax, geoms, values=None, color=None,
     """
     from matplotlib.collections import LineCollection
 
-    geoms, values = _flatten_multi_geoms(geoms, values)
-    if None in values:
-        values = None
+    # all parts of the (Multi)LineStrings at once from the coordinate buffers
+    buffers = _geometry_array(geoms)._buffers()
+    if values is not None:
+        values = np.repeat(np.asarray(values),
+                           np.diff(buffers.geom_offsets), axis=0)
+        if None in values:
+            values = None
 
     # LineCollection does not accept some kwargs.
     if 'markersize' in kwargs:
@@ -153,7 +174,9 @@ def plot_linestring_collection(ax, geoms, values=None, color=None,
     if color is not None:
         kwargs['color'] = color
 
-    segments = [np.array(linestring)[:, :2] for linestring in geoms]
+    coords, offsets = buffers.coords[:, :2], buffers.ring_offsets
+    segments = [coords[start:stop]
+                for start, stop in zip(offsets[:-1], offsets[1:])]
     collection = LineCollection(segments, **kwargs)
 
     if values is not None:
@@ -274,13 +297,10 @@ def plot_series(s, cmap=None, color=None, ax=None, figsize=None, **style_kwds):
         style_kwds['vmin'] = style_kwds.get('vmin', values.min())
         style_kwds['vmax'] = style_kwds.get('vmax', values.max())
 
-    geom_types = s.geometry.type
-    poly_idx = np.asarray((geom_types == 'Polygon')
-                          | (geom_types == 'MultiPolygon'))
-    line_idx = np.asarray((geom_types == 'LineString')
-                          | (geom_types == 'MultiLineString'))
-    point_idx = np.asarray((geom_types == 'Point')
-                          | (geom_types == 'MultiPoint'))
+    geoms = s.geometry.values
+    poly_idx = geoms._is_type(POLYGON, MULTIPOLYGON)
+    line_idx = geoms._is_type(LINESTRING, MULTILINESTRING)
+    point_idx = geoms._is_type(POINT, MULTIPOINT)
 
     # plot all Polygons and all MultiPolygon components in the same collection
     polys = s.geometry[poly_idx]
@@ -464,13 +484,10 @@ def plot_dataframe(df, column=None, cmap=None, color=None, ax=None, cax=None,
     mn = values[~np.isnan(values)].min() if vmin is None else vmin
     mx = values[~np.isnan(values)].max() if vmax is None else vmax
 
-    geom_types = df.geometry.type
-    poly_idx = np.asarray((geom_types == 'Polygon')
-                          | (geom_types == 'MultiPolygon'))
-    line_idx = np.asarray((geom_types == 'LineString')
-                          | (geom_types == 'MultiLineString'))
-    point_idx = np.asarray((geom_types == 'Point')
-                          | (geom_types == 'MultiPoint'))
+    geoms = df.geometry.values
+    poly_idx = geoms._is_type(POLYGON, MULTIPOLYGON)
+    line_idx = geoms._is_type(LINESTRING, MULTILINESTRING)
+    point_idx = geoms._is_type(POINT, MULTIPOINT)
 
     # plot all Polygons and all MultiPolygon components in the same collection
     polys = df.geometry[poly_idx]
@@ -1,10 +1,228 @@
+import binascii
+from collections import namedtuple
+import hashlib
+import os
+import struct
+
+import numpy as np
+
+import shapely.prepared
+
 from geopandas import base
+from geopandas.array import GeometryArray, from_shapely
 
 if base.HAS_SINDEX:
     from rtree.index import Index as RTreeIndex
+else:
+    RTreeIndex = object
+
+
+# predicates that can refine the results of ``query_bulk``
+VALID_QUERY_PREDICATES = ['intersects', 'within', 'contains', 'overlaps',
+                          'crosses', 'touches', 'covers', 'contains_properly']
 
 
-class SpatialIndex(RTreeIndex):
+class BulkQueryMixin(object):
+    """
+    Implements ``query_bulk`` and ``nearest`` on top of the
+    ``_query_pairs(boxes)`` of a spatial index.
+
+    The predicates and distances are evaluated against the indexed
+    geometries, which are set as the ``geometries`` attribute (a
+    GeometryArray) when the index is generated by a GeoSeries or
+    GeoDataFrame.
+    """
+
+    geometries = None
+
+    def query_bulk(self, geometry, predicate=None):
+        """
+        Find the indexed items intersecting each of the input geometries or
+        bounds, in one call.
+
+        Parameters
+        ----------
+        geometry : GeoSeries, GeometryArray, array-like of geometries or \
+array of shape (N, 4)
+            The input geometries, or their minx, miny, maxx, maxy bounds.
+        predicate : str, optional
+            If given, only keep the pairs for which
+            ``input_geometry.<predicate>(tree_geometry)`` is True, one of
+            'intersects', 'within', 'contains', 'overlaps', 'crosses',
+            'touches', 'covers' or 'contains_properly'. By default, the
+            pairs of which the bounding boxes intersect are returned.
+
+        Returns
+        -------
+        ndarray of shape (2, n)
+            The positions of the input geometries (first row) and of the
+            indexed items (second row) of each pair, ordered by the input
+            position (and for each input in the order in which the index
+            finds the items). Missing and empty geometries never match.
+        """
+        if predicate is not None and predicate not in VALID_QUERY_PREDICATES:
+            raise ValueError(
+                "predicate should be one of {0}, got '{1}'".format(
+                    VALID_QUERY_PREDICATES, predicate))
+        boxes = None
+        if isinstance(geometry, np.ndarray) and geometry.dtype.kind in 'fiu':
+            boxes = geometry.astype('float64').reshape(-1, 4)
+            if predicate is not None:
+                raise ValueError(
+                    "A predicate can only be evaluated for geometries, not "
+                    "for bounds")
+        else:
+            geometry = _as_geometry_array(geometry)
+            boxes = geometry.bounds
+
+        input_idx, tree_idx = self._query_pairs(boxes)
+        # (a stable sort keeps the order of the items found by the index)
+        order = np.argsort(input_idx, kind='mergesort')
+        input_idx, tree_idx = input_idx[order], tree_idx[order]
+        if predicate is not None and len(input_idx):
+            self._check_geometries()
+            keep = _refine(predicate, geometry.data, self.geometries.data,
+                           input_idx, tree_idx)
+            input_idx, tree_idx = input_idx[keep], tree_idx[keep]
+        return np.vstack([input_idx, tree_idx]).astype(np.int64)
+
+    def _check_geometries(self):
+        if self.geometries is None:
+            raise ValueError(
+                "The index has no geometries to evaluate the predicate or "
+                "distance")
+
+    def nearest(self, geometry, k=1, max_distance=None,
+                return_distance=True):
+        """
+        Find the ``k`` nearest indexed geometries of each input geometry.
+
+        The distances are the exact distances between the geometries, not
+        between their bounding boxes. The candidates are found with bulk
+        queries of the input bounding boxes, expanded by a search radius
+        that is doubled for the inputs with less than ``k`` geometries
+        within that radius.
+
+        Parameters
+        ----------
+        geometry : GeoSeries, GeometryArray or array-like of geometries
+            The input geometries.
+        k : int, default 1
+            The number of nearest geometries to find for each input.
+        max_distance : float, optional
+            Only find geometries within this distance. Setting it limits
+            the search for inputs far from the indexed geometries.
+        return_distance : bool, default True
+            Whether to also return the distances.
+
+        Returns
+        -------
+        indices : ndarray of shape (2, n)
+            The positions of the input geometries (first row) and of their
+            nearest indexed geometries (second row), for each input ordered
+            by distance (and position for equal distances). Inputs get fewer
+            than ``k`` results if there are fewer indexed geometries (within
+            ``max_distance``), and none if they are missing or empty.
+        distances : ndarray of shape (n,)
+            The distance of each pair, if ``return_distance`` is True.
+        """
+        if int(k) < 1:
+            raise ValueError("'k' should be at least 1")
+        if max_distance is not None and max_distance < 0:
+            raise ValueError("'max_distance' should not be negative")
+        self._check_geometries()
+        geometry = _as_geometry_array(geometry)
+        boxes = geometry.bounds
+
+        tree_bounds = self.geometries.total_bounds
+        n_items = np.count_nonzero(~np.isnan(self.geometries.bounds[:, 0]))
+        # the radius from which the expanded boxes cover all items
+        cover_radius = np.nanmax(np.column_stack([
+            np.zeros(len(boxes)),
+            boxes[:, 0] - tree_bounds[0], boxes[:, 1] - tree_bounds[1],
+            tree_bounds[2] - boxes[:, 2], tree_bounds[3] - boxes[:, 3]]),
+            axis=1)
+        max_radius = cover_radius
+        if max_distance is not None:
+            max_radius = np.minimum(cover_radius, max_distance)
+        # start at the typical spacing of k items
+        width, height = tree_bounds[2:] - tree_bounds[:2]
+        radius = np.sqrt(width * height / max(n_items, 1) * k)
+        if not radius > 0:
+            radius = max(width, height) / max(n_items, 1) * k
+        radius = np.minimum(radius, max_radius)
+
+        todo = np.flatnonzero(~np.isnan(boxes[:, 0]) & (n_items > 0))
+        results = [(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                    np.empty(0))]
+        while len(todo):
+            r = radius[todo]
+            query = boxes[todo] + np.column_stack([-r, -r, r, r])
+            input_idx, tree_idx = self._query_pairs(query)
+            input_idx = todo[input_idx]
+            distance = geometry.take(input_idx).distance(
+                self.geometries.take(tree_idx))
+            # the items not found by the query are farther away than the
+            # radius, unless the query covers all items
+            found = ((distance <= radius[input_idx])
+                     | (radius[input_idx] >= cover_radius[input_idx]))
+            if max_distance is not None:
+                found &= distance <= max_distance
+            input_idx = input_idx[found]
+            n_found = np.bincount(input_idx, minlength=len(boxes))[todo]
+            done = (n_found >= k) | (radius[todo] >= max_radius[todo])
+            keep = np.in1d(input_idx, todo[done])
+            results.append((input_idx[keep], tree_idx[found][keep],
+                            distance[found][keep]))
+            todo = todo[~done]
+            r = radius[todo]
+            radius[todo] = np.where(
+                r > 0, np.minimum(r * 2, max_radius[todo]), max_radius[todo])
+
+        input_idx, tree_idx, distance = (
+            np.concatenate(arrays) for arrays in zip(*results))
+        order = np.lexsort((tree_idx, distance, input_idx))
+        input_idx, tree_idx, distance = (
+            input_idx[order], tree_idx[order], distance[order])
+        # the rank of each pair among the pairs of its input
+        starts = np.searchsorted(input_idx, input_idx)
+        nearest = np.arange(len(input_idx)) - starts < k
+        indices = np.vstack(
+            [input_idx[nearest], tree_idx[nearest]]).astype(np.int64)
+        if return_distance:
+            return indices, distance[nearest]
+        return indices
+
+
+def _as_geometry_array(geometry):
+    """
+    Return a GeoSeries, GeoDataFrame or array-like of geometries as a
+    GeometryArray.
+    """
+    if hasattr(geometry, 'geometry'):
+        return geometry.geometry.values
+    elif not isinstance(geometry, GeometryArray):
+        return from_shapely(geometry)
+    return geometry
+
+
+def _refine(predicate, left, right, input_idx, tree_idx):
+    """
+    Evaluate ``left[i].<predicate>(right[j])`` for the candidate pairs
+    (sorted by ``i``), preparing each left geometry once.
+    """
+    keep = np.zeros(len(input_idx), dtype=bool)
+    previous, prepared = None, None
+    for k in range(len(input_idx)):
+        i = input_idx[k]
+        if i != previous:
+            previous = i
+            prepared = shapely.prepared.prep(left[i])
+        keep[k] = getattr(prepared, predicate)(right[tree_idx[k]])
+    return keep
+
+
+class SpatialIndex(BulkQueryMixin, RTreeIndex):
     """
     A simple wrapper around rtree's RTree Index
     """
@@ -14,6 +232,20 @@ class SpatialIndex(RTreeIndex):
             raise ImportError("SpatialIndex needs `rtree`")
         RTreeIndex.__init__(self, *args)
 
+    def _query_pairs(self, boxes):
+        """
+        Find the items intersecting each of the boxes (an array of shape
+        (M, 4)), querying the index box by box.
+        """
+        input_idx, tree_idx = [], []
+        for i in np.flatnonzero(~np.isnan(boxes).any(axis=1)):
+            hits = list(self.intersection(tuple(boxes[i])))
+            input_idx.append(np.full(len(hits), i, dtype=np.int64))
+            tree_idx.append(np.asarray(hits, dtype=np.int64))
+        if not input_idx:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(input_idx), np.concatenate(tree_idx)
+
     @property
     def size(self):
         return len(self.leaves()[0][1])
@@ -23,3 +255,294 @@ class SpatialIndex(RTreeIndex):
         if len(self.leaves()) > 1:
             return False
         return self.size < 1
+
+
+# result of ``intersection(..., objects=True)``, as rtree's Item
+Item = namedtuple('Item', ['id', 'object', 'bbox'])
+
+# file layout of a saved STRTreeIndex: a header with the magic string, the
+# node capacity, the number of bounds, items and levels and the digest of
+# the bounds, the length of each level, and the bounds, item positions and
+# level bounds arrays (little-endian)
+_MAGIC = b'GPDSTRT1'
+_HEADER = struct.Struct('<8sQQQQ20s4x')
+_LENGTH = struct.Struct('<Q')
+
+
+class STRTreeIndex(BulkQueryMixin):
+    """
+    Packed, read-only R-tree bulk loaded with the Sort-Tile-Recursive (STR)
+    algorithm.
+
+    The items are sorted in vertical slices by the x and within those by the
+    y coordinate of their center, and packed in leaf nodes of
+    ``node_capacity`` consecutive items. Each upper level packs consecutive
+    nodes of the level below, up to a single root node. The tree is built
+    from the bounds array at once and stored as one bounds array per level,
+    the children of node ``i`` being the nodes (or items) ``i * capacity``
+    to ``(i + 1) * capacity`` of the level below.
+
+    Parameters
+    ----------
+    bounds : array-like of shape (N, 4)
+        The minx, miny, maxx, maxy of each item. Rows with NaN values
+        (missing or empty geometries) are not indexed.
+    objects : array-like, optional
+        An object for each item (e.g. the index labels), returned by
+        :meth:`intersection` with ``objects=True``.
+    node_capacity : int, default 16
+        The maximum number of children of a node.
+    """
+
+    # digest of the bounds of a loaded tree
+    _digest = None
+
+    def __init__(self, bounds, objects=None, node_capacity=16):
+        bounds = np.asarray(bounds, dtype='float64').reshape(-1, 4)
+        if node_capacity < 2:
+            raise ValueError("'node_capacity' should be at least 2")
+        self.node_capacity = int(node_capacity)
+        self.objects = objects
+        self._bounds = bounds
+
+        valid = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+        # the item positions, in the order of the tree
+        self._ids = valid[_str_order(bounds[valid], self.node_capacity)]
+        levels = [bounds[self._ids]]
+        while len(levels[-1]) > 1:
+            levels.append(_pack(levels[-1], self.node_capacity))
+        self._levels = levels
+
+    def save(self, path):
+        """
+        Write the tree to a file in a flat binary layout, which
+        :meth:`STRTreeIndex.load` reads back without rebuilding the tree.
+
+        The objects and geometries of the index are not saved.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        """
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(
+                _MAGIC, self.node_capacity, len(self._bounds), self.size,
+                len(self._levels), _bounds_digest(self._bounds)))
+            for level in self._levels:
+                f.write(_LENGTH.pack(len(level)))
+            for array, dtype in ([(self._bounds, '<f8'), (self._ids, '<i8')]
+                                 + [(level, '<f8') for level in self._levels]):
+                f.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+
+    @classmethod
+    def load(cls, path, objects=None, mmap=True):
+        """
+        Read a tree written by :meth:`STRTreeIndex.save`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        objects : array-like, optional
+            An object for each item, see :class:`STRTreeIndex`.
+        mmap : bool, default True
+            Whether to memory-map the arrays of the tree (read-only) instead
+            of reading them in memory, so loading takes constant time and
+            the pages of the file are shared between processes.
+
+        Returns
+        -------
+        STRTreeIndex
+        """
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[:8] != _MAGIC:
+                raise ValueError(
+                    "'{0}' is not a saved STRTreeIndex".format(path))
+            (_, node_capacity, n_bounds, n_ids, n_levels,
+             digest) = _HEADER.unpack(header)
+            lengths = [_LENGTH.unpack(f.read(_LENGTH.size))[0]
+                       for _ in range(n_levels)]
+
+            offset = f.tell()
+            arrays = []
+            for dtype, shape in ([('<f8', (n_bounds, 4)), ('<i8', (n_ids,))]
+                                 + [('<f8', (n, 4)) for n in lengths]):
+                count = int(np.prod(shape))
+                if not count:
+                    array = np.empty(shape, dtype=dtype)
+                elif mmap:
+                    array = np.memmap(path, dtype=dtype, mode='r',
+                                      offset=offset, shape=shape)
+                else:
+                    f.seek(offset)
+                    array = np.fromfile(f, dtype=dtype, count=count)
+                    if len(array) < count:
+                        raise ValueError(
+                            "'{0}' is truncated".format(path))
+                    array = array.reshape(shape)
+                arrays.append(array)
+                offset += count * np.dtype(dtype).itemsize
+
+        sindex = cls.__new__(cls)
+        sindex.node_capacity = int(node_capacity)
+        sindex.objects = objects
+        sindex._bounds = arrays[0]
+        sindex._ids = arrays[1]
+        sindex._levels = arrays[2:]
+        sindex._digest = digest
+        return sindex
+
+    @property
+    def size(self):
+        """The number of indexed items."""
+        return len(self._ids)
+
+    @property
+    def is_empty(self):
+        return self.size == 0
+
+    @property
+    def bounds(self):
+        """The minx, miny, maxx, maxy of all items."""
+        if self.is_empty:
+            return np.array([np.nan] * 4)
+        return self._levels[-1][0].copy()
+
+    def _query_pairs(self, boxes):
+        """
+        Find the items intersecting each of the boxes (an array of shape
+        (M, 4)), by descending the tree for all boxes at once.
+
+        Returns the positions of the boxes and of the items of each
+        intersecting pair.
+        """
+        capacity = self.node_capacity
+        box_idx = np.arange(len(boxes))
+        node_idx = np.zeros(len(boxes), dtype=np.intp)
+        if self.is_empty:
+            box_idx = node_idx = box_idx[:0]
+        for level in range(len(self._levels) - 1, -1, -1):
+            nodes = self._levels[level][node_idx]
+            query = boxes[box_idx]
+            hit = ((nodes[:, 0] <= query[:, 2]) & (nodes[:, 2] >= query[:, 0])
+                   & (nodes[:, 1] <= query[:, 3])
+                   & (nodes[:, 3] >= query[:, 1]))
+            box_idx, node_idx = box_idx[hit], node_idx[hit]
+            if level == 0:
+                break
+            # continue with the children of the intersecting nodes
+            starts = node_idx * capacity
+            counts = np.minimum(
+                starts + capacity, len(self._levels[level - 1])) - starts
+            box_idx = np.repeat(box_idx, counts)
+            node_idx = np.arange(counts.sum()) + np.repeat(
+                starts - (np.cumsum(counts) - counts), counts)
+        return box_idx, self._ids[node_idx]
+
+    def _query_box(self, box):
+        """Positions of the items intersecting a single box."""
+        minx, miny, maxx, maxy = box
+        children = np.arange(self.node_capacity)
+        node_idx = np.zeros(0 if self.is_empty else 1, dtype=np.intp)
+        for level in range(len(self._levels) - 1, -1, -1):
+            nodes = self._levels[level][node_idx]
+            node_idx = node_idx[
+                (nodes[:, 0] <= maxx) & (nodes[:, 2] >= minx)
+                & (nodes[:, 1] <= maxy) & (nodes[:, 3] >= miny)]
+            if level == 0:
+                break
+            node_idx = (node_idx[:, np.newaxis] * self.node_capacity
+                        + children).ravel()
+            node_idx = node_idx[node_idx < len(self._levels[level - 1])]
+        return self._ids[node_idx]
+
+    def intersection(self, coordinates, objects=False):
+        """
+        Return the items of which the bounds intersect the given bounds.
+
+        Parameters
+        ----------
+        coordinates : sequence
+            The minx, miny, maxx, maxy of the query box, or the x, y of a
+            point.
+        objects : bool or 'raw', default False
+            If False, return the positions of the items. If True, return
+            ``Item`` tuples with the ``id`` (position), ``object`` and
+            ``bbox`` of each item, and with 'raw' only the objects.
+
+        Returns
+        -------
+        list
+            The items in order of their positions.
+        """
+        box = np.asarray(coordinates, dtype='float64')
+        if len(box) == 2:
+            box = np.concatenate([box, box])
+        ids = np.sort(self._query_box(box))
+        if not objects:
+            return ids.tolist()
+        if self.objects is None:
+            raise ValueError("The index has no objects")
+        if objects == 'raw':
+            return [self.objects[i] for i in ids]
+        return [Item(i, self.objects[i], self._bounds[i].tolist())
+                for i in ids]
+
+
+def _bounds_digest(bounds):
+    """SHA-1 digest of a bounds array, identifying the geometries' extents."""
+    bounds = np.ascontiguousarray(bounds, dtype='<f8')
+    return hashlib.sha1(bounds.tobytes()).digest()
+
+
+def _cached_strtree(bounds, cache_dir):
+    """
+    Load the STRTreeIndex of the bounds from the cache directory, or build
+    and save it there. The files are named by the digest of the bounds.
+    """
+    digest = _bounds_digest(bounds)
+    path = os.path.join(cache_dir, '{0}.strtree'.format(
+        binascii.hexlify(digest).decode('ascii')))
+    if os.path.exists(path):
+        sindex = STRTreeIndex.load(path)
+        if sindex._digest == digest:
+            return sindex
+    sindex = STRTreeIndex(bounds)
+    # write to a temporary file first, so concurrent processes never load
+    # a partially written file
+    tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+    sindex.save(tmp_path)
+    try:
+        os.rename(tmp_path, path)
+    except OSError:
+        # e.g. the file was created in the meantime on Windows
+        os.remove(tmp_path)
+    return sindex
+
+
+def _str_order(bounds, capacity):
+    """
+    Order of the items of a bounds array by Sort-Tile-Recursive: sorted by
+    the x of their center in vertical slices of ``sqrt(n_nodes)`` nodes,
+    and by the y of their center within each slice.
+    """
+    n = len(bounds)
+    x = (bounds[:, 0] + bounds[:, 2]) / 2
+    y = (bounds[:, 1] + bounds[:, 3]) / 2
+    n_nodes = -(-n // capacity)
+    slice_size = int(np.ceil(np.sqrt(n_nodes))) * capacity
+    order = np.argsort(x, kind='mergesort')
+    slices = np.arange(n) // max(slice_size, 1)
+    return order[np.lexsort((y[order], slices))]
+
+
+def _pack(bounds, capacity):
+    """Bounds of the nodes packing ``capacity`` consecutive items."""
+    starts = np.arange(0, len(bounds), capacity)
+    return np.column_stack([
+        np.minimum.reduceat(bounds[:, 0], starts),
+        np.minimum.reduceat(bounds[:, 1], starts),
+        np.maximum.reduceat(bounds[:, 2], starts),
+        np.maximum.reduceat(bounds[:, 3], starts)])
@@ -41,6 +41,40 @@ def test_points():
         assert points[i].x == x[i]
         assert points[i].y == y[i]
 
+    # the coordinates are stored without copying
+    assert points.storage == 'points'
+    assert np.shares_memory(points.x, x)
+    assert np.shares_memory(points.y, y)
+    np.testing.assert_array_equal(points.x, x)
+    np.testing.assert_array_equal(points.y, y)
+
+    points = points_from_xy(x, y, x)
+    assert points[1].has_z
+    assert points[1].z == x[1]
+    assert all(p.equals(shapely.geometry.Point(i, i ** 2, i))
+               for i, p in enumerate(points.data))
+
+    with pytest.raises(ValueError):
+        points_from_xy(x, y[:5])
+
+
+def test_points_storage():
+    arr = P.to_storage('points')
+    assert arr.storage == 'points'
+    np.testing.assert_array_equal(arr.x, [p.x for p in points])
+    np.testing.assert_array_equal(arr.y, [p.y for p in points])
+    assert all(a.equals(b) for a, b in zip(arr.data, points))
+
+    # coordinate buffers of points also give direct access to x / y
+    arr = P.to_storage('coords')
+    np.testing.assert_array_equal(arr.x, [p.x for p in points])
+    assert arr._data is None
+
+    with pytest.raises(ValueError):
+        T.to_storage('points')
+    with pytest.raises(ValueError):
+        from_shapely([points[0], None], storage='points')
+
 
 def test_points_from_xy():
     # testing the top-level interface
@@ -51,15 +85,26 @@ def test_points_from_xy():
     gsz = [shapely.geometry.Point(x, x, x) for x in range(10)]
     geometry1 = geopandas.points_from_xy(df['x'], df['y'])
     geometry2 = geopandas.points_from_xy(df['x'], df['y'], df['z'])
-    assert geometry1 == gs
-    assert geometry2 == gsz
+    assert isinstance(geometry1, GeometryArray)
+    assert isinstance(geometry2, GeometryArray)
+    assert list(geometry1) == gs
+    assert list(geometry2) == gsz
 
     # using Series or numpy arrays or lists
     for s in [pd.Series(range(10)), np.arange(10), list(range(10))]:
         geometry1 = geopandas.points_from_xy(s, s)
         geometry2 = geopandas.points_from_xy(s, s, s)
-        assert geometry1 == gs
-        assert geometry2 == gsz
+        assert list(geometry1) == gs
+        assert list(geometry2) == gsz
+
+    # the coordinates are not copied when wrapped in a GeoSeries/GeoDataFrame
+    x = np.arange(10, dtype='float64')
+    geometry = geopandas.points_from_xy(x, x)
+    s = geopandas.GeoSeries(geometry)
+    assert s.values is geometry
+    assert np.shares_memory(s.x.values, x)
+    gdf = geopandas.GeoDataFrame(df, geometry=geometry)
+    assert np.shares_memory(gdf.geometry.x.values, x)
 
     # using different lengths should throw error
     arr_10 = np.arange(10)
@@ -117,6 +162,87 @@ def test_from_wkb():
     assert res[-2] is None
 
 
+def test_from_wkb_hex_and_fixed_width():
+    geoms = [shapely.geometry.Point(1, 0),
+             shapely.geometry.Polygon([(0, 0), (1, 0), (1, 1)])]
+
+    # hex encoded, as str or bytes
+    L_hex = [g.wkb_hex for g in geoms]
+    for data in [L_hex, [h.encode('ascii') for h in L_hex]]:
+        res = from_wkb(data)
+        assert all(v.equals(t) for v, t in zip(res, geoms))
+
+    # fixed-width arrays (the WKB of the point ends with null bytes)
+    for data in [np.array([g.wkb for g in geoms] + [b'']),
+                 np.array(L_hex + [u''])]:
+        assert data.dtype.kind in 'SU'
+        res = from_wkb(data)
+        assert all(v.equals(t) for v, t in zip(res[:2], geoms))
+        assert res[2] is None
+
+
+def test_from_wkb_lazy():
+    from geopandas._coords import POINT, POLYGON, MULTIPOLYGON, MISSING
+
+    geoms = [shapely.geometry.Point(1, 2, 3), None,
+             shapely.geometry.Polygon(
+                 [(0, 0), (4, 0), (4, 4)], [[(1, 1), (2, 1), (2, 2)]]),
+             shapely.geometry.MultiPolygon([triangles[1], triangles[2]]),
+             shapely.geometry.Polygon()]
+    L_wkb = [g.wkb if g is not None else None for g in geoms]
+    # (big endian and ISO / extended WKB are read as well)
+    L_wkb[2] = shapely.wkb.dumps(geoms[2], big_endian=True)
+    arr = from_wkb(L_wkb, storage='wkb')
+    assert arr.storage == 'wkb'
+
+    # read from the WKB without parsing the geometries
+    np.testing.assert_array_equal(
+        arr.type_codes, [POINT, MISSING, POLYGON, MULTIPOLYGON,
+                         arr.type_codes[4]])
+    np.testing.assert_array_equal(arr.has_z, [True, False, False, False,
+                                              False])
+    np.testing.assert_array_equal(arr.isna(), [0, 1, 0, 0, 0])
+    np.testing.assert_array_equal(arr.is_empty, [0, 0, 0, 0, 1])
+    np.testing.assert_array_equal(
+        arr.bounds, from_shapely(geoms).bounds)
+    np.testing.assert_array_equal(
+        arr._counts(), from_shapely(geoms)._counts())
+    assert arr.memory_usage(deep=True) > 0
+    assert arr._data is None
+
+    # single elements are parsed on access
+    assert arr[3].equals_exact(geoms[3], 0)
+    assert arr[1] is None
+    assert arr._data is None
+
+    # written back without a round-trip
+    res = to_wkb(arr)
+    assert list(res) == L_wkb
+    assert list(to_wkb(arr, hex=True)[:2]) == [geoms[0].wkb_hex, None]
+
+    # conversions
+    _assert_geoms_almost_equal(arr.to_storage('coords'), geoms[:4] + [
+        shapely.geometry.GeometryCollection()])
+    res = from_shapely(geoms).to_storage('wkb')
+    assert res.storage == 'wkb'
+    assert list(to_wkb(res)[:2]) == [geoms[0].wkb, None]
+
+
+@pytest.mark.parametrize('chunksize', [None, 1, 7])
+def test_from_to_wkb_threads(chunksize):
+    L_wkb = [p.wkb for p in points] + [None]
+    res = from_wkb(L_wkb, n_jobs=3, chunksize=chunksize)
+    assert all(v.equals(t) for v, t in zip(res[:-1], points))
+    assert res[-1] is None
+
+    exp = to_wkb(res)
+    np.testing.assert_array_equal(
+        to_wkb(res, n_jobs=3, chunksize=chunksize), exp)
+    np.testing.assert_array_equal(
+        to_wkb(res, hex=True, n_jobs=-1, chunksize=chunksize),
+        [p.wkb_hex for p in points] + [None])
+
+
 def test_to_wkb():
     res = to_wkb(P)
     exp = np.array([p.wkb for p in points], dtype=object)
@@ -157,6 +283,42 @@ def test_from_wkt(string_type):
     assert res[-2] is None
 
 
+def test_from_wkt_iterator():
+    L_wkt = [p.wkt for p in points] + ['', None]
+    res = from_wkt(iter(L_wkt), chunksize=3)
+    assert isinstance(res, GeometryArray)
+    assert len(res) == 22
+    assert all(v.almost_equals(t) for v, t in zip(res, points))
+    assert res[-1] is None
+    assert res[-2] is None
+
+    res = from_wkt(p.wkt for p in [])
+    assert isinstance(res, GeometryArray)
+    assert len(res) == 0
+
+
+@pytest.mark.parametrize('chunksize', [None, 1, 7])
+def test_from_to_wkt_threads(chunksize):
+    L_wkt = [p.wkt for p in points] + [None]
+    res = from_wkt(L_wkt, n_jobs=3, chunksize=chunksize)
+    assert all(v.almost_equals(t) for v, t in zip(res[:-1], points))
+    assert res[-1] is None
+    np.testing.assert_array_equal(
+        to_wkt(res, n_jobs=-1, chunksize=chunksize), L_wkt)
+
+
+def test_to_wkt_rounding_precision():
+    a = from_shapely([shapely.geometry.Point(123.456789, 0.000123),
+                      shapely.geometry.LineString([(10.5, 2), (1, 1.25)]),
+                      None])
+    res = to_wkt(a, rounding_precision=2)
+    assert list(res) == ['POINT (123.46 0)',
+                         'LINESTRING (10.5 2, 1 1.25)', None]
+    res = to_wkt(a, rounding_precision=4, n_jobs=2, chunksize=1)
+    assert list(res) == ['POINT (123.4568 0.0001)',
+                         'LINESTRING (10.5 2, 1 1.25)', None]
+
+
 def test_to_wkt():
     res = to_wkt(P)
     exp = np.array([p.wkt for p in points], dtype=object)
@@ -167,3 +329,826 @@ def test_to_wkt():
     a = from_shapely([None, points[0]])
     res = to_wkt(a)
     assert res[0] is None
+
+
+def test_coords_storage_roundtrip():
+    from shapely.geometry import (
+        Point, LineString, LinearRing, Polygon, MultiPoint, MultiLineString,
+        MultiPolygon, GeometryCollection)
+
+    square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    hole = [(2, 2), (4, 2), (4, 4), (2, 4)]
+    geoms = [
+        Point(1, 2),
+        None,
+        LineString([(0, 0), (1, 1), (2, 0)]),
+        LinearRing([(0, 0), (1, 0), (1, 1)]),
+        Polygon(square, [hole]),
+        MultiPoint([(0, 0), (1, 1)]),
+        MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3), (4, 2)]]),
+        MultiPolygon([Polygon(square, [hole]),
+                      Polygon([(20, 20), (21, 20), (21, 21)])]),
+        Point(),
+        Polygon(),
+        GeometryCollection(),
+    ]
+    arr = from_shapely(geoms, storage='coords')
+    assert isinstance(arr, GeometryArray)
+    assert arr.storage == 'coords'
+    assert len(arr) == len(geoms)
+    # nothing materialized yet, single elements are created on demand
+    assert arr._data is None
+    assert arr[4].equals(geoms[4])
+    assert arr._data is None
+
+    for res, exp in zip(arr.data, geoms):
+        if exp is None:
+            assert res is None
+        elif exp.is_empty:
+            assert res.is_empty
+            assert type(res) == type(exp)
+        else:
+            assert type(res) == type(exp)
+            assert res.equals(exp)
+
+    # operations work on the materialized geometries
+    np.testing.assert_allclose(arr.area[:8], [0, np.nan, 0, 0, 96, 0, 0,
+                                              96.5])
+
+
+def test_coords_storage_z():
+    geoms = [shapely.geometry.Point(0, 0, 1),
+             shapely.geometry.LineString([(0, 0), (1, 1)])]
+    arr = from_shapely(geoms, storage='coords')
+    assert arr._coords.ndim == 3
+    assert arr[0].has_z
+    assert arr[0].z == 1
+    assert not arr[1].has_z
+    assert arr[1].equals(geoms[1])
+
+
+def test_coords_storage_conversion():
+    arr = P.to_storage('coords')
+    assert arr.storage == 'coords'
+    assert arr.to_storage('coords') is arr
+    obj = arr.to_storage('object')
+    assert obj.storage == 'object'
+    assert all(a.equals(b) for a, b in zip(obj, points))
+
+    with pytest.raises(ValueError):
+        P.to_storage('unknown')
+
+    with pytest.raises(ValueError):
+        from_shapely([shapely.geometry.GeometryCollection([point])],
+                     storage='coords')
+
+
+@pytest.mark.parametrize(
+    'storage', ['coords', 'points', 'float32', 'quantized', 'wkb'])
+def test_storage_indexing(storage):
+    if storage == 'points':
+        geoms = [shapely.geometry.Point(1, 2), shapely.geometry.Point(3, 4),
+                 shapely.geometry.Point(5, 6, 7), shapely.geometry.Point(0, 0)]
+    else:
+        geoms = [shapely.geometry.Point(1, 2), None,
+                 shapely.geometry.Polygon(
+                     [(0, 0), (4, 0), (4, 4)], [[(1, 1), (2, 1), (2, 2)]]),
+                 shapely.geometry.MultiLineString([[(0, 0), (1, 2)],
+                                                   [(3, 3), (4, 4)]])]
+    arr = from_shapely(geoms, storage=storage)
+    arr.bounds
+    expected = np.empty(len(geoms), dtype=object)
+    expected[:] = geoms
+
+    for idx in [slice(1, 3), slice(None, None, -2), [3, 0, 3],
+                np.array([True, False, False, True]), []]:
+        res = arr[idx]
+        # subset without materializing the geometries
+        assert res.storage == storage
+        assert res._data is None
+        if isinstance(idx, list):
+            idx = np.array(idx, dtype=np.intp)
+        assert len(res) == len(expected[idx])
+        _assert_geoms_almost_equal_decimal(res, expected[idx], 1e-6)
+        np.testing.assert_array_equal(res._bounds, arr.bounds[idx])
+    _assert_geoms_almost_equal_decimal([arr[-1]], geoms[-1:], 1e-6)
+
+    res = arr.take([3, -1, 0], allow_fill=True)
+    assert res._data is None
+    _assert_geoms_almost_equal_decimal(
+        res, [geoms[3], None, geoms[0]], 1e-6)
+    np.testing.assert_array_equal(res.isna(), [False, True, False])
+    res = arr.take([3, -1])
+    _assert_geoms_almost_equal_decimal(res, [geoms[3], geoms[3]], 1e-6)
+    res = arr[:0].take([-1], allow_fill=True)
+    assert res[0] is None
+    with pytest.raises(IndexError):
+        arr.take([4])
+
+
+@pytest.mark.parametrize(
+    'storage',
+    ['object', 'coords', 'points', 'float32', 'quantized', 'wkb', 'interned'])
+def test_concat_storage(storage):
+    if storage == 'points':
+        geoms1 = [shapely.geometry.Point(1, 2), shapely.geometry.Point(3, 4)]
+        geoms2 = [shapely.geometry.Point(5, 6, 7)]
+    else:
+        geoms1 = [shapely.geometry.Point(1, 2), None,
+                  shapely.geometry.Polygon(
+                      [(0, 0), (4, 0), (4, 4)], [[(1, 1), (2, 1), (2, 2)]])]
+        geoms2 = [shapely.geometry.MultiLineString(
+                      [[(0, 0), (1, 2, 3)], [(3, 3, 3), (4, 4, 4)]]),
+                  shapely.geometry.Point(1, 2), None]
+    arr1 = from_shapely(geoms1, storage=storage)
+    arr2 = from_shapely(geoms2, storage=storage)
+    for arrays in [[arr1, arr2], [arr1, arr2[:0], arr1[::-1]]]:
+        res = GeometryArray._concat_same_type(arrays)
+        assert res.storage == storage
+        assert res._data is None or storage == 'object'
+        expected = sum([list(a.data) for a in arrays], [])
+        _assert_geoms_almost_equal_decimal(res, expected, 1e-6)
+        np.testing.assert_allclose(
+            res.bounds, np.concatenate([a.bounds for a in arrays]),
+            atol=1e-6)
+
+    # also through pandas
+    s = pd.concat([geopandas.GeoSeries(arr1), geopandas.GeoSeries(arr2)])
+    assert s.values.storage == storage
+    # different storages give Shapely objects
+    res = GeometryArray._concat_same_type([arr1, from_shapely(geoms2)])
+    assert res.storage == 'object'
+    _assert_geoms_almost_equal_decimal(res, geoms1 + geoms2, 1e-6)
+
+
+def test_concat_quantized_grids():
+    geoms = [shapely.geometry.Point(1, 2),
+             shapely.geometry.LineString([(0, 0), (10, 10)])]
+    arr1 = from_shapely(geoms, storage='quantized', scale=0.5)
+    arr2 = from_shapely(geoms[::-1], storage='quantized', scale=0.5)
+    res = GeometryArray._concat_same_type([arr1, arr2])
+    np.testing.assert_array_equal(res._coords.scale, [0.5, 0.5])
+    assert res._coords.fixed_scale
+    # different grids are encoded again
+    arr3 = from_shapely([shapely.geometry.Point(100, 200)],
+                        storage='quantized')
+    res = GeometryArray._concat_same_type([arr1, arr3])
+    assert res.storage == 'quantized'
+    assert not res._coords.fixed_scale
+    _assert_geoms_almost_equal_decimal(
+        res, geoms + [shapely.geometry.Point(100, 200)], 1e-6)
+
+
+@pytest.mark.parametrize(
+    'storage',
+    ['object', 'coords', 'points', 'float32', 'quantized', 'wkb', 'interned'])
+def test_slice_independent_of_parent(storage):
+    arr = from_shapely([shapely.geometry.Point(0, 0),
+                        shapely.geometry.Point(1, 1)], storage=storage)
+    arr.bounds
+    view = arr[0:2]
+    arr[0] = shapely.geometry.Point(10, 10)
+    # the slice keeps its values and its cached bounds stay valid
+    assert view[0].equals(shapely.geometry.Point(0, 0))
+    np.testing.assert_array_equal(view.bounds, [[0, 0, 0, 0], [1, 1, 1, 1]])
+    np.testing.assert_array_equal(view.total_bounds, [0, 0, 1, 1])
+    np.testing.assert_allclose(arr.total_bounds, [1, 1, 10, 10], atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    'storage',
+    ['object', 'coords', 'points', 'float32', 'quantized', 'wkb', 'interned'])
+@pytest.mark.parametrize('idx', [2, 3, -3, -4])
+def test_storage_indexing_out_of_bounds(storage, idx):
+    arr = from_shapely([shapely.geometry.Point(1, 2),
+                        shapely.geometry.Point(3, 4)], storage=storage)
+    with pytest.raises(IndexError, match='index {0} is out of'.format(idx)):
+        arr[idx]
+    assert arr[-2].equals(shapely.geometry.Point(1, 2))
+
+
+def test_interned_storage():
+    import pickle
+
+    # equal geometries that are distinct objects
+    geoms = [shapely.geometry.Polygon(triangles[i % 2]) for i in range(6)]
+    geoms += [None, shapely.geometry.Polygon(), shapely.geometry.Point()]
+    arr = from_shapely(geoms)
+    res = arr.to_storage('interned')
+    assert res.storage == 'interned'
+    categories = res._coords.categories
+    # the empty geometries are kept apart per type
+    assert len(categories) == 4
+    np.testing.assert_array_equal(
+        res._coords.codes, [0, 1, 0, 1, 0, 1, -1, 2, 3])
+
+    _assert_geoms_almost_equal(res, geoms)
+    assert res[0] is res[2]
+    np.testing.assert_array_equal(res.isna(), arr.isna())
+    np.testing.assert_array_equal(res.is_empty, arr.is_empty)
+    np.testing.assert_array_equal(res.type_codes, arr.type_codes)
+    np.testing.assert_array_equal(res.bounds, arr.bounds)
+    assert res.memory_usage(deep=True) < arr.memory_usage(deep=True)
+
+    # subsets and copies share the unique geometries
+    for subset in [res[1:4], res.take([3, -1], allow_fill=True),
+                   res.copy()]:
+        assert subset.storage == 'interned'
+        assert subset._coords.categories is categories
+    _assert_geoms_almost_equal(res.take([3, -1], allow_fill=True),
+                               [geoms[3], None])
+
+    # only the unique geometries are pickled
+    _assert_geoms_almost_equal(pickle.loads(pickle.dumps(res)), geoms)
+    repeated = from_shapely(
+        [shapely.geometry.Polygon(triangles[0]) for _ in range(100)])
+    assert len(pickle.dumps(repeated.to_storage('interned'))) < len(
+        pickle.dumps(repeated)) / 5
+
+    res[0] = None
+    assert res.storage == 'object'
+    assert res[0] is None
+
+
+@pytest.mark.parametrize('storage', ['float32', 'quantized'])
+def test_reduced_precision_storage(storage):
+    import pickle
+
+    geoms = affine_geoms + [shapely.geometry.MultiPoint([(0, 0), (1, 1)])]
+    arr = from_shapely(geoms, storage=storage)
+    assert arr.storage == storage
+    assert arr._data is None
+    assert arr._coords.encoded.dtype == (
+        np.float32 if storage == 'float32' else np.int32)
+    # the coordinates (relative to the minimum) take 4 bytes
+    coords = from_shapely(geoms, storage='coords')
+    assert (coords._coords.nbytes - arr._coords.nbytes
+            > 4 * coords._coords.coords.size - 64)
+
+    _assert_geoms_almost_equal_decimal(arr, geoms, 1e-6)
+    assert arr[3].has_z and not arr[0].has_z
+    np.testing.assert_allclose(arr.bounds, coords.bounds, atol=1e-6)
+    # conversions
+    np.testing.assert_allclose(
+        arr.to_storage('coords')._coords.coords, arr._coords.coords)
+    assert arr.to_storage('object').storage == 'object'
+    assert coords.to_storage(storage).storage == storage
+
+    # the buffers are pickled, not the Shapely objects
+    arr.data
+    res = pickle.loads(pickle.dumps(arr))
+    assert res.storage == storage
+    assert res._data is None
+    _assert_geoms_almost_equal_decimal(res, geoms, 1e-6)
+
+    # values are encoded when set
+    arr[1] = shapely.geometry.Point(100.123456789, 1)
+    assert arr.storage == storage
+    assert arr._data is None
+    assert arr[1].x == pytest.approx(100.123456789, abs=1e-4)
+    arr[[0, 1]] = [None, shapely.geometry.Point(2, 3)]
+    assert arr[0] is None
+    assert arr[1].equals_exact(shapely.geometry.Point(2, 3), 1e-6)
+    # GeometryCollections can't be encoded
+    arr[2] = shapely.geometry.GeometryCollection([point])
+    assert arr.storage == 'object'
+
+
+@pytest.mark.parametrize('storage', ['float32', 'quantized'])
+def test_reduced_precision_setitem(storage, monkeypatch):
+    geoms = [shapely.geometry.Point(1, 2), None,
+             shapely.geometry.LineString([(0, 0), (10, 10)])]
+    arr = from_shapely(geoms, storage=storage)
+    buffers = arr._coords
+
+    def to_shapely():
+        raise AssertionError("materialized")
+
+    # only the new values are encoded, on the grid of the others
+    monkeypatch.setattr(buffers, 'to_shapely', to_shapely)
+    arr[1] = shapely.geometry.Polygon([(2, 2), (3, 2), (3, 3)])
+    arr[np.array([False, False, True])] = None
+    np.testing.assert_array_equal(arr._coords.origin, buffers.origin)
+    np.testing.assert_array_equal(arr._coords.scale, buffers.scale)
+    np.testing.assert_array_equal(arr._coords.encoded[:1],
+                                  buffers.encoded[:1])
+    monkeypatch.undo()
+    _assert_geoms_almost_equal_decimal(
+        arr, [geoms[0], shapely.geometry.Polygon([(2, 2), (3, 2), (3, 3)]),
+              None], 1e-6)
+
+    # all coordinates are encoded again for a new dimension or values
+    # outside of the range of the grid
+    arr[2] = shapely.geometry.Point(1e6, 0, 5)
+    assert arr.storage == storage
+    assert arr[2].has_z
+    assert arr[2].x == pytest.approx(1e6)
+    _assert_geoms_almost_equal_decimal(arr[:1], geoms[:1], 1e-3)
+
+
+def test_quantized_scale():
+    geoms = [shapely.geometry.Point(1.23456, 2), None,
+             shapely.geometry.LineString([(0, 0), (1.5, 10.25)])]
+    arr = from_shapely(geoms, storage='quantized', scale=0.01)
+    np.testing.assert_array_equal(arr._coords.scale, [0.01, 0.01])
+    assert arr[0].x == pytest.approx(1.23)
+    _assert_geoms_almost_equal_decimal(arr, geoms, 0.005)
+    arr = arr.to_storage('quantized', scale=(0.5, 1))
+    assert arr[2].equals(shapely.geometry.LineString([(0, 0), (1.5, 10)]))
+
+    # the explicit scale is kept, also when it doesn't fit
+    with pytest.raises(ValueError):
+        arr[0] = shapely.geometry.Point(1e10, 0)
+    assert arr[0].equals(shapely.geometry.Point(1, 2))
+    with pytest.raises(ValueError):
+        from_shapely(geoms, storage='quantized', scale=0)
+
+    # and by the operations transforming the coordinates
+    arr = from_shapely(geoms, storage='quantized', scale=0.5)
+    res = arr.translate(xoff=0.3)
+    assert res.storage == 'quantized'
+    assert res._coords.fixed_scale
+    np.testing.assert_array_equal(res._coords.scale, [0.5, 0.5])
+    assert res[2].equals(shapely.geometry.LineString([(0.5, 0), (2, 10)]))
+
+
+def _assert_geoms_almost_equal_decimal(result, expected, tolerance):
+    for r, e in zip(result, expected):
+        if e is None:
+            assert r is None
+        elif e.is_empty:
+            assert r.is_empty
+        else:
+            assert r.geom_type == e.geom_type
+            assert r.equals_exact(e, tolerance)
+
+
+def test_bounds_cached():
+    arr = from_shapely(triangles)
+    bounds = arr.bounds
+    assert bounds.shape == (10, 4)
+    assert bounds.dtype == np.float64
+    np.testing.assert_array_equal(bounds, [t.bounds for t in triangles])
+    assert arr.bounds is bounds
+    assert not bounds.flags.writeable
+
+    # propagated through slicing, take, copy and concat
+    np.testing.assert_array_equal(arr[2:5]._bounds, bounds[2:5])
+    mask = np.array([True, False] * 5)
+    np.testing.assert_array_equal(arr[mask]._bounds, bounds[mask])
+    np.testing.assert_array_equal(arr[[3, 1]]._bounds, bounds[[3, 1]])
+    assert arr.copy()._bounds is bounds
+    result = arr.take([1, -1], allow_fill=True)._bounds
+    np.testing.assert_array_equal(result[0], bounds[1])
+    assert np.isnan(result[1]).all()
+    result = arr.take([1, -1], allow_fill=True, fill_value=point)._bounds
+    np.testing.assert_array_equal(result[1], point.bounds)
+    result = GeometryArray._concat_same_type([arr, arr[:2]])._bounds
+    np.testing.assert_array_equal(result, np.concatenate([bounds, bounds[:2]]))
+
+    # invalidated on assignment
+    arr[0] = point
+    assert arr._bounds is None
+    np.testing.assert_array_equal(arr.bounds[0], point.bounds)
+
+
+@pytest.mark.parametrize('storage', ['object', 'coords'])
+def test_bounds_empty_missing(storage):
+    geoms = [shapely.geometry.Polygon([(0, 0), (1, 0), (1, 2)]),
+             None,
+             shapely.geometry.LineString(),
+             shapely.geometry.MultiPoint([(5, 5), (-1, 3)]),
+             shapely.geometry.Polygon()]
+    arr = from_shapely(geoms, storage=storage)
+    expected = np.array([[0, 0, 1, 2],
+                         [np.nan] * 4,
+                         [np.nan] * 4,
+                         [-1, 3, 5, 5],
+                         [np.nan] * 4])
+    np.testing.assert_array_equal(arr.bounds, expected)
+    np.testing.assert_array_equal(arr.total_bounds, [-1, 0, 5, 5])
+
+    arr = from_shapely([None, shapely.geometry.Point()], storage=storage)
+    assert np.isnan(arr.bounds).all()
+    assert np.isnan(arr.total_bounds).all()
+
+
+def test_bounds_points_storage():
+    arr = points_from_xy(np.array([0., 2., 1.]), np.array([3., 1., 0.]))
+    np.testing.assert_array_equal(
+        arr.bounds, [[0, 3, 0, 3], [2, 1, 2, 1], [1, 0, 1, 0]])
+    np.testing.assert_array_equal(arr.total_bounds, [0, 0, 2, 3])
+
+
+@pytest.mark.parametrize('n_jobs', [1, 3, -1])
+def test_n_jobs(n_jobs, monkeypatch):
+    # use small chunks to have multiple threads for small arrays as well
+    monkeypatch.setattr(geopandas.array, '_MIN_CHUNKSIZE', 1)
+    arr = from_shapely(points + [None])
+    square = shapely.geometry.box(0, 0, 0.5, 0.5)
+
+    res = arr[:-1].buffer(0.1, n_jobs=n_jobs)
+    assert all(r.equals(p.buffer(0.1)) for r, p in zip(res, points))
+    res = T.simplify(0.1, n_jobs=n_jobs)
+    assert all(r.equals(t.simplify(0.1)) for r, t in zip(res, triangles))
+
+    monkeypatch.setattr(geopandas.options, 'n_jobs', n_jobs)
+    res = arr.intersects(square)
+    assert res.dtype == bool
+    np.testing.assert_array_equal(
+        res, [p.intersects(square) for p in points] + [False])
+    res = arr.distance(point)
+    np.testing.assert_array_equal(
+        res, [p.distance(point) for p in points] + [np.nan])
+    res = arr[:-1].intersection(square)
+    assert all(r.equals(p.intersection(square))
+               for r, p in zip(res, points))
+    res = P.translate(1, 2)
+    assert all(r.equals(shapely.affinity.translate(p, 1, 2))
+               for r, p in zip(res, points))
+    np.testing.assert_array_equal(T.area, [t.area for t in triangles])
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+@pytest.mark.parametrize('op', ['intersects', 'disjoint', 'touches',
+                                'crosses', 'overlaps', 'contains', 'within',
+                                'covers'])
+def test_predicates_scalar_prepared(op, n_jobs, monkeypatch):
+    monkeypatch.setattr(geopandas.array, '_MIN_CHUNKSIZE', 1)
+    monkeypatch.setattr(geopandas.options, 'n_jobs', n_jobs)
+    geoms = triangles + points + [
+        shapely.geometry.LineString([(0, 0), (1, 1)]),
+        shapely.geometry.Point(0.25, 0.25), shapely.geometry.Polygon(), None]
+    arr = from_shapely(geoms)
+    region = shapely.geometry.Polygon(
+        [(0.2, 0.2), (0.8, 0.2), (0.8, 0.8), (0.2, 0.8)],
+        [[(0.4, 0.4), (0.6, 0.4), (0.6, 0.6), (0.4, 0.6)]])
+    for other in [region, shapely.geometry.Point(0.25, 0.25),
+                  shapely.geometry.LineString([(0, 1), (1, 0)])]:
+        result = getattr(arr, op)(other)
+        expected = [getattr(g, op)(other)
+                    if g is not None and not g.is_empty else False
+                    for g in geoms]
+        assert result.dtype == bool
+        assert result.tolist() == expected
+
+
+def test_prepared_cache():
+    geopandas.array._PREPARED_CACHE.clear()
+    region = shapely.geometry.box(0.2, 0.2, 0.8, 0.8)
+    P.intersects(region)
+    prepared = geopandas.array._PREPARED_CACHE[id(region)][1]
+    P.within(region)
+    assert geopandas.array._PREPARED_CACHE[id(region)][1] is prepared
+    assert len(geopandas.array._PREPARED_CACHE) == 1
+
+    # least recently used entries are evicted
+    others = [shapely.geometry.box(0, 0, i, i) for i in range(1, 9)]
+    for other in others:
+        P.intersects(other)
+    assert id(region) not in geopandas.array._PREPARED_CACHE
+    assert len(geopandas.array._PREPARED_CACHE) == \
+        geopandas.array._PREPARED_CACHE_SIZE
+
+
+@pytest.mark.parametrize('op', ['intersects', 'disjoint', 'touches',
+                                'crosses', 'overlaps', 'contains', 'within',
+                                'covers', 'equals'])
+def test_predicates_bbox_filter(op):
+    geoms = triangles[:8] + [shapely.geometry.Polygon(),
+                             shapely.geometry.box(0, 0, 1, 1)]
+    others = triangles[2:8] + [shapely.geometry.Point(0.5, 0.5),
+                               triangles[1],
+                               shapely.geometry.box(2, 2, 3, 3),
+                               shapely.geometry.box(0, 0, 1, 1)]
+    result = getattr(from_shapely(geoms), op)(from_shapely(others))
+    expected = [getattr(g, op)(o) if not (g.is_empty or o.is_empty)
+                else False for g, o in zip(geoms, others)]
+    assert result.dtype == bool
+    assert result.tolist() == expected
+
+    # bounding box of the scalar disjoint from all geometries
+    other = shapely.geometry.box(2, 2, 3, 3)
+    result = getattr(from_shapely(geoms + [None]), op)(other)
+    expected = [getattr(g, op)(other) if not g.is_empty else False
+                for g in geoms] + [False]
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize('storage', ['object', 'coords'])
+def test_binary_op_scalar_empty(storage):
+    # missing and empty geometries get the null value, as with an array
+    arr = from_shapely([shapely.geometry.Point(0, 0),
+                        shapely.geometry.GeometryCollection(), None])
+    if storage == 'coords':
+        arr = from_shapely([shapely.geometry.Point(0, 0),
+                            shapely.geometry.Polygon(), None],
+                           storage=storage)
+    poly = shapely.geometry.box(2, 2, 3, 3)
+    assert arr.disjoint(poly).tolist() == [True, False, False]
+    assert arr.disjoint(from_shapely([poly] * 3)).tolist() == [
+        True, False, False]
+    distance = arr.distance(shapely.geometry.Point(5, 5))
+    assert distance[0] == pytest.approx(np.hypot(5, 5))
+    assert np.isnan(distance[1:]).all()
+    assert arr.relate(shapely.geometry.Point(0, 0)).tolist() == [
+        '0FFFFFFF2', None, None]
+
+
+def test_distance_points():
+    x, y = np.random.rand(2, 10)
+    left = points_from_xy(x, y)
+    right = points_from_xy(y, x)
+    expected = [p.distance(q) for p, q in zip(left, right)]
+    np.testing.assert_allclose(left.distance(right), expected)
+    np.testing.assert_allclose(left.to_storage('coords').distance(right),
+                               expected)
+    expected = [p.distance(point) for p in left]
+    np.testing.assert_allclose(left.distance(point), expected)
+
+
+@pytest.mark.parametrize('storage', ['object', 'coords', 'wkb'])
+def test_missing_empty_masks(storage):
+    geoms = [triangles[0], None, shapely.geometry.Polygon(), points[0]]
+    arr = from_shapely(geoms, storage=storage)
+    np.testing.assert_array_equal(arr.isna(), [False, True, False, False])
+    np.testing.assert_array_equal(arr.is_empty, [False, False, True, False])
+    # cached and carried along
+    assert arr._missing is not None
+    res = arr[[3, 1]]
+    np.testing.assert_array_equal(res._missing, [False, True])
+    np.testing.assert_array_equal(res._empty, [False, False])
+    res = arr.take([2, -1], allow_fill=True)
+    np.testing.assert_array_equal(res._missing, [False, True])
+    np.testing.assert_array_equal(res._empty, [True, False])
+    res = GeometryArray._concat_same_type([arr, arr[:2]])
+    np.testing.assert_array_equal(res.isna(), [0, 1, 0, 0, 0, 1])
+
+    # missing values are skipped by the operations
+    np.testing.assert_array_equal(
+        arr.area, [triangles[0].area, np.nan, 0, 0])
+    np.testing.assert_array_equal(
+        arr.geom_type, ['Polygon', None, 'GeometryCollection', 'Point'])
+    assert arr.centroid[1] is None
+    assert arr.buffer(1)[1] is None
+    assert arr.intersection(triangles[0])[1] is None
+    overlap = triangles[0].intersects(points[0])
+    np.testing.assert_array_equal(
+        arr.intersects(from_shapely(geoms[::-1])),
+        [overlap, False, False, overlap])
+
+    arr[1] = points[1]
+    assert arr._missing is None
+    assert not arr.isna().any()
+
+
+@pytest.mark.parametrize('storage', ['object', 'coords'])
+def test_type_codes(storage):
+    from geopandas._coords import (
+        POINT, POLYGON, MULTIPOINT, GEOMETRY_TYPES, MISSING)
+
+    geoms = [triangles[0], None, shapely.geometry.Polygon(),
+             shapely.geometry.Point(1, 2, 3),
+             shapely.geometry.MultiPoint([(0, 0), (1, 1)])]
+    arr = from_shapely(geoms, storage=storage)
+    codes = arr.type_codes
+    assert codes.dtype == np.uint8
+    np.testing.assert_array_equal(
+        codes, [POLYGON, MISSING, POLYGON, POINT, MULTIPOINT])
+    assert [GEOMETRY_TYPES[c] for c in codes[[0, 3, 4]]] == [
+        'Polygon', 'Point', 'MultiPoint']
+    np.testing.assert_array_equal(
+        arr.geom_type,
+        ['Polygon', None, 'GeometryCollection', 'Point', 'MultiPoint'])
+    np.testing.assert_array_equal(
+        arr.has_z, [False, False, False, True, False])
+    np.testing.assert_array_equal(
+        arr._is_type(POLYGON, MULTIPOINT), [True, False, False, False, True])
+
+    # carried along
+    res = arr.take([3, -1], allow_fill=True)
+    np.testing.assert_array_equal(res._type_codes, [POINT, MISSING])
+    np.testing.assert_array_equal(res._has_z, [True, False])
+
+    with pytest.raises(ValueError):
+        arr.x
+    np.testing.assert_array_equal(arr[[3]].x, [1])
+
+
+def _assert_geoms_almost_equal(result, expected):
+    assert len(result) == len(expected)
+    for r, e in zip(result, expected):
+        if e is None:
+            assert r is None
+        else:
+            assert r.geom_type == e.geom_type
+            assert r.has_z == e.has_z
+            assert r.equals_exact(e, 1e-9) or (r.is_empty and e.is_empty)
+
+
+affine_geoms = [
+    triangles[0],
+    None,
+    shapely.geometry.Polygon(),
+    shapely.geometry.Point(1, 2, 3),
+    shapely.geometry.LineString([(0, 0), (1, 2), (3, 1)]),
+    shapely.geometry.MultiPolygon([triangles[1], triangles[2]]),
+    shapely.geometry.Polygon(
+        [(0, 0), (4, 0), (4, 4), (0, 4)],
+        [[(1, 1), (2, 1), (2, 2), (1, 2)]]),
+]
+
+
+@pytest.mark.parametrize('storage', ['object', 'coords'])
+def test_affine_transform(storage):
+    arr = from_shapely(affine_geoms, storage=storage)
+
+    # (the Cython version of shapely's affine_transform ignores c and f)
+    for matrix in [(1, 2, 3, 4, 5, 6),
+                   (1, 2, 0, 4, 5, 0, 7, 8, 9, 10, 11, 12)]:
+        res = arr.affine_transform(matrix)
+        assert res.storage == 'coords'
+        _assert_geoms_almost_equal(res, [
+            shapely.affinity.affine_transform(g, matrix)
+            if g and not g.is_empty else g
+            for g in affine_geoms])
+
+    res = arr.affine_transform((1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12))
+    assert res[3].coords[0] == (24, 43, 62)
+
+    # a matrix per geometry
+    matrices = np.random.rand(len(affine_geoms), 12)
+    matrices[:, [2, 5]] = 0
+    res = arr.affine_transform(matrices)
+    _assert_geoms_almost_equal(res, [
+        shapely.affinity.affine_transform(g, m) if g and not g.is_empty else g
+        for g, m in zip(affine_geoms, matrices)])
+
+    with pytest.raises(ValueError):
+        arr.affine_transform((1, 2, 3))
+    with pytest.raises(ValueError):
+        arr.affine_transform(matrices[:2])
+
+
+@pytest.mark.parametrize('storage', ['object', 'coords', 'points'])
+@pytest.mark.parametrize('origin', ['center', 'centroid', (1, 2), (1, 2, 3),
+                                    shapely.geometry.Point(-1, 1)])
+def test_affinity_methods(storage, origin):
+    if storage == 'points':
+        geoms = points + [shapely.geometry.Point(1, 2, 3)]
+    else:
+        geoms = affine_geoms
+    arr = from_shapely(geoms, storage=storage)
+
+    def expected(func, *args, **kwargs):
+        return [func(g, *args, **kwargs) if g and not g.is_empty else g
+                for g in geoms]
+
+    _assert_geoms_almost_equal(
+        arr.translate(1, 2, 3),
+        expected(shapely.affinity.translate, 1, 2, 3))
+    _assert_geoms_almost_equal(
+        arr.rotate(30, origin=origin),
+        expected(shapely.affinity.rotate, 30, origin=origin))
+    _assert_geoms_almost_equal(
+        arr.rotate(0.5, origin=origin, use_radians=True),
+        expected(shapely.affinity.rotate, 0.5, origin=origin,
+                 use_radians=True))
+    _assert_geoms_almost_equal(
+        arr.scale(2, 3, 4, origin=origin),
+        expected(shapely.affinity.scale, 2, 3, 4, origin=origin))
+    _assert_geoms_almost_equal(
+        arr.skew(10, 20, origin=origin),
+        expected(shapely.affinity.skew, 10, 20, origin=origin))
+
+    with pytest.raises(ValueError):
+        arr.rotate(30, origin='unknown')
+
+
+def test_affine_transform_geometrycollection():
+    collection = shapely.geometry.GeometryCollection(
+        [shapely.geometry.Point(0, 0), triangles[0]])
+    geoms = [collection, None, triangles[1]]
+    res = from_shapely(geoms).translate(1, 1)
+    _assert_geoms_almost_equal(res, [
+        shapely.affinity.translate(g, 1, 1) if g else g for g in geoms])
+
+
+kernel_geoms = [
+    shapely.geometry.Polygon(
+        [(0, 0), (4, 0), (4, 4), (0, 4)],
+        [[(1, 1), (2, 1), (2, 2), (1, 2)]]),
+    None,
+    shapely.geometry.Polygon(),
+    shapely.geometry.MultiPolygon([triangles[0], triangles[1]]),
+    shapely.geometry.LineString([(0, 0), (1, 2), (3, 1)]),
+    shapely.geometry.LinearRing([(0, 0), (1, 0), (1, 1)]),
+    shapely.geometry.MultiLineString([[(0, 0), (1, 1)],
+                                      [(5, 5), (5, 6), (7, 7)]]),
+    shapely.geometry.Point(1, 2, 3),
+    shapely.geometry.MultiPoint([(0, 0), (1, 3), (2, 2)]),
+    # degenerate: zero area and zero length
+    shapely.geometry.Polygon([(0, 0), (1, 1), (2, 2)]),
+    shapely.geometry.LineString([(1, 1), (1, 1)]),
+    shapely.geometry.Polygon([(1e6, 1e6), (1e6 + 1, 1e6), (1e6, 1e6 + 1)]),
+    shapely.geometry.LineString(),
+]
+
+
+@pytest.mark.parametrize('storage', ['coords', 'points'])
+def test_engine_numpy(storage, monkeypatch):
+    geoms = points if storage == 'points' else kernel_geoms + triangles
+    arr = from_shapely(geoms, storage=storage)
+    area, length, centroid = arr.area, arr.length, arr.centroid
+
+    monkeypatch.setattr(geopandas.options, 'engine', 'numpy')
+    np.testing.assert_allclose(arr.area, area)
+    np.testing.assert_allclose(arr.length, length)
+    res = arr.centroid
+    assert len(res) == len(centroid)
+    for r, e in zip(res, centroid):
+        if e is None:
+            assert r is None
+        elif e.is_empty:
+            assert r.is_empty
+        else:
+            np.testing.assert_allclose(r.coords[0], e.coords[0])
+
+    # arrays of Shapely objects use GEOS
+    np.testing.assert_allclose(from_shapely(geoms).area, area)
+
+
+@pytest.mark.parametrize('storage', ['object', 'coords', 'points'])
+def test_get_set_coordinates(storage):
+    if storage == 'points':
+        geoms = points[:3] + [shapely.geometry.Point(1, 2, 3)]
+    else:
+        geoms = affine_geoms
+    arr = from_shapely(geoms, storage=storage)
+
+    coords, index = arr.get_coordinates()
+    assert coords.shape[1] == 3
+    assert len(coords) == len(index)
+    n_coords = arr.get_coordinates(include_z=False)[0]
+    assert n_coords.shape == (len(coords), 2)
+    np.testing.assert_array_equal(n_coords, coords[:, :2])
+    for i, g in enumerate(geoms):
+        if g is not None and not g.is_empty:
+            xy = coords[index == i, :2]
+            np.testing.assert_array_equal(xy.min(axis=0), g.bounds[:2])
+            np.testing.assert_array_equal(xy.max(axis=0), g.bounds[2:])
+        else:
+            assert not (index == i).any()
+
+    # roundtrip
+    res = arr.set_coordinates(coords)
+    _assert_geoms_almost_equal(res, geoms)
+    # vectorized operation on the coordinates
+    res = arr.set_coordinates(coords * 2)
+    _assert_geoms_almost_equal(res, [
+        shapely.affinity.scale(g, 2, 2, 2, origin=(0, 0, 0))
+        if g and not g.is_empty else g for g in geoms])
+    # dropping z
+    res = arr.set_coordinates(coords[:, :2])
+    assert not res.has_z.any()
+
+    with pytest.raises(ValueError):
+        arr.set_coordinates(coords[:-1])
+    with pytest.raises(ValueError):
+        arr.set_coordinates(coords[:, 0])
+
+    collection = shapely.geometry.GeometryCollection([points[0]])
+    with pytest.raises(ValueError):
+        from_shapely([collection]).get_coordinates()
+
+
+def test_memory_usage():
+    from geopandas._coords import (
+        SHAPELY_OBJECT_NBYTES, GEOS_GEOMETRY_NBYTES, GEOS_COORDINATE_NBYTES)
+
+    arr = from_shapely(triangles + [None])
+    assert arr.memory_usage() == 8 * len(arr)
+    # 1 polygon with 1 ring of 4 coordinates
+    expected = 8 * len(arr) + len(triangles) * (
+        SHAPELY_OBJECT_NBYTES + 2 * GEOS_GEOMETRY_NBYTES
+        + 4 * GEOS_COORDINATE_NBYTES)
+    assert arr.memory_usage(deep=True) == expected
+    # nbytes doesn't include the objects
+    assert arr.nbytes == 8 * len(arr)
+
+    # repeated objects are counted once
+    res = arr.take([0] * 5)
+    assert res.memory_usage(deep=True) == (
+        8 * 5 + expected // len(triangles) - 8)
+    np.testing.assert_array_equal(res._counts(), [[4, 2]] * 5)
+
+    # coordinate buffers (materialized or not)
+    res = arr.to_storage('coords')
+    assert res.nbytes == res.memory_usage() == res._coords.nbytes
+    assert res.memory_usage(deep=True) < expected
+    np.testing.assert_array_equal(res._counts(), arr._counts())
+    res.data
+    assert res.memory_usage(deep=True) > expected
+
+    res = P.to_storage('points')
+    assert res.nbytes == res.memory_usage() == 16 * len(P)
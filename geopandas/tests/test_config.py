@@ -0,0 +1,58 @@
+import geopandas
+
+import pytest
+
+
+def test_options():
+    assert "n_jobs: " in repr(geopandas.options)
+    assert set(dir(geopandas.options)) == {'n_jobs', 'engine',
+                                           'sindex_backend',
+                                           'sindex_cache_dir'}
+
+    with pytest.raises(AttributeError):
+        geopandas.options.non_existing_option
+
+    with pytest.raises(AttributeError):
+        geopandas.options.non_existing_option = 10
+
+
+def test_options_n_jobs():
+    assert geopandas.options.n_jobs == 1
+    geopandas.options.n_jobs = 4
+    try:
+        assert geopandas.options.n_jobs == 4
+        assert "n_jobs: 4 [default: 1]" in repr(geopandas.options)
+    finally:
+        geopandas.options.n_jobs = 1
+
+    for value in [0, 1.5, 'all', None, True]:
+        with pytest.raises(ValueError):
+            geopandas.options.n_jobs = value
+    assert geopandas.options.n_jobs == 1
+
+
+def test_options_engine(monkeypatch):
+    assert geopandas.options.engine == 'geos'
+    monkeypatch.setattr(geopandas.options, 'engine', 'numpy')
+    assert geopandas.options.engine == 'numpy'
+
+    with pytest.raises(ValueError):
+        geopandas.options.engine = 'cython'
+
+
+def test_options_sindex_backend(monkeypatch):
+    assert geopandas.options.sindex_backend == 'rtree'
+    monkeypatch.setattr(geopandas.options, 'sindex_backend', 'strtree')
+    assert geopandas.options.sindex_backend == 'strtree'
+
+    with pytest.raises(ValueError):
+        geopandas.options.sindex_backend = 'quadtree'
+
+
+def test_options_sindex_cache_dir(monkeypatch, tmpdir):
+    assert geopandas.options.sindex_cache_dir is None
+    monkeypatch.setattr(geopandas.options, 'sindex_cache_dir', str(tmpdir))
+    assert geopandas.options.sindex_cache_dir == str(tmpdir)
+
+    with pytest.raises(ValueError):
+        geopandas.options.sindex_cache_dir = str(tmpdir.join('missing'))
@@ -347,6 +347,37 @@ class TestDataFrame:
         assert type(df2) is GeoDataFrame
         assert self.df.crs == df2.crs
 
+    def test_memory_usage(self):
+        shallow = self.df.memory_usage()
+        deep = self.df.memory_usage(deep=True)
+        assert shallow['geometry'] == 8 * len(self.df)
+        n_coords = sum(len(ring.coords) for geom in self.df.geometry
+                       for poly in geom for ring in
+                       [poly.exterior] + list(poly.interiors))
+        # at least the 3 GEOS doubles per coordinate
+        assert deep['geometry'] > 24 * n_coords
+        assert self.df.geometry.nbytes == shallow['geometry']
+
+    def test_memory_report(self):
+        df = self.df2[['value1', 'value2', 'geometry']].copy()
+        df.loc[3, 'geometry'] = None
+        df['polygons'] = df.buffer(1)
+        report = df.memory_report()
+        assert list(report.columns) == ['count', 'coordinates', 'bytes']
+        assert report.index.tolist() == [
+            ('Index', ''), ('value1', ''), ('value2', ''),
+            ('geometry', 'Point'), ('geometry', 'None'),
+            ('polygons', 'Polygon'), ('polygons', 'None')]
+        assert report.loc[('geometry', 'Point'), 'count'] == 9
+        assert report.loc[('geometry', 'Point'), 'coordinates'] == 9
+        assert report.loc[('geometry', 'None'), 'coordinates'] == 0
+        assert report.loc[('polygons', 'Polygon'), 'coordinates'] == sum(
+            len(geom.exterior.coords) for geom in df['polygons'].dropna())
+        usage = df.memory_usage(deep=True)
+        assert report['bytes'].sum(level=0).to_dict() == usage.to_dict()
+
+        assert 'Index' not in df.memory_report(index=False).index
+
     def test_bool_index(self):
         # Find boros with 'B' in their name
         df = self.df[self.df['BoroName'].str.contains('B')]
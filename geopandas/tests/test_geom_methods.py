@@ -280,6 +280,19 @@ class TestGeomMethods:
         result = gdf.bounds
         assert_frame_equal(expected, result)
 
+    def test_bounds_empty_missing(self):
+        s = GeoSeries([self.t1, None, Polygon(), self.sq])
+        expected = DataFrame({'minx': [0.0, np.nan, np.nan, 0.0],
+                              'miny': [0.0, np.nan, np.nan, 0.0],
+                              'maxx': [1.0, np.nan, np.nan, 1.0],
+                              'maxy': [1.0, np.nan, np.nan, 1.0]},
+                             columns=['minx', 'miny', 'maxx', 'maxy'])
+        assert_frame_equal(s.bounds, expected)
+        assert tuple(s.total_bounds) == (0.0, 0.0, 1.0, 1.0)
+
+        s = GeoSeries([None, Polygon()])
+        assert np.isnan(s.total_bounds).all()
+
     def test_unary_union(self):
         p1 = self.t1
         p2 = Polygon([(2, 0), (3, 0), (3, 1)])
@@ -470,6 +483,25 @@ class TestGeomMethods:
         self._test_binary_real('project', expected, self.g5, p,
                                normalized=True)
 
+    def test_get_set_coordinates(self):
+        coords, index = self.g1.get_coordinates()
+        assert coords.shape == (9, 2)
+        assert_array_equal(index, [0] * 4 + [1] * 5)
+        assert_array_equal(coords[:4], np.array(self.t1.exterior))
+
+        res = self.g1.set_coordinates(coords + [1, 2])
+        assert isinstance(res, GeoSeries)
+        assert res.crs == self.g1.crs
+        assert geom_almost_equals(res, self.g1.translate(1, 2))
+
+        res = self.gdf1.set_coordinates(coords + [1, 2])
+        assert geom_almost_equals(res, self.g1.translate(1, 2))
+
+    def test_affine_transform(self):
+        res = self.g1.affine_transform([1, 0, 0, 1, 1, 2])
+        assert isinstance(res, GeoSeries)
+        assert geom_almost_equals(res, self.g1.translate(1, 2))
+
     def test_translate_tuple(self):
         trans = self.sol.x - self.esb.x, self.sol.y - self.esb.y
         assert self.landmarks.translate(*trans)[0].equals(self.sol)
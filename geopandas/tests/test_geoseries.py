@@ -12,6 +12,7 @@ from shapely.geometry import (Polygon, Point, LineString,
 from shapely.geometry.base import BaseGeometry
 
 from geopandas import GeoSeries
+from geopandas.array import GeometryArray, from_shapely
 
 import pytest
 from geopandas.tests.util import geom_equals
@@ -201,6 +202,23 @@ class TestSeries:
         assert geom_equals(gs.cx[0:, :], gs.loc[3:])
         assert geom_equals(gs.cx[:, 0:], gs.loc[3:])
 
+    def test_intern(self):
+        s = GeoSeries([self.t1, Polygon(self.t1), self.sq, None, self.t1],
+                      index=list('abcde'), crs=self.g3.crs, name='geoms')
+        result = s.intern()
+        assert result.values.storage == 'interned'
+        assert len(result.values._coords.categories) == 2
+        assert result.crs == s.crs
+        assert result.name == 'geoms'
+        assert_array_equal(result.index, s.index)
+        assert geom_equals(result, s)
+        # the equal geometries are the same objects
+        assert result.iloc[1] is result.iloc[4]
+        # indexing keeps the interned storage
+        subset = result[result.area < 1]
+        assert subset.values.storage == 'interned'
+        assert geom_equals(subset, s[[0, 1, 4]])
+
     def test_geoseries_geointerface(self):
         assert self.g1.__geo_interface__['type'] == 'FeatureCollection'
         assert len(self.g1.__geo_interface__['features']) == self.g1.shape[0]
@@ -227,3 +245,42 @@ class TestSeries:
         reprojected_string = self.g3.to_crs('+proj=utm +zone=30N')
         reprojected_dict = self.g3.to_crs({'proj': 'utm', 'zone': '30N'})
         assert np.all(reprojected_string.geom_almost_equals(reprojected_dict))
+
+
+class TestConstructor:
+
+    def test_constructor(self):
+        s = GeoSeries([Point(x, x) for x in range(3)])
+        assert s.dtype == 'geometry'
+        assert isinstance(s.values, GeometryArray)
+
+    def test_empty(self):
+        s = GeoSeries([])
+        assert s.dtype == 'geometry'
+        assert len(s) == 0
+
+        s = GeoSeries()
+        assert s.dtype == 'geometry'
+
+    def test_geometry_array(self):
+        arr = from_shapely([Point(x, x) for x in range(3)])
+        s = GeoSeries(arr, index=['a', 'b', 'c'], name='geom')
+        # no copy of the data
+        assert s.values is arr
+        assert s.name == 'geom'
+
+    def test_non_geometry_raises(self):
+        with pytest.warns(FutureWarning):
+            s = GeoSeries([0, 1, 2])
+        assert type(s) == pd.Series
+
+        with pytest.warns(FutureWarning):
+            s = GeoSeries(['a', 'b'])
+        assert type(s) == pd.Series
+
+    def test_non_geometry_result(self):
+        # pandas methods not returning geometries return a normal Series
+        s = GeoSeries([Point(x, x) for x in range(3)])
+        res = s.apply(lambda geom: geom.x)
+        assert type(res) == pd.Series
+        assert res.dtype == 'float64'
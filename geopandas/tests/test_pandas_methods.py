@@ -10,6 +10,7 @@ import shapely
 from shapely.geometry import Point, Polygon
 
 from geopandas import GeoDataFrame, GeoSeries
+from geopandas.array import GeometryArray, from_shapely
 from geopandas.tests.util import assert_geoseries_equal
 
 import pytest
@@ -34,6 +35,25 @@ def test_repr(s, df):
     assert 'POINT' in repr(df)
 
 
+def test_dtype(s, df):
+    assert s.dtype == 'geometry'
+    assert isinstance(s.values, GeometryArray)
+    assert df.dtypes['geometry'] == 'geometry'
+    assert isinstance(df['geometry'], GeoSeries)
+    assert isinstance(df['geometry'].values, GeometryArray)
+
+
+def test_concat(s, df):
+    res = pd.concat([s, s], ignore_index=True)
+    assert isinstance(res, GeoSeries)
+    assert res.dtype == 'geometry'
+    assert len(res) == 6
+
+    res = pd.concat([df, df], ignore_index=True)
+    assert isinstance(res, GeoDataFrame)
+    assert res.dtypes['geometry'] == 'geometry'
+
+
 def test_indexing(s, df):
 
     # accessing scalar from the geometry (colunm)
@@ -156,18 +176,13 @@ def test_select_dtypes(df):
 # Missing values
 
 
-@pytest.mark.xfail
-def test_fillna():
-    # this currently does not work (it seems to fill in the second coordinate
-    # of the point
+def test_fillna(s):
     s2 = GeoSeries([Point(0, 0), None, Point(2, 2)])
     res = s2.fillna(Point(1, 1))
     assert_geoseries_equal(res, s)
 
 
-@pytest.mark.xfail
 def test_dropna():
-    # this currently does not work (doesn't drop)
     s2 = GeoSeries([Point(0, 0), None, Point(2, 2)])
     res = s2.dropna()
     exp = s2.loc[[0, 2]]
@@ -192,15 +207,12 @@ def test_isna(NA):
 # Groupby / algos
 
 
-@pytest.mark.xfail
 def test_unique():
-    # this currently raises a TypeError
     s = GeoSeries([Point(0, 0), Point(0, 0), Point(2, 2)])
-    exp = np.array([Point(0, 0), Point(2, 2)])
+    exp = from_shapely([Point(0, 0), Point(2, 2)])
     assert_array_equal(s.unique(), exp)
 
 
-@pytest.mark.xfail
 def test_value_counts():
     # each object is considered unique
     s = GeoSeries([Point(0, 0), Point(1, 1), Point(0, 0)])
@@ -211,8 +223,10 @@ def test_value_counts():
 
 @pytest.mark.xfail
 def test_drop_duplicates_series():
-    # currently, geoseries with identical values are not recognized as
-    # duplicates
+    # duplicated does not yet use EA machinery
+    # (https://github.com/pandas-dev/pandas/issues/27264)
+    # but relies on unstable hashing of unhashable objects in numpy array
+    # giving flaky test (https://github.com/pandas-dev/pandas/issues/27035)
     dups = GeoSeries([Point(0, 0), Point(0, 0)])
     dropped = dups.drop_duplicates()
     assert len(dropped) == 1
@@ -220,8 +234,7 @@ def test_drop_duplicates_series():
 
 @pytest.mark.xfail
 def test_drop_duplicates_frame():
-    # currently, dropping duplicates in a geodataframe produces a TypeError
-    # better behavior would be dropping the duplicated points
+    # duplicated does not yet use EA machinery, see above
     gdf_len = 3
     dup_gdf = GeoDataFrame({'geometry': [Point(0, 0) for _ in range(gdf_len)],
                             'value1': range(gdf_len)})
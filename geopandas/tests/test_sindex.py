@@ -1,9 +1,11 @@
 import sys
 
+import numpy as np
 from shapely.geometry import Polygon, Point
 
 import geopandas
 from geopandas import GeoSeries, GeoDataFrame, base, read_file
+from geopandas.sindex import STRTreeIndex
 
 import pytest
 
@@ -85,6 +87,244 @@ class TestFrameSindex:
         assert self.df._sindex_generated is False
 
 
+class TestSTRTreeIndex:
+
+    @pytest.mark.parametrize('n', [1, 2, 16, 17, 300])
+    @pytest.mark.parametrize('node_capacity', [2, 4, 16])
+    def test_intersection(self, n, node_capacity):
+        rng = np.random.RandomState(n)
+        xy = rng.rand(n, 2) * 100
+        bounds = np.column_stack([xy, xy + rng.rand(n, 2) * 5])
+        bounds[n // 2] = np.nan
+        tree = STRTreeIndex(bounds, node_capacity=node_capacity)
+        assert tree.size == n - 1
+
+        for _ in range(20):
+            xy = rng.rand(2) * 100
+            box = np.concatenate([xy, xy + rng.rand(2) * 20])
+            expected = np.flatnonzero(
+                (bounds[:, 0] <= box[2]) & (bounds[:, 2] >= box[0])
+                & (bounds[:, 1] <= box[3]) & (bounds[:, 3] >= box[1]))
+            assert tree.intersection(box) == expected.tolist()
+
+    def test_empty(self):
+        tree = STRTreeIndex(np.full((2, 4), np.nan))
+        assert tree.is_empty
+        assert tree.intersection((0, 0, 1, 1)) == []
+        assert np.isnan(tree.bounds).all()
+
+    def test_objects(self):
+        tree = STRTreeIndex([(0, 0, 1, 1), (2, 2, 3, 3), (0, 0, 3, 3)],
+                            objects=['a', 'b', 'c'])
+        # points and touching boxes intersect
+        assert tree.intersection((1, 1)) == [0, 2]
+        assert tree.intersection((3, 3, 4, 4), objects='raw') == ['b', 'c']
+        hits = tree.intersection((2.5, 2.5, 4, 4), objects=True)
+        assert [(hit.id, hit.object) for hit in hits] == [(1, 'b'), (2, 'c')]
+        assert hits[0].bbox == [2, 2, 3, 3]
+        np.testing.assert_array_equal(tree.bounds, [0, 0, 3, 3])
+
+    def test_sindex_backend(self, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', 'strtree')
+        df = GeoDataFrame(
+            {'A': range(5)},
+            geometry=[Point(x, y) for x, y in zip(range(5), range(5))],
+            index=list('abcde'))
+        assert isinstance(df.sindex, STRTreeIndex)
+        assert df.sindex.size == 5
+        hits = df.sindex.intersection((2.5, 2.5, 4, 4), objects=True)
+        assert [hit.object for hit in hits] == ['d', 'e']
+        assert GeoSeries([Point()]).sindex is None
+
+    @pytest.mark.parametrize('mmap', [True, False])
+    def test_save_load(self, tmpdir, mmap):
+        rng = np.random.RandomState(0)
+        xy = rng.rand(100, 2) * 100
+        bounds = np.column_stack([xy, xy + rng.rand(100, 2) * 5])
+        bounds[10] = np.nan
+        tree = STRTreeIndex(bounds, node_capacity=4)
+        path = str(tmpdir.join('index.strtree'))
+        tree.save(path)
+
+        loaded = STRTreeIndex.load(path, objects=np.arange(100) * 2,
+                                   mmap=mmap)
+        assert isinstance(loaded._ids, np.memmap) == mmap
+        assert loaded.node_capacity == 4
+        assert loaded.size == 99
+        np.testing.assert_array_equal(loaded.bounds, tree.bounds)
+        box = (20, 20, 50, 50)
+        assert loaded.intersection(box) == tree.intersection(box)
+        hits = loaded.intersection(box, objects=True)
+        assert [hit.object for hit in hits] == [
+            2 * i for i in tree.intersection(box)]
+        np.testing.assert_array_equal(loaded._query_pairs(bounds[:5])[1],
+                                      tree._query_pairs(bounds[:5])[1])
+
+        path = str(tmpdir.join('empty.strtree'))
+        STRTreeIndex(np.full((2, 4), np.nan)).save(path)
+        assert STRTreeIndex.load(path, mmap=mmap).is_empty
+
+        path = str(tmpdir.join('other'))
+        with open(path, 'wb') as f:
+            f.write(b'not an index')
+        with pytest.raises(ValueError):
+            STRTreeIndex.load(path)
+
+    def test_sindex_from_file(self, tmpdir):
+        df = GeoDataFrame(
+            {'A': range(5)},
+            geometry=[Point(x, y) for x, y in zip(range(5), range(5))],
+            index=list('abcde'))
+        path = str(tmpdir.join('index.strtree'))
+        STRTreeIndex(df.geometry.values.bounds).save(path)
+
+        sindex = df.sindex_from_file(path)
+        assert df.sindex is sindex
+        assert sindex.geometries is df.geometry.values
+        hits = df.sindex.intersection((2.5, 2.5, 4, 4), objects=True)
+        assert [hit.object for hit in hits] == ['d', 'e']
+        res = df.sindex.query_bulk([Point(1, 1)], predicate='intersects')
+        assert res.tolist() == [[0], [1]]
+
+        with pytest.raises(ValueError):
+            df.iloc[::-1].sindex_from_file(path)
+
+    def test_sindex_cache_dir(self, tmpdir, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', 'strtree')
+        monkeypatch.setattr(geopandas.options, 'sindex_cache_dir',
+                            str(tmpdir))
+        s = GeoSeries([Point(x, y) for x, y in zip(range(5), range(5))])
+        assert s.sindex.size == 5
+        assert len(tmpdir.listdir()) == 1
+
+        s2 = GeoSeries(list(s), index=list('abcde'))
+        assert isinstance(s2.sindex._ids, np.memmap)
+        assert s2.sindex.intersection((0, 0, 1, 1), objects='raw') == [
+            'a', 'b']
+        assert len(tmpdir.listdir()) == 1
+
+        s3 = s.translate(1)
+        assert not isinstance(s3.sindex._ids, np.memmap)
+        assert len(tmpdir.listdir()) == 2
+
+
+@pytest.mark.parametrize('backend', [
+    'strtree',
+    pytest.param('rtree', marks=pytest.mark.skipif(
+        not base.HAS_SINDEX, reason='Rtree absent, skipping'))])
+class TestQueryBulk:
+
+    def setup_method(self):
+        self.tree = GeoSeries([
+            Point(0.5, 0.5), Polygon([(0, 0), (2, 0), (2, 2), (0, 2)]),
+            None, Polygon([(3, 3), (4, 3), (4, 4)]), Point()])
+        self.geoms = GeoSeries([
+            Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]), Point(10, 10), None,
+            Point(3.9, 3.1), Point(2, 2)])
+
+    def test_bounds(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        sindex = self.tree.sindex
+        res = sindex.query_bulk(self.geoms)
+        assert res.shape == (2, 4)
+        assert res.dtype == np.int64
+        assert sorted(zip(*res)) == [(0, 0), (0, 1), (3, 3), (4, 1)]
+        # the input positions are sorted
+        assert (np.diff(res[0]) >= 0).all()
+
+        bounds = self.geoms.values.bounds
+        res2 = sindex.query_bulk(bounds)
+        assert sorted(zip(*res2)) == sorted(zip(*res))
+
+        res = sindex.query_bulk(np.full((2, 4), np.nan))
+        assert res.shape == (2, 0)
+
+    @pytest.mark.parametrize('predicate, expected', [
+        ('intersects', [(0, 0), (0, 1), (3, 3), (4, 1)]),
+        ('within', [(0, 1), (3, 3)]),
+        ('contains', [(0, 0)]),
+        ('touches', [(4, 1)]),
+        ('covers', [(0, 0)]),
+    ])
+    def test_predicate(self, backend, predicate, expected, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        res = self.tree.sindex.query_bulk(self.geoms, predicate=predicate)
+        assert sorted(zip(*res)) == expected
+        # list of geometries
+        res = self.tree.sindex.query_bulk(
+            list(self.geoms), predicate=predicate)
+        assert sorted(zip(*res)) == expected
+
+    def test_invalid(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        with pytest.raises(ValueError):
+            self.tree.sindex.query_bulk(self.geoms, predicate='disjoint')
+        with pytest.raises(ValueError):
+            self.tree.sindex.query_bulk(
+                self.geoms.values.bounds, predicate='intersects')
+
+
+@pytest.mark.parametrize('backend', [
+    'strtree',
+    pytest.param('rtree', marks=pytest.mark.skipif(
+        not base.HAS_SINDEX, reason='Rtree absent, skipping'))])
+class TestNearest:
+
+    def setup_method(self):
+        rng = np.random.RandomState(0)
+        self.tree = GeoSeries(
+            [Point(x, y).buffer(rng.rand()) for x, y in rng.rand(50, 2) * 20]
+            + [None, Point()])
+        self.geoms = GeoSeries(
+            [Point(x, y) for x, y in rng.rand(20, 2) * 30 - 5]
+            + [None, Point()])
+
+    def brute_force(self, k, max_distance=None):
+        expected = []
+        for i, geom in enumerate(self.geoms):
+            if geom is None or geom.is_empty:
+                continue
+            dist = [(geom.distance(other), j)
+                    for j, other in enumerate(self.tree)
+                    if other is not None and not other.is_empty]
+            dist = [(d, j) for d, j in sorted(dist)
+                    if max_distance is None or d <= max_distance]
+            expected.extend((i, j, d) for d, j in dist[:k])
+        return expected
+
+    @pytest.mark.parametrize('k', [1, 3, 100])
+    def test_nearest(self, backend, k, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        indices, distances = self.tree.sindex.nearest(self.geoms, k=k)
+        assert indices.dtype == np.int64
+        expected = self.brute_force(k)
+        assert [tuple(pair) for pair in indices.T] == [
+            (i, j) for i, j, _ in expected]
+        np.testing.assert_allclose(distances, [d for _, _, d in expected])
+
+    def test_max_distance(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        indices = self.tree.sindex.nearest(
+            self.geoms, k=2, max_distance=1.5, return_distance=False)
+        expected = self.brute_force(2, max_distance=1.5)
+        assert [tuple(pair) for pair in indices.T] == [
+            (i, j) for i, j, _ in expected]
+
+    def test_equal_distances(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        tree = GeoSeries([Point(1, 1), Point(0, 0), Point(1, 1)])
+        indices, distances = tree.sindex.nearest([Point(1, 1)], k=2)
+        assert indices.tolist() == [[0, 0], [0, 2]]
+        assert distances.tolist() == [0, 0]
+
+    def test_invalid(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        with pytest.raises(ValueError):
+            self.tree.sindex.nearest(self.geoms, k=0)
+        with pytest.raises(ValueError):
+            self.tree.sindex.nearest(self.geoms, max_distance=-1)
+
+
 # Skip to accommodate Shapely geometries being unhashable
 @pytest.mark.skip
 class TestJoinSindex:
@@ -2,13 +2,14 @@ from __future__ import absolute_import
 
 from .geocoding import geocode, reverse_geocode
 from .overlay import overlay
-from .sjoin import sjoin
+from .sjoin import sjoin, sjoin_nearest
 from .util import collect
 from .crs import explicit_crs_from_epsg
 
 __all__ = [
     'overlay',
     'sjoin',
+    'sjoin_nearest',
     'geocode',
     'reverse_geocode',
     'collect',
@@ -7,6 +7,7 @@ from shapely.ops import unary_union, polygonize
 from shapely.geometry import MultiLineString
 
 from geopandas import GeoDataFrame, GeoSeries
+from geopandas._coords import POLYGON, MULTIPOLYGON
 
 
 def _uniquify(columns):
@@ -60,6 +61,19 @@ def _extract_rings(df):
     return rings
 
 
+def _candidates(df, bounds, use_sindex):
+    """
+    For each of the bounds, the index labels of the rows of ``df`` of which
+    the bounding box intersects it (or all labels without spatial index).
+    """
+    if use_sindex and df.sindex is not None:
+        idx, tree_idx = df.sindex.query_bulk(bounds)
+        labels = df.index[tree_idx]
+        splits = np.searchsorted(idx, np.arange(1, len(bounds)))
+        return np.split(np.asarray(labels, dtype=object), splits)
+    return [list(df.index)] * len(bounds)
+
+
 def _overlay_old(df1, df2, how, use_sindex=True, **kwargs):
     """Perform spatial overlay between two polygons.
 
@@ -107,39 +121,29 @@ def _overlay_old(df1, df2, how, use_sindex=True, **kwargs):
 
     # Union and polygonize
     mm = unary_union([mls1, mls2])
-    newpolys = polygonize(mm)
+    newpolys = list(polygonize(mm))
+
+    # candidates of the original polys for all new polys at once
+    bounds = np.array([newpoly.bounds for newpoly in newpolys]).reshape(-1, 4)
+    candidates1 = _candidates(df1, bounds, use_sindex)
+    candidates2 = _candidates(df2, bounds, use_sindex)
 
     # determine spatial relationship
     collection = []
     for fid, newpoly in enumerate(newpolys):
         cent = newpoly.representative_point()
 
-        # Test intersection with original polys
-        # FIXME there should be a higher-level abstraction to search by bounds
-        # and fall back in the case of no index?
-        if use_sindex and df1.sindex is not None:
-            candidates1 = [x.object for x in
-                           df1.sindex.intersection(newpoly.bounds, objects=True)]
-        else:
-            candidates1 = [i for i, x in df1.iterrows()]
-
-        if use_sindex and df2.sindex is not None:
-            candidates2 = [x.object for x in
-                           df2.sindex.intersection(newpoly.bounds, objects=True)]
-        else:
-            candidates2 = [i for i, x in df2.iterrows()]
-
         df1_hit = False
         df2_hit = False
         prop1 = None
         prop2 = None
-        for cand_id in candidates1:
+        for cand_id in candidates1[fid]:
             cand = df1.loc[cand_id]
             if cent.intersects(cand[df1.geometry.name]):
                 df1_hit = True
                 prop1 = cand
                 break  # Take the first hit
-        for cand_id in candidates2:
+        for cand_id in candidates2[fid]:
             cand = df2.loc[cand_id]
             if cent.intersects(cand[df2.geometry.name]):
                 df2_hit = True
@@ -201,15 +205,14 @@ def _overlay_intersection(df1, df2):
     """
     # Spatial Index to create intersections
     spatial_index = df2.sindex
-    bbox = df1.geometry.apply(lambda x: x.bounds)
-    sidx = bbox.apply(lambda x: list(spatial_index.intersection(x)))
     # Create pairs of geometries in both dataframes to be intersected
-    nei = []
-    for i, j in enumerate(sidx):
-        for k in j:
-            nei.append([i, k])
-    if nei != []:
-        pairs = pd.DataFrame(nei, columns=['__idx1', '__idx2'])
+    if spatial_index is not None:
+        idx1, idx2 = spatial_index.query_bulk(df1.geometry.values.bounds)
+    else:
+        idx1 = idx2 = []
+    if len(idx1) > 0:
+        pairs = pd.DataFrame({'__idx1': idx1, '__idx2': idx2},
+                             columns=['__idx1', '__idx2'])
         left = df1.geometry.take(pairs['__idx1'].values)
         left.reset_index(drop=True, inplace=True)
         right = df2.geometry.take(pairs['__idx2'].values)
@@ -244,8 +247,10 @@ def _overlay_difference(df1, df2):
     """
     # Spatial Index to create intersections
     spatial_index = df2.sindex
-    bbox = df1.geometry.apply(lambda x: x.bounds)
-    sidx = bbox.apply(lambda x: list(spatial_index.intersection(x)))
+    sidx = [[] for _ in range(len(df1))]
+    if spatial_index is not None:
+        idx1, idx2 = spatial_index.query_bulk(df1.geometry.values.bounds)
+        sidx = np.split(idx2, np.searchsorted(idx1, np.arange(1, len(df1))))
     # Create differences
     new_g = []
     for geom, neighbours in zip(df1.geometry, sidx):
@@ -342,9 +347,8 @@ def overlay(df1, df2, how='intersection', make_valid=True, use_sindex=None):
         raise NotImplementedError("overlay currently only implemented for "
                                   "GeoDataFrames")
 
-    accepted_types = ['Polygon', 'MultiPolygon']
-    if (not df1.geom_type.isin(accepted_types).all()
-            or not df2.geom_type.isin(accepted_types).all()):
+    if (not df1.geometry.values._is_type(POLYGON, MULTIPOLYGON).all()
+            or not df2.geometry.values._is_type(POLYGON, MULTIPOLYGON).all()):
         raise TypeError("overlay only takes GeoDataFrames with (multi)polygon "
                         " geometries.")
 
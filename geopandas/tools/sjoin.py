@@ -2,9 +2,8 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
-from shapely import prepared
-
-from geopandas import GeoDataFrame
+from geopandas import GeoDataFrame, options
+from geopandas.base import HAS_SINDEX
 
 
 def sjoin(left_df, right_df, how='inner', op='intersects',
@@ -30,7 +29,149 @@ def sjoin(left_df, right_df, how='inner', op='intersects',
         Suffix to apply to overlapping column names (right GeoDataFrame).
 
     """
-    import rtree
+    _check_frames(left_df, right_df, how, 'sjoin')
+
+    allowed_ops = ['contains', 'within', 'intersects']
+    if op not in allowed_ops:
+        raise ValueError("`op` was \"%s\" but is expected to be in %s" %
+                         (op, allowed_ops))
+
+    left_df, right_df, index_left, index_right = _reset_indices(
+        left_df, right_df, lsuffix, rsuffix)
+
+    if op == "within":
+        # within implemented as the inverse of contains; swap names
+        left_df, right_df = right_df, left_df
+
+    # find the pairs satisfying the predicate with the spatial index of the
+    # right frame, in one bulk query
+    tree_idx = right_df.sindex
+    if tree_idx is not None:
+        predicate = 'intersects' if op == 'intersects' else 'contains'
+        l_idx, r_idx = tree_idx.query_bulk(left_df.geometry,
+                                           predicate=predicate)
+    else:
+        # no valid geometries on the right
+        l_idx = r_idx = np.empty(0, dtype=np.int64)
+
+    result = pd.DataFrame({'_key_left': l_idx, '_key_right': r_idx},
+                          columns=['_key_left', '_key_right'])
+
+    if op == "within":
+        # within implemented as the inverse of contains; swap names
+        left_df, right_df = right_df, left_df
+        result = result.rename(columns={'_key_left': '_key_right',
+                                        '_key_right': '_key_left'})
+
+    return _join_frames(left_df, right_df, result, how, index_left,
+                        index_right, lsuffix, rsuffix)
+
+
+def sjoin_nearest(left_df, right_df, how='inner', max_distance=None,
+                  lsuffix='left', rsuffix='right', distance_col=None):
+    """Spatial join of two GeoDataFrames based on the distance between
+    their geometries.
+
+    Each row of the left frame (or of the right frame with ``how='right'``)
+    is joined to the nearest row(s) of the other frame, found with the
+    spatial index of that frame. All rows at the same (minimum) distance
+    are joined, so a row may be repeated in the result.
+
+    Parameters
+    ----------
+    left_df, right_df : GeoDataFrames
+    how : string, default 'inner'
+        The type of join:
+
+        * 'left': join the nearest rows of right_df to every row of
+          left_df; retain only left_df geometry column
+        * 'right': join the nearest rows of left_df to every row of
+          right_df; retain only right_df geometry column
+        * 'inner': as 'left', but drop the rows of left_df without nearest
+          geometry (missing or empty, or beyond ``max_distance``)
+    max_distance : float, optional
+        Only join geometries within this distance. Setting it can speed up
+        the join considerably when many geometries are far apart.
+    lsuffix : string, default 'left'
+        Suffix to apply to overlapping column names (left GeoDataFrame).
+    rsuffix : string, default 'right'
+        Suffix to apply to overlapping column names (right GeoDataFrame).
+    distance_col : string, optional
+        If given, the name of a column added to the result with the
+        distance between the joined geometries.
+
+    Notes
+    -----
+    The distances are computed in the units of the coordinate reference
+    system of the frames, which should thus be a projected one.
+    """
+    _check_frames(left_df, right_df, how, 'sjoin_nearest')
+
+    if distance_col is not None and (distance_col in left_df.columns
+                                     or distance_col in right_df.columns):
+        raise ValueError("'{0}' cannot be a name in the frames being "
+                         "joined".format(distance_col))
+
+    left_df, right_df, index_left, index_right = _reset_indices(
+        left_df, right_df, lsuffix, rsuffix)
+
+    if how == 'right':
+        # the nearest left rows of every right row
+        left_df, right_df = right_df, left_df
+
+    l_idx, r_idx, distances = _nearest_with_ties(
+        right_df.sindex, right_df.geometry.values, left_df.geometry.values,
+        max_distance)
+
+    result = pd.DataFrame({'_key_left': l_idx, '_key_right': r_idx},
+                          columns=['_key_left', '_key_right'])
+    if distance_col is not None:
+        result[distance_col] = distances
+
+    if how == 'right':
+        left_df, right_df = right_df, left_df
+        result = result.rename(columns={'_key_left': '_key_right',
+                                        '_key_right': '_key_left'})
+
+    return _join_frames(left_df, right_df, result, how, index_left,
+                        index_right, lsuffix, rsuffix)
+
+
+def _nearest_with_ties(sindex, tree, geometry, max_distance):
+    """
+    Find the positions of the tree geometries at the minimum distance of
+    each input geometry, including ties.
+
+    Returns
+    -------
+    input positions, tree positions, distances
+    """
+    if sindex is None:
+        # no valid geometries in the tree
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+
+    (input_idx, _), nearest = sindex.nearest(geometry, k=1,
+                                             max_distance=max_distance)
+    # query the boxes expanded by the minimum distance, to find the other
+    # geometries at that same distance
+    boxes = (geometry.take(input_idx).bounds
+             + nearest[:, np.newaxis] * np.array([-1, -1, 1, 1]))
+    pairs, tree_idx = sindex.query_bulk(boxes)
+    input_idx = input_idx[pairs]
+    distances = geometry.take(input_idx).distance(tree.take(tree_idx))
+    keep = distances <= nearest[pairs]
+    input_idx, tree_idx, distances = (
+        input_idx[keep], tree_idx[keep], distances[keep])
+    order = np.lexsort((tree_idx, input_idx))
+    return input_idx[order], tree_idx[order], distances[order]
+
+
+def _check_frames(left_df, right_df, how, name):
+    if options.sindex_backend == 'rtree' and not HAS_SINDEX:
+        raise ImportError(
+            "{0} needs `rtree`, or the 'strtree' sindex_backend "
+            "option".format(name))
 
     if not isinstance(left_df, GeoDataFrame):
         raise ValueError("'left_df' should be GeoDataFrame, got {}".format(
@@ -45,17 +186,14 @@ def sjoin(left_df, right_df, how='inner', op='intersects',
         raise ValueError("`how` was \"%s\" but is expected to be in %s" %
                          (how, allowed_hows))
 
-    allowed_ops = ['contains', 'within', 'intersects']
-    if op not in allowed_ops:
-        raise ValueError("`op` was \"%s\" but is expected to be in %s" %
-                         (op, allowed_ops))
-
     if left_df.crs != right_df.crs:
         warn(
             ('CRS of frames being joined does not match!'
              '(%s != %s)' % (left_df.crs, right_df.crs))
         )
 
+
+def _reset_indices(left_df, right_df, lsuffix, rsuffix):
     index_left = 'index_%s' % lsuffix
     index_right = 'index_%s' % rsuffix
 
@@ -65,9 +203,9 @@ def sjoin(left_df, right_df, how='inner', op='intersects',
         raise ValueError("'{0}' and '{1}' cannot be names in the frames being"
                          " joined".format(index_left, index_right))
 
-    # the rtree spatial index only allows limited (numeric) index types, but an
-    # index in geopandas may be any arbitrary dtype. so reset both indices now
-    # and store references to the original indices, to be reaffixed later.
+    # the spatial index returns positions, but an index in geopandas may be
+    # any arbitrary dtype. so reset both indices now and store references to
+    # the original indices, to be reaffixed later.
     # GH 352
     left_df = left_df.copy(deep=True)
     left_df.index = left_df.index.rename(index_left)
@@ -75,65 +213,19 @@ def sjoin(left_df, right_df, how='inner', op='intersects',
     right_df = right_df.copy(deep=True)
     right_df.index = right_df.index.rename(index_right)
     right_df = right_df.reset_index()
+    return left_df, right_df, index_left, index_right
 
-    if op == "within":
-        # within implemented as the inverse of contains; swap names
-        left_df, right_df = right_df, left_df
-
-    # insert the bounds in the rtree spatial index
-    right_df_bounds = right_df.geometry.apply(lambda x: x.bounds)
-    stream = ((i, b, None) for i, b in enumerate(right_df_bounds))
-    tree_idx = rtree.index.Index(stream)
-
-    idxmatch = (left_df.geometry.apply(lambda x: x.bounds)
-                .apply(lambda x: list(tree_idx.intersection(x))))
-    idxmatch = idxmatch[idxmatch.apply(len) > 0]
-
-    if idxmatch.shape[0] > 0:
-        # if output from join has overlapping geometries
-        r_idx = np.concatenate(idxmatch.values)
-        l_idx = np.concatenate([[i] * len(v) for i, v in idxmatch.iteritems()])
-
-        # Vectorize predicate operations
-        def find_intersects(a1, a2):
-            return a1.intersects(a2)
-
-        def find_contains(a1, a2):
-            return a1.contains(a2)
-
-        predicate_d = {'intersects': find_intersects,
-                       'contains': find_contains,
-                       'within': find_contains}
-
-        check_predicates = np.vectorize(predicate_d[op])
-
-        result = (
-            pd.DataFrame(
-                np.column_stack(
-                    [l_idx,
-                     r_idx,
-                     check_predicates(
-                         left_df.geometry
-                         .apply(lambda x: prepared.prep(x))[l_idx],
-                         right_df[right_df.geometry.name][r_idx])
-                     ]))
-        )
-
-        result.columns = ['_key_left', '_key_right', 'match_bool']
-        result = (
-            pd.DataFrame(result[result['match_bool'] == 1])
-            .drop('match_bool', axis=1)
-        )
 
-    else:
+def _join_frames(left_df, right_df, result, how, index_left, index_right,
+                 lsuffix, rsuffix):
+    """
+    Join the (index-reset) frames on the positions in the ``'_key_left'``
+    and ``'_key_right'`` columns of ``result``, carrying any other columns
+    of ``result`` over to the joined frame.
+    """
+    if not len(result):
         # when output from the join has no overlapping geometries
-        result = pd.DataFrame(columns=['_key_left', '_key_right'], dtype=float)
-
-    if op == "within":
-        # within implemented as the inverse of contains; swap names
-        left_df, right_df = right_df, left_df
-        result = result.rename(columns={'_key_left': '_key_right',
-                                        '_key_right': '_key_left'})
+        result = result.astype(float)
 
     if how == 'inner':
         result = result.set_index('_key_left')
@@ -169,4 +261,9 @@ def sjoin(left_df, right_df, how='inner', op='intersects',
         )
         joined = joined.drop(['_key_left', '_key_right'], axis=1)
 
+    extra = [col for col in result.columns
+             if col not in ('_key_left', '_key_right')]
+    if extra:
+        joined = joined[[col for col in joined.columns if col not in extra]
+                        + extra]
     return joined
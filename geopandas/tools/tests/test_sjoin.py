@@ -8,7 +8,7 @@ from shapely.geometry import Point, Polygon
 
 import geopandas
 from geopandas import GeoDataFrame, GeoSeries, read_file, base
-from geopandas import sjoin
+from geopandas import sjoin, sjoin_nearest
 
 import pytest
 from pandas.util.testing import assert_frame_equal
@@ -321,3 +321,78 @@ class TestSpatialJoinNaturalEarth:
         cities_with_country = sjoin(self.cities, countries, how="inner",
                                     op="intersects")
         assert cities_with_country.shape == (172, 4)
+
+
+@pytest.mark.parametrize('backend', [
+    'strtree',
+    pytest.param('rtree', marks=pytest.mark.skipif(
+        not base.HAS_SINDEX, reason='Rtree absent, skipping'))])
+class TestSpatialJoinNearest:
+
+    def setup_method(self):
+        self.points = GeoDataFrame(
+            {'a': [1, 2, 3, 4],
+             'geometry': [Point(0, 0), Point(5, 1), Point(10, 10), None]},
+            index=['p', 'q', 'r', 's'])
+        self.polys = GeoDataFrame(
+            {'b': [10, 20, 30],
+             'geometry': [Polygon([(1, 0), (2, 0), (2, 1), (1, 1)]),
+                          Polygon([(6, 0), (7, 0), (7, 1), (6, 1)]),
+                          Polygon([(4, 0), (4, 2), (3, 2), (3, 0)])]},
+            index=[7, 8, 9])
+
+    def test_inner(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        res = sjoin_nearest(self.points, self.polys, distance_col='dist')
+        res = res.sort_values(['a', 'index_right'])
+        # (5, 1) is at distance 1 of both 8 and 9
+        assert list(res.index) == ['p', 'q', 'q', 'r']
+        assert list(res['index_right']) == [7, 8, 9, 8]
+        assert list(res['b']) == [10, 20, 30, 20]
+        np.testing.assert_allclose(
+            res['dist'], [1, 1, 1, np.hypot(3, 9)])
+        assert res.geometry.name == 'geometry'
+        assert list(res.columns) == [
+            'a', 'geometry', 'index_right', 'b', 'dist']
+
+    def test_left(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        res = sjoin_nearest(self.points, self.polys, how='left',
+                            max_distance=2, distance_col='dist')
+        res = res.sort_values(['a', 'index_right'])
+        assert list(res.index) == ['p', 'q', 'q', 'r', 's']
+        assert list(res['b'].iloc[:3]) == [10, 20, 30]
+        assert res['b'].iloc[3:].isna().all()
+        assert res['dist'].iloc[3:].isna().all()
+
+        res = sjoin_nearest(self.points, self.polys, max_distance=2)
+        assert sorted(res.index) == ['p', 'q', 'q']
+        assert 'dist' not in res
+
+    def test_right(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        res = sjoin_nearest(self.points, self.polys, how='right',
+                            distance_col='dist')
+        assert list(res.index) == [7, 8, 9]
+        assert list(res['index_left']) == ['p', 'q', 'q']
+        assert list(res['a']) == [1, 2, 2]
+        np.testing.assert_allclose(res['dist'], [1, 1, 1])
+        assert res.geometry.geom_equals(self.polys.geometry).all()
+
+    def test_empty(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        empty = GeoDataFrame({'b': [1], 'geometry': [None]})
+        res = sjoin_nearest(self.points, empty, how='left')
+        assert len(res) == 4
+        assert res['b'].isna().all()
+        res = sjoin_nearest(self.points, empty)
+        assert len(res) == 0
+
+    def test_invalid_args(self, backend, monkeypatch):
+        monkeypatch.setattr(geopandas.options, 'sindex_backend', backend)
+        with pytest.raises(ValueError):
+            sjoin_nearest(self.points, self.polys, how='outer')
+        with pytest.raises(ValueError):
+            sjoin_nearest(self.points, self.polys, distance_col='a')
+        with pytest.raises(ValueError):
+            sjoin_nearest(self.points.geometry, self.polys)